@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Archive Pages - Pages d'archives paginées et mensuelles
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module rend les archives du blog à partir de la liste triée des articles :
+1. Pages paginées à URL stable (archive/page-N.html, numérotées depuis le plus ancien :
+   un nouvel article ne modifie que la dernière page)
+2. Une page par mois (archive/AAAA-MM.html) et une page d'accueil des archives
+3. Signature de chaque page (données + template) : seules les pages modifiées sont rendues et écrites
+4. Header/footer inclus au build, feuille de style versionnée dans assets/
+"""
+
+import json
+import hashlib
+import logging
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from image_cache import atomic_write_text
+from site_fragments import SiteFragments
+from static_assets import ASSETS_DIR, publish_stylesheet
+from templating import get_environment, template_hash
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = Path("archive")
+PAGE_SIZE = 20
+ARTICLE_FIELDS = ('filename', 'date', 'title', 'description')
+FRENCH_MONTHS = ('janvier', 'février', 'mars', 'avril', 'mai', 'juin', 'juillet',
+                 'août', 'septembre', 'octobre', 'novembre', 'décembre')
+
+
+def month_label(month: str) -> str:
+    """'2025-10' → 'Octobre 2025'."""
+    year, number = month.split('-')
+    return f"{FRENCH_MONTHS[int(number) - 1].capitalize()} {year}"
+
+
+class ArchiveBuilder:
+    """Rendu incrémental des pages d'archives."""
+
+    # Répertoire publié (URL canonique) et libellé du lien vers la page d'accueil de la section
+    SECTION = "archive"
+    INDEX_LABEL = "Toutes les archives"
+
+    def __init__(self, output_dir: Path = ARCHIVE_DIR, templates_dir: Path = Path("templates"),
+                 fragments: Optional[SiteFragments] = None, page_size: int = PAGE_SIZE,
+                 assets_dir: Path = ASSETS_DIR):
+        """
+        Initialise le builder d'archives.
+
+        Args:
+            output_dir: Répertoire publié des archives
+            templates_dir: Répertoire contenant archive.html et css/archive.css
+            fragments: Header/footer inclus dans les pages
+            page_size: Nombre d'articles par page paginée
+            assets_dir: Répertoire publié de la feuille de style
+        """
+        self.output_dir = Path(output_dir)
+        self.templates_dir = Path(templates_dir)
+        self.fragments = fragments or SiteFragments(self.templates_dir)
+        self.page_size = page_size
+        self.assets_dir = Path(assets_dir)
+
+    def _page_specs(self, articles: List[Dict]) -> Dict[str, Dict]:
+        """Contexte de chaque page d'archives, indexé par chemin relatif."""
+        items = [{field: article.get(field, '') for field in ARTICLE_FIELDS} for article in articles]
+        specs: Dict[str, Dict] = {}
+
+        # Pagination depuis le plus ancien : les pages complètes ne changent plus
+        chronological = items[::-1]
+        page_count = (len(chronological) + self.page_size - 1) // self.page_size
+        pages = []
+        for number in range(1, page_count + 1):
+            chunk = chronological[(number - 1) * self.page_size:number * self.page_size]
+            path = f"page-{number}.html"
+            pages.append({'path': path, 'label': f"{chunk[0]['date']} → {chunk[-1]['date']}"})
+            specs[path] = {
+                'title': f"Archives - page {number}",
+                'description': f"Articles publiés du {chunk[0]['date']} au {chunk[-1]['date']}.",
+                'articles': chunk[::-1],
+                'prev_page': f"page-{number - 1}.html" if number > 1 else None,
+                'next_page': f"page-{number + 1}.html" if number < page_count else None
+            }
+
+        # Une page par mois (articles déjà triés par date décroissante)
+        by_month = [(month, list(group)) for month, group in groupby(items, key=lambda item: item['date'][:7])]
+        months = []
+        for position, (month, month_items) in enumerate(by_month):
+            path = f"{month}.html"
+            months.append({'path': path, 'label': month_label(month), 'count': len(month_items)})
+            specs[path] = {
+                'title': f"Archives - {month_label(month)}",
+                'description': f"{len(month_items)} article(s) publié(s) en {month_label(month).lower()}.",
+                'articles': month_items,
+                'prev_page': f"{by_month[position + 1][0]}.html" if position + 1 < len(by_month) else None,
+                'next_page': f"{by_month[position - 1][0]}.html" if position > 0 else None
+            }
+
+        # Accueil des archives : seule page qui liste tous les mois et toutes les pages
+        specs['index.html'] = {
+            'title': "Archives",
+            'description': f"Tous les articles du blog Seminary ({len(items)} articles).",
+            'articles': [],
+            'months': months,
+            'pages': pages[::-1]
+        }
+        return specs
+
+    def build(self, articles: List[Dict], state: Dict) -> List[Path]:
+        """
+        Rend les pages d'archives dont le contenu a changé.
+
+        Args:
+            articles: Articles triés par date décroissante (filename, date, title, description)
+            state: Signatures des pages du build précédent (mis à jour en place)
+
+        Returns:
+            Pages écrites
+        """
+        stylesheet_href = '../assets/' + publish_stylesheet(self.templates_dir / "css" / "archive.css", self.assets_dir)
+        # Template et mise en page de base dont il hérite
+        template_signature = template_hash("archive.html", self.templates_dir) + stylesheet_href
+
+        signatures = state.setdefault('pages', {})
+        specs = self._page_specs(articles)
+        template = None
+        written = []
+
+        for path, context in specs.items():
+            context = dict(context, path=path, section=self.SECTION, index_label=self.INDEX_LABEL,
+                           stylesheet_href=stylesheet_href)
+            signature = hashlib.sha256(
+                (template_signature + json.dumps(context, sort_keys=True, ensure_ascii=False)).encode('utf-8')
+            ).hexdigest()[:16]
+            output = self.output_dir / path
+            if signatures.get(path) == signature and output.exists():
+                continue
+
+            if template is None:
+                template = get_environment(self.templates_dir).get_template("archive.html")
+            output.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(output, self.fragments.inline(template.render(context)))
+            signatures[path] = signature
+            written.append(output)
+
+        # Pages disparues (mois sans article, pagination réduite)
+        for path in set(signatures) - set(specs):
+            (self.output_dir / path).unlink(missing_ok=True)
+            del signatures[path]
+
+        logger.info(f"Pages {self.SECTION}/: {len(written)} page(s) écrite(s) sur {len(specs)}")
+        return written
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Article Catalog - Catalogue SQLite des articles générés
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module conserve chaque article sous forme d'enregistrement structuré :
+1. Titre, description, contenu HTML (compressé), nombre de mots, mots-clés
+2. Images et liens retenus, score SEO et métriques de génération
+3. Hash du contenu : détection des changements sans relire l'article
+4. Lecture des métadonnées par requête indexée (plus d'analyse du HTML publié)
+5. Thèmes (tags) attribués par topic_tags.py, conservés quand la source est réenregistrée
+"""
+
+import re
+import json
+import zlib
+import sqlite3
+import hashlib
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CATALOG_FILE = Path("data") / "articles.db"
+
+# Champs qui déterminent le rendu HTML d'un article (le hash n'inclut pas les métriques)
+RENDER_FIELDS = ('title', 'description', 'subtitle', 'publish_date', 'reading_time', 'content')
+JSON_FIELDS = ('keywords', 'image_refs', 'links', 'metrics', 'tags')
+METADATA_COLUMNS = ('filename', 'date', 'title', 'description', 'subtitle', 'publish_date', 'reading_time',
+                    'word_count', 'seo_score', 'tags', 'content_hash', 'updated_at')
+
+DATE_PREFIX_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2})-')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    filename TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    subtitle TEXT NOT NULL DEFAULT '',
+    publish_date TEXT NOT NULL DEFAULT '',
+    reading_time INTEGER NOT NULL DEFAULT 1,
+    content BLOB NOT NULL,
+    word_count INTEGER NOT NULL DEFAULT 0,
+    keywords TEXT NOT NULL DEFAULT '[]',
+    image_refs TEXT NOT NULL DEFAULT '[]',
+    links TEXT NOT NULL DEFAULT '[]',
+    seo_score REAL,
+    metrics TEXT NOT NULL DEFAULT '{}',
+    tags TEXT NOT NULL DEFAULT '[]',
+    content_hash TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_date ON articles (date DESC, filename DESC);
+"""
+
+
+def content_hash(record: Dict) -> str:
+    """Hash des champs de rendu d'un article."""
+    payload = json.dumps([record.get(field, '') for field in RENDER_FIELDS], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def render_hash(digest: str, tags: str) -> str:
+    """Hash du rendu d'un article : contenu et thèmes (identique au hash du contenu sans thème)."""
+    if tags in ('', '[]'):
+        return digest
+    return f"{digest}-{hashlib.sha256(tags.encode('utf-8')).hexdigest()[:8]}"
+
+
+def article_date(filename: str) -> str:
+    """Date YYYY-MM-DD du nom de fichier ('' si absente)."""
+    match = DATE_PREFIX_PATTERN.match(filename)
+    return match.group(1) if match else ''
+
+
+class ArticleCatalog:
+    """Catalogue SQLite des articles : sources structurées et métadonnées indexées."""
+
+    def __init__(self, db_path: Path = CATALOG_FILE):
+        """
+        Prépare le catalogue (le fichier SQLite n'est ouvert, ou créé, qu'au premier accès).
+
+        Args:
+            db_path: Fichier SQLite du catalogue
+        """
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Connexion SQLite, ouverte au premier accès (schéma créé si besoin)."""
+        if self._conn is None:
+            self._conn = self._open()
+        return self._conn
+
+    def _open(self) -> sqlite3.Connection:
+        """Ouvre (ou crée) le fichier SQLite et son schéma."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        conn.executescript(SCHEMA)
+        return conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+    def upsert(self, record: Dict) -> str:
+        """
+        Enregistre ou remplace un article.
+
+        Args:
+            record: Article (filename, title et content requis ; autres champs optionnels).
+                Sans champ 'tags', les thèmes déjà attribués sont conservés.
+
+        Returns:
+            Hash de rendu de l'article enregistré (voir render_hash)
+        """
+        digest = content_hash(record)
+        row = {
+            'filename': record['filename'],
+            'date': record.get('date') or article_date(record['filename']),
+            'title': record['title'],
+            'description': record.get('description', ''),
+            'subtitle': record.get('subtitle', ''),
+            'publish_date': record.get('publish_date', ''),
+            'reading_time': int(record.get('reading_time', 1)),
+            'content': zlib.compress(record['content'].encode('utf-8'), 9),
+            'word_count': int(record.get('word_count') or len(re.sub(r'<[^>]+>', ' ', record['content']).split())),
+            'seo_score': record.get('seo_score'),
+            'content_hash': digest,
+            'updated_at': datetime.now().isoformat(timespec='seconds')
+        }
+        row.update({field: json.dumps(record.get(field) or ({} if field == 'metrics' else []), ensure_ascii=False)
+                    for field in JSON_FIELDS if field != 'tags' or 'tags' in record})
+
+        columns = ', '.join(row)
+        placeholders = ', '.join(f':{column}' for column in row)
+        updates = ', '.join(f'{column} = excluded.{column}' for column in row if column != 'filename')
+        with self.conn:
+            self.conn.execute(
+                f"INSERT INTO articles ({columns}) VALUES ({placeholders}) ON CONFLICT(filename) DO UPDATE SET {updates}",
+                row
+            )
+        stored = self.conn.execute("SELECT tags FROM articles WHERE filename = ?", (record['filename'],)).fetchone()
+        return render_hash(digest, stored['tags'])
+
+    def set_tags(self, filename: str, tags: List[Dict]) -> None:
+        """Enregistre les thèmes d'un article ([{'slug': ..., 'label': ...}])."""
+        with self.conn:
+            self.conn.execute("UPDATE articles SET tags = ? WHERE filename = ?",
+                              (json.dumps(tags, ensure_ascii=False), filename))
+
+    def delete(self, filename: str) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM articles WHERE filename = ?", (filename,))
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    def _to_dict(self, row: sqlite3.Row) -> Dict:
+        record = dict(row)
+        if 'content' in record:
+            record['content'] = zlib.decompress(record['content']).decode('utf-8')
+        for field in JSON_FIELDS:
+            if field in record:
+                record[field] = json.loads(record[field])
+        return record
+
+    def get(self, filename: str) -> Optional[Dict]:
+        """Article complet (contenu inclus), ou None s'il n'est pas catalogué."""
+        row = self.conn.execute("SELECT * FROM articles WHERE filename = ?", (filename,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def metadata(self, filename: str) -> Optional[Dict]:
+        """Métadonnées d'un article, sans son contenu."""
+        row = self.conn.execute(
+            f"SELECT {', '.join(METADATA_COLUMNS)} FROM articles WHERE filename = ?", (filename,)
+        ).fetchone()
+        return self._to_dict(row) if row else None
+
+    def latest(self, limit: Optional[int] = 10) -> List[Dict]:
+        """Métadonnées des articles les plus récents (index sur la date)."""
+        rows = self.conn.execute(
+            f"SELECT {', '.join(METADATA_COLUMNS)} FROM articles ORDER BY date DESC, filename DESC LIMIT ?",
+            (-1 if limit is None else limit,)
+        ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def hashes(self) -> Dict[str, str]:
+        """Hash de contenu de chaque article catalogué."""
+        return dict(self.conn.execute("SELECT filename, content_hash FROM articles").fetchall())
+
+    def render_hashes(self) -> Dict[str, str]:
+        """Hash de rendu (contenu et thèmes) de chaque article catalogué."""
+        rows = self.conn.execute("SELECT filename, content_hash, tags FROM articles").fetchall()
+        return {row['filename']: render_hash(row['content_hash'], row['tags']) for row in rows}
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def __contains__(self, filename: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM articles WHERE filename = ?", (filename,)).fetchone() is not None
+
+
+def main():
+    """Point d'entrée CLI : aperçu du catalogue."""
+    catalog = ArticleCatalog()
+    print(f"Articles catalogués: {len(catalog)}")
+    for article in catalog.latest(10):
+        score = f" - SEO {article['seo_score']}" if article['seo_score'] is not None else ''
+        print(f"  {article['date']}  {article['title'][:70]} ({article['word_count']} mots{score})")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ Pass 4: Finalisation & Intégration Seminary
 
 import os
 import json
+import hashlib
 import logging
 import requests
 import time
@@ -20,7 +21,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import re
-from jinja2 import Template
+from jinja2 import Template, TemplateNotFound
 import argparse
 from bs4 import BeautifulSoup  # Validation DOM robuste
 
@@ -28,8 +29,14 @@ from bs4 import BeautifulSoup  # Validation DOM robuste
 from context_manager import ContextManager
 from seo_validator import SEOValidator
 from image_handler import ImageHandler
+from llm_output import clean_generated_content, ensure_valid_title, extract_article_html, extract_metadata
 from seminary_integrator import SeminaryIntegrator
 from fallback_generator import create_fallback_article
+from rate_limiter import RateLimiter
+from site_fragments import SiteFragments
+from site_builder import SiteBuilder
+from static_assets import minify_html
+from templating import get_environment
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -59,6 +66,9 @@ class ArticleGenerator:
         self.seo_validator = SEOValidator()
         self.image_handler = ImageHandler(unsplash_access_key, unsplash_secret_key)
         self.seminary_integrator = SeminaryIntegrator()
+        self.rate_limiter = RateLimiter(Path("data") / "rate_limits.json")
+        self.site_fragments = SiteFragments(Path("templates"), Path("data") / "site_fragments.json")
+        self.site_builder = SiteBuilder(fragments=self.site_fragments)
         
         # Configuration de génération - OpenRouter
         self.generation_config = {
@@ -72,7 +82,8 @@ class ArticleGenerator:
             'seo_score_threshold': 70,  # Seuil plus permissif
             'max_improvement_attempts': 2,  # Moins d'améliorations
             'api_timeout': 180,  # 3 minutes pour DeepSeek-R1
-            'max_tokens_per_call': 1500  # Limite pour éviter les timeouts
+            'max_tokens_per_call': 1500,  # Limite pour éviter les timeouts
+            'rate_limit_wait': 180  # Attente max d'un jeton OpenRouter partagé
         }
         
         # Templates de prompts
@@ -134,80 +145,22 @@ class ArticleGenerator:
         
         # Charger le template d'article
         self.article_template = self._load_article_template()
+        # Rendus et audits par hash : une version du contenu n'est rendue et auditée qu'une fois
+        self._render_cache: Dict[str, str] = {}
+        self._audit_cache: Dict[str, Dict] = {}
     
-    def _extract_final_content_from_deepseek(self, raw_content: str) -> str:
+    def _load_article_template(self) -> Template:
         """
-        Extrait le contenu final du modèle DeepSeek-R1 qui expose son reasoning.
-        Version simplifiée et plus permissive.
+        Charge le template Jinja2 des articles depuis l'environnement partagé.
+
+        Le template (et la mise en page de base dont il hérite) est compilé une seule fois
+        par processus, puis relu depuis le cache de bytecode de data/ aux runs suivants.
         """
-        import re
-        
-        # Cas 1: Contenu avec balises <think>
-        if '<think>' in raw_content:
-            # Chercher ce qui vient après </think>
-            think_pattern = r'<think>.*?</think>\s*(.*)'
-            match = re.search(think_pattern, raw_content, re.DOTALL)
-            if match:
-                final_content = match.group(1).strip()
-                if final_content and len(final_content) > 100:
-                    logger.info(f"Extraction <think>: {len(final_content)} caractères")
-                    return final_content
-        
-        # Cas 2: Chercher le premier titre <h1> et prendre tout ce qui suit
-        h1_pattern = r'(<h1>.*)'
-        match = re.search(h1_pattern, raw_content, re.DOTALL | re.IGNORECASE)
-        if match:
-            html_content = match.group(1).strip()
-            if len(html_content) > 200:
-                logger.info(f"Extraction <h1>: {len(html_content)} caractères")
-                return html_content
-        
-        # Cas 3: Chercher le premier paragraphe HTML et prendre tout ce qui suit
-        p_pattern = r'(<[ph][1-6]?>.*)'
-        match = re.search(p_pattern, raw_content, re.DOTALL | re.IGNORECASE)
-        if match:
-            html_content = match.group(1).strip()
-            if len(html_content) > 150:
-                logger.info(f"Extraction HTML: {len(html_content)} caractères")
-                return html_content
-        
-        # Cas 4: Filtrer seulement les lignes de reasoning évidentes
-        lines = raw_content.split('\n')
-        filtered_lines = []
-        
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-                
-            # Filtrer SEULEMENT les lignes de reasoning très évidentes
-            if any(phrase in line_stripped.lower() for phrase in [
-                'je vais créer', 'je dois', 'il me faut', 'mon objectif',
-                'je commence par', 'je vais maintenant', 'laissez-moi'
-            ]):
-                continue
-                
-            filtered_lines.append(line)
-        
-        filtered_content = '\n'.join(filtered_lines).strip()
-        if len(filtered_content) > 200:
-            logger.info(f"Extraction filtrée: {len(filtered_content)} caractères")
-            return filtered_content
-        
-        # Cas 5: Fallback - prendre TOUT le contenu brut
-        logger.warning(f"Aucune extraction spécifique, utilisation contenu brut: {len(raw_content)} caractères")
-        return raw_content
-    
-    def _load_article_template(self) -> Template:
-        """Charge le template Jinja2 pour les articles."""
-        template_path = Path('templates/article_template.html')
-        
+        env = get_environment()
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
-            return Template(template_content)
-        except FileNotFoundError:
-            logger.error(f"Template non trouvé: {template_path}")
+            return env.get_template('article_template.html')
+        except TemplateNotFound as e:
+            logger.error(f"Template non trouvé: {e.name}")
             # Template minimal de fallback
             fallback_template = '''
             <!DOCTYPE html>
@@ -215,15 +168,55 @@ class ArticleGenerator:
             <head>
                 <meta charset="UTF-8">
                 <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>{{ title }}</title>
+                <title>{{ article_title }}</title>
                 <meta name="description" content="{{ meta_description }}">
             </head>
             <body>
-                {{ content | safe }}
+                {{ article_content | safe }}
             </body>
             </html>
             '''
-            return Template(fallback_template)
+            return env.from_string(fallback_template)
+
+    def render_article(self, article_data: Dict, content: Optional[str] = None) -> str:
+        """
+        Rend la page complète d'un article : seul chemin de rendu des Pass 2, 3 et 4.
+
+        Le résultat est mis en cache par hash des variables du template : l'audit du Pass 2 ou 3
+        et le Pass 4 partagent le même rendu pour une même version du contenu.
+
+        Args:
+            article_data: Données de l'article (content, metadata, word_count)
+            content: Contenu à encapsuler à la place de article_data['content']
+
+        Returns:
+            HTML complet de l'article
+        """
+        metadata = article_data.get('metadata', {})
+        fragments = self.site_fragments.render()
+        template_vars = {
+            'article_title': metadata.get('title', 'Article Seminary'),
+            'meta_description': metadata.get('description', ''),
+            'article_content': article_data['content'] if content is None else content,
+            'publish_date': datetime.now().strftime('%d/%m/%Y'),
+            'reading_time': max(1, article_data.get('word_count', 400) // 200),  # Estimation 200 mots/min
+            'filename': self.generate_filename(metadata),
+            'styles_html': fragments['styles'],  # CSS critique + feuille partagée versionnée
+            'header_html': fragments['header'],  # Fragments inclus au build (plus de fetch)
+            'footer_html': fragments['footer'],
+            'article_subtitle': ''
+        }
+        key = hashlib.sha256(json.dumps(template_vars, sort_keys=True).encode('utf-8')).hexdigest()
+        if key not in self._render_cache:
+            self._render_cache[key] = self.article_template.render(**template_vars)
+        return self._render_cache[key]
+
+    def audit_html(self, html: str) -> Dict:
+        """Audit SEO d'une page, mis en cache par hash du HTML."""
+        key = hashlib.sha256(html.encode('utf-8')).hexdigest()
+        if key not in self._audit_cache:
+            self._audit_cache[key] = self.seo_validator.perform_full_audit(html)
+        return self._audit_cache[key]
     
     def call_openrouter_api(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7) -> Optional[str]:
         """
@@ -268,6 +261,11 @@ class ArticleGenerator:
                 logger.info(f"Modèle: {self.generation_config['openrouter_model']}")
                 logger.info(f"Clé API: {self.openrouter_api_key[:10]}...")
                 
+                # Quota partagé entre processus : attendre un jeton plutôt que déclencher un 429
+                if not self.rate_limiter.acquire('openrouter', timeout=self.generation_config['rate_limit_wait']):
+                    logger.error("❌ Quota OpenRouter épuisé, abandon de l'appel")
+                    break
+                
                 response = requests.post(
                     self.generation_config['openrouter_api_url'],
                     headers=headers,
@@ -276,6 +274,7 @@ class ArticleGenerator:
                 )
                 
                 logger.info(f"Status Code API: {response.status_code}")
+                self.rate_limiter.sync_from_headers('openrouter', getattr(response, 'headers', None))
                 
                 # VALIDATION CRITIQUE: Vérifier le status code
                 if response.status_code == 401:
@@ -284,8 +283,9 @@ class ArticleGenerator:
                     raise ValueError("Authentification API échouée")
                 elif response.status_code == 429:
                     logger.error("❌ ERREUR 429: Limite de taux API atteinte")
-                    logger.info("   Attente plus longue avant retry...")
-                    time.sleep(60)  # Attendre 1 minute pour les limites de taux
+                    logger.info("   Blocage du quota partagé avant retry...")
+                    retry_after = response.headers.get('Retry-After')
+                    self.rate_limiter.block('openrouter', float(retry_after) if retry_after and retry_after.isdigit() else 60)
                     continue
                 
                 response.raise_for_status()
@@ -308,7 +308,7 @@ class ArticleGenerator:
                     continue
                 
                 # Extraire le contenu final du modèle DeepSeek-R1
-                generated_text = self._extract_final_content_from_deepseek(raw_text)
+                generated_text = extract_article_html(raw_text)
                 
                 # VALIDATION FINALE: Vérifier que l'extraction a réussi
                 if not generated_text or len(generated_text) < 100:
@@ -368,13 +368,13 @@ class ArticleGenerator:
             return None
         
         # Nettoyer et structurer le contenu
-        cleaned_content = self._clean_generated_content(generated_content)
+        cleaned_content = clean_generated_content(generated_content)
 
         # S'assurer que le titre est valide
-        cleaned_content = self._ensure_valid_title(cleaned_content)
+        cleaned_content = ensure_valid_title(cleaned_content)
         
         # Extraire les métadonnées
-        metadata = self._extract_metadata_from_content(cleaned_content)
+        metadata = extract_metadata(cleaned_content)
         
         return {
             'content': cleaned_content,
@@ -395,15 +395,8 @@ class ArticleGenerator:
         """
         logger.info("=== PASS 2: AUDIT SEO ===")
         
-        # Créer un HTML temporaire pour l'audit
-        temp_html = self.article_template.render(
-            title=article_data['metadata'].get('title', 'Article'),
-            meta_description=article_data['metadata'].get('description', ''),
-            content=article_data['content']
-        )
-        
-        # Effectuer l'audit SEO
-        audit_result = self.seo_validator.perform_full_audit(temp_html)
+        # Audit de la page telle que le Pass 4 la rendra (même rendu, réutilisé depuis le cache)
+        audit_result = self.audit_html(self.render_article(article_data))
         
         logger.info(f"Score SEO: {audit_result['global_score']}/100")
         logger.info(f"Statut: {audit_result['status']}")
@@ -459,28 +452,23 @@ class ArticleGenerator:
             
             if improved_content:
                 # Nettoyer le contenu amélioré
-                cleaned_improved = self._clean_generated_content(improved_content)
-                
-                # Vérifier l'amélioration
-                improved_metadata = self._extract_metadata_from_content(cleaned_improved)
-                
-                # Test rapide du nouveau score
-                temp_html = self.article_template.render(
-                    title=improved_metadata.get('title', article_data['metadata']['title']),
-                    meta_description=improved_metadata.get('description', ''),
-                    content=cleaned_improved
-                )
+                cleaned_improved = clean_generated_content(improved_content)
+                
+                # Vérifier l'amélioration (titre et description d'origine si le contenu amélioré n'en fournit pas)
+                improved_metadata = dict(article_data['metadata'], **extract_metadata(cleaned_improved))
+                candidate = {
+                    'content': cleaned_improved,
+                    'metadata': improved_metadata,
+                    'word_count': len(cleaned_improved.split())
+                }
                 
-                quick_audit = self.seo_validator.perform_full_audit(temp_html)
+                # Audit de la page que le Pass 4 publiera si la version est retenue
+                quick_audit = self.audit_html(self.render_article(candidate))
                 
                 if quick_audit['global_score'] > seo_audit['global_score']:
                     logger.info(f"Amélioration réussie: {seo_audit['global_score']} → {quick_audit['global_score']}")
-                    return {
-                        'content': cleaned_improved,
-                        'metadata': improved_metadata,
-                        'word_count': len(cleaned_improved.split()),
-                        'improvement_score': quick_audit['global_score'] - seo_audit['global_score']
-                    }
+                    candidate['improvement_score'] = quick_audit['global_score'] - seo_audit['global_score']
+                    return candidate
                 else:
                     logger.warning(f"Pas d'amélioration significative (tentative {attempt + 1})")
         
@@ -499,119 +487,61 @@ class ArticleGenerator:
         """
         logger.info("=== PASS 4: INTÉGRATION SEMINARY ===")
         
-        # Générer le HTML complet avec toutes les variables du template
-        template_vars = {
-            'article_title': article_data['metadata'].get('title', 'Article Seminary'),
-            'meta_description': article_data['metadata'].get('description', ''),
-            'article_content': article_data['content'],
-            'publish_date': datetime.now().strftime('%d/%m/%Y'),
-            'reading_time': max(1, article_data.get('word_count', 400) // 200),  # Estimation 200 mots/min
-            'filename': self.generate_filename(article_data['metadata']),
-            'header_html': '',  # Templates séparés dans le futur
-            'footer_html': '',
-            'article_subtitle': ''
-        }
+        # HTML complet : rendu déjà produit (et audité) par le Pass 2 ou 3 pour cette version du contenu
+        rendered_html = self.render_article(article_data)
         
-        final_html = self.article_template.render(**template_vars)
+        # Document analysé une seule fois : chaque étape le modifie en place, sérialisation unique à la fin
+        soup = BeautifulSoup(rendered_html, 'html.parser')
+        no_visuals = {'summary': '0 éléments visuels ajoutés', 'elements_added': [], 'image_refs': [], 'selected_images': []}
         
         # Intégrer les liens Seminary avec protection anti-corruption
         try:
-            seminary_result = self.seminary_integrator.process_article(
-                final_html, 
+            seminary_result = self.seminary_integrator.process_document(
+                soup,
                 article_data['metadata'].get('title', '')
             )
-            
-            # Vérifier que l'intégration Seminary n'a pas corrompu le HTML
-            modified_html = seminary_result['modified_html']
-            if '<html>' in modified_html and len(modified_html) > len(final_html) * 0.8:
-                final_html = modified_html
-                logger.info(f"Liens Seminary ajoutés: {seminary_result['links_added']}")
-            else:
-                logger.warning("Intégration Seminary a corrompu le HTML, conservation de l'original")
-                seminary_result = {
-                    'modified_html': final_html,
-                    'links_added': 0,
-                    'integration_plan': {'confidence_score': 0},
-                    'analysis': {}
-                }
-                
+            logger.info(f"Liens Seminary ajoutés: {seminary_result['links_added']}")
         except Exception as e:
             logger.error(f"Erreur lors de l'intégration Seminary: {e}")
-            seminary_result = {
-                'modified_html': final_html,
-                'links_added': 0,
-                'integration_plan': {'confidence_score': 0},
-                'analysis': {}
-            }
+            seminary_result = {'links_added': 0, 'integration_plan': {'confidence_score': 0}, 'analysis': {}}
+        
+        if not self._is_valid_document(soup):
+            # Document abîmé par l'intégration : retour au rendu du template (seul cas de nouveau parsing)
+            logger.warning("Intégration Seminary a corrompu le HTML, conservation de l'original")
+            soup = BeautifulSoup(rendered_html, 'html.parser')
+            seminary_result = {'links_added': 0, 'integration_plan': {'confidence_score': 0}, 'analysis': {}}
         
         # Intégrer images et illustrations CSS/SVG
         try:
-            visual_integration = self._integrate_visual_elements(final_html, article_data)
-            
-            # Vérifier que l'intégration visuelle n'a pas corrompu le HTML
-            integrated_html = visual_integration['html']
-            if '<html>' in integrated_html and len(integrated_html) > len(final_html) * 0.8:
-                final_html = integrated_html
-                logger.info(f"Éléments visuels intégrés: {visual_integration['summary']}")
-            else:
-                logger.warning("Intégration visuelle a corrompu le HTML, conservation de l'original")
-                visual_integration = {'summary': '0 éléments visuels ajoutés', 'elements_added': []}
-                
+            visual_integration = self._integrate_visual_elements(soup, article_data)
+            logger.info(f"Éléments visuels intégrés: {visual_integration['summary']}")
         except Exception as e:
             logger.error(f"Erreur lors de l'intégration visuelle: {e}")
-            visual_integration = {'summary': '0 éléments visuels ajoutés', 'elements_added': []}
+            visual_integration = no_visuals
+        
+        if not self._is_valid_document(soup):
+            logger.warning("Intégration visuelle a corrompu le HTML, conservation du rendu du template")
+            soup = BeautifulSoup(rendered_html, 'html.parser')
+            seminary_result = {'links_added': 0, 'integration_plan': {'confidence_score': 0}, 'analysis': {}}
+            visual_integration = no_visuals
+        
+        final_html = str(soup)
         
         return {
             'final_html': final_html,
             'article_data': article_data,
             'seminary_integration': seminary_result,
+            'image_refs': visual_integration['image_refs'],
+            'selected_images': visual_integration['selected_images'],
+            'html_valid': self._is_valid_document(soup),
             'generation_complete': True
         }
     
-    def _clean_generated_content(self, content: str) -> str:
-        """Nettoie le contenu généré par l'IA."""
-        # Supprimer les préfixes indésirables
-        content = re.sub(r'^(Article|Voici|Voilà):\s*', '', content, flags=re.IGNORECASE)
-        
-        # Nettoyer les balises HTML malformées
-        content = re.sub(r'<([^>]+)>', lambda m: f'<{m.group(1).strip()}>', content)
-        
-        # Supprimer les doublons de balises
-        content = re.sub(r'(<h[1-6][^>]*>)\s*\1', r'\1', content)
-        
-        # Assurer les balises fermantes
-        if '<h1>' in content and '</h1>' not in content:
-            content = content.replace('<h1>', '<h1>').replace('\n', '</h1>\n', 1)
-        
-        return content.strip()
-    
-    def _extract_metadata_from_content(self, content: str) -> Dict:
-        """Extrait les métadonnées du contenu généré."""
-        metadata = {}
-        
-        # Extraire le titre (H1)
-        h1_match = re.search(r'<h1[^>]*>(.*?)</h1>', content, re.IGNORECASE | re.DOTALL)
-        if h1_match:
-            metadata['title'] = re.sub(r'<[^>]+>', '', h1_match.group(1)).strip()
-        
-        # Générer une meta description basée sur le premier paragraphe
-        p_match = re.search(r'<p[^>]*>(.*?)</p>', content, re.IGNORECASE | re.DOTALL)
-        if p_match:
-            first_p = re.sub(r'<[^>]+>', '', p_match.group(1)).strip()
-            # Limiter à 160 caractères
-            if len(first_p) > 160:
-                metadata['description'] = first_p[:157] + '...'
-            else:
-                metadata['description'] = first_p
-        
-        return metadata
-    
-    def _integrate_visual_elements(self, html: str, article_data: Dict) -> Dict:
-        """Intègre images Unsplash et illustrations CSS/SVG dans l'article."""
-        # from bs4 import BeautifulSoup # This import is now at the top
-        
-        soup = BeautifulSoup(html, 'html.parser')
+    def _integrate_visual_elements(self, soup: BeautifulSoup, article_data: Dict) -> Dict:
+        """Intègre images Unsplash et illustrations CSS/SVG dans le document de l'article (modifié en place)."""
         visual_elements_added = []
+        image_refs = []  # Hash des blobs du magasin d'images utilisés
+        selected_images = []  # Images retenues, pour l'index de diversité inter-articles
         
         # 1. Ajouter une image Unsplash si disponible
         if self.unsplash_access_key:
@@ -625,27 +555,33 @@ class ArticleGenerator:
                     article_data['metadata'].get('title', '')
                 )
                 
-                if image_suggestions:
-                    best_image = image_suggestions[0]
-                    image_path = self.image_handler.download_image(best_image)
-                    
+                # Première suggestion téléchargeable, dans l'ordre pénalisé par l'usage récent
+                # (les doublons visuels sont rejetés par le magasin)
+                best_image, image_path = None, None
+                for suggestion in image_suggestions[:3]:
+                    image_path = self.image_handler.download_image(suggestion)
                     if image_path:
-                        # Créer la balise image
-                        img_tag = soup.new_tag(
-                            'img',
-                            src=f"./images/{Path(image_path).name}",
-                            alt=best_image.get('suggested_alt_text', 'Séminaire d\'entreprise Seminary'),
-                            title=best_image.get('suggested_title', 'Seminary'),
-                            style="width: 100%; max-width: 800px; height: auto; margin: 20px 0; border-radius: 12px; box-shadow: 0 4px 12px rgba(0,0,0,0.1);"
-                        )
-                        
-                        # Insérer après le premier paragraphe
-                        content_div = soup.find('div', class_='article-content')
-                        if content_div:
-                            first_p = content_div.find('p')
-                            if first_p:
-                                first_p.insert_after(img_tag)
-                                visual_elements_added.append(f"Image Unsplash: {best_image.get('description', 'N/A')[:50]}...")
+                        best_image = suggestion
+                        break
+                
+                if image_path:
+                    # Variantes responsives (AVIF/WebP/JPEG, plusieurs largeurs) dans un <picture>
+                    picture_html = self.image_handler.build_responsive_picture(
+                        image_path,
+                        alt=best_image.get('suggested_alt_text', 'Séminaire d\'entreprise Seminary'),
+                        title=best_image.get('suggested_title', 'Seminary')
+                    )
+                    picture_tag = BeautifulSoup(picture_html, 'html.parser').picture
+                    
+                    # Insérer après le premier paragraphe
+                    content_div = soup.find('div', class_='article-content')
+                    if content_div:
+                        first_p = content_div.find('p')
+                        if first_p:
+                            first_p.insert_after(picture_tag)
+                            image_refs.append(Path(image_path).stem)
+                            selected_images.append(best_image)
+                            visual_elements_added.append(f"Image Unsplash: {best_image.get('description', 'N/A')[:50]}...")
                 
             except Exception as e:
                 logger.error(f"Erreur lors de l'ajout d'image Unsplash: {e}")
@@ -702,24 +638,13 @@ class ArticleGenerator:
         except Exception as e:
             logger.error(f"Erreur lors de l'ajout d'illustrations CSS: {e}")
         
-        # 3. Optimiser la structure visuelle
-        try:
-            # Ajouter des classes CSS pour le responsive
-            for img in soup.find_all('img'):
-                current_style = img.get('style', '')
-                if 'responsive' not in current_style:
-                    img['style'] = current_style + ' max-width: 100%; height: auto;'
-            
-            # Ajouter des espacements appropriés
-            for illustration in soup.find_all('div', class_='visual-illustration'):
-                illustration['style'] = 'margin: 2rem 0;'
-                
-        except Exception as e:
-            logger.error(f"Erreur lors de l'optimisation visuelle: {e}")
+        # Styles des illustrations et images responsives (max-width: 100%) : dans la feuille
+        # partagée des articles (fragment de styles), plus aucun style inline ajouté ici
         
         return {
-            'html': str(soup),
             'elements_added': visual_elements_added,
+            'image_refs': image_refs,
+            'selected_images': selected_images,
             'summary': f"{len(visual_elements_added)} éléments visuels ajoutés"
         }
 
@@ -737,51 +662,25 @@ class ArticleGenerator:
             return False
 
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            essentials = {
-                'html': bool(soup.html),
-                'head': bool(soup.head),
-                'body': bool(soup.body),
-                'h1': bool(soup.find('h1'))
-            }
-            missing = [k for k, ok in essentials.items() if not ok]
-            if missing:
-                logger.warning(f"Balises manquantes DOM: {missing}")
-            return all(essentials.values())
+            return ArticleGenerator._is_valid_document(BeautifulSoup(html, 'html.parser'))
         except Exception as e:
             logger.error(f"Erreur validation HTML DOM: {e}")
             return False
 
-    # ---------------------------------------------------
-    # Vérification / correction du <h1>
-    # ---------------------------------------------------
-    def _ensure_valid_title(self, html_content: str) -> str:
-        """Garantit un <h1> entre 35 et 60 caractères. Corrige ou insère si nécessaire."""
-        import re
-        h1_match = re.search(r'<h1[^>]*>(.*?)</h1>', html_content, re.IGNORECASE | re.DOTALL)
-        title_text = re.sub(r'<[^>]+>', '', h1_match.group(1)).strip() if h1_match else ''
-
-        if h1_match and 35 <= len(title_text) <= 80:
-            return html_content
-
-        # Extraire premier paragraphe propre pour générer un titre
-        p_match = re.search(r'<p[^>]*>(.*?)</p>', html_content, re.IGNORECASE | re.DOTALL)
-        paragraph = re.sub(r'<[^>]+>', '', p_match.group(1)).strip() if p_match else ''
-        words = paragraph.split()[:12]
-        fallback_title = ' '.join(words)
-        if len(fallback_title) < 35:
-            fallback_title += ' - Séminaire dans les Vosges'
-        if len(fallback_title) > 60:
-            fallback_title = fallback_title[:60].rsplit(' ', 1)[0] + '...'
-
-        # Remplacement ou insertion
-        if h1_match:
-            html_content = re.sub(r'<h1[^>]*>.*?</h1>', f'<h1>{fallback_title}</h1>', html_content, flags=re.IGNORECASE | re.DOTALL)
-        else:
-            html_content = f'<h1>{fallback_title}</h1>\n' + html_content
+    @staticmethod
+    def _is_valid_document(soup: BeautifulSoup) -> bool:
+        """Même validation sur un document déjà analysé (Pass 4), sans nouveau parsing."""
+        essentials = {
+            'html': bool(soup.html),
+            'head': bool(soup.head),
+            'body': bool(soup.body),
+            'h1': bool(soup.find('h1'))
+        }
+        missing = [k for k, ok in essentials.items() if not ok]
+        if missing:
+            logger.warning(f"Balises manquantes DOM: {missing}")
+        return all(essentials.values())
 
-        return html_content
-    
     def _inject_featured_image(self, html: str, image_path: str, image_info: Dict) -> str:
         """Injecte une image mise en avant dans l'article (méthode legacy)."""
         # from bs4 import BeautifulSoup # This import is now at the top
@@ -794,7 +693,7 @@ class ArticleGenerator:
             src=f"./images/{Path(image_path).name}",
             alt=image_info.get('suggested_alt_text', 'Séminaire d\'entreprise'),
             title=image_info.get('suggested_title', 'Seminary'),
-            style="width: 100%; max-width: 800px; height: auto; margin: 20px 0;"
+            attrs={'class': 'article-image'}
         )
         
         # Trouver le premier paragraphe et insérer l'image après
@@ -820,7 +719,10 @@ class ArticleGenerator:
         return f"{date_str}-{clean_title}.html"
     
     def save_article(self, final_result: Dict, filename: Optional[str] = None) -> str:
-        """Sauvegarde l'article généré."""
+        """
+        Sauvegarde l'article généré, minifié (HTML écrit dans final_result['published_html'],
+        tailles avant/après dans final_result['size_report']).
+        """
         if not filename:
             filename = self.generate_filename(final_result['article_data']['metadata'])
         
@@ -830,11 +732,21 @@ class ArticleGenerator:
         
         file_path = articles_dir / filename
         
+        # Minification avant écriture : indentation du template, commentaires, balisage des illustrations
+        html = final_result['published_html'] = minify_html(final_result['final_html'])
+        original_bytes = len(final_result['final_html'].encode('utf-8'))
+        minified_bytes = len(html.encode('utf-8'))
+        final_result['size_report'] = {
+            'html_bytes': original_bytes,
+            'minified_bytes': minified_bytes,
+            'minified_saving': round(1 - minified_bytes / original_bytes, 3) if original_bytes else 0.0
+        }
+        
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(final_result['final_html'])
+                f.write(html)
             
-            logger.info(f"Article sauvegardé: {file_path}")
+            logger.info(f"Article sauvegardé: {file_path} ({original_bytes} → {minified_bytes} octets minifié)")
             return str(file_path)
             
         except Exception as e:
@@ -850,6 +762,9 @@ class ArticleGenerator:
         """
         start_time = time.time()
         logger.info("🚀 DÉBUT DE GÉNÉRATION D'ARTICLE - PIPELINE 4-PASS")
+        # Les versions de contenu d'un article précédent (mode batch) ne reviendront pas
+        self._render_cache.clear()
+        self._audit_cache.clear()
         
         try:
             # VALIDATION PRÉALABLE: Vérifier la clé API
@@ -947,35 +862,49 @@ class ArticleGenerator:
                 logger.error("   Aucun article ne sera créé pour éviter les fichiers vides")
                 return None
             
-            # Validation DOM robuste
-            if not self._is_valid_html(final_html):
+            # Validation DOM robuste (faite par le Pass 4 sur son document, sans nouveau parsing)
+            if not final_result.get('html_valid'):
                 logger.warning("Structure HTML incomplète, tentative d'auto-wrap avec le template...")
 
                 # Ré-encapsuler le contenu actuel dans le template global
-                auto_vars = {
-                    'article_title': improved_article['metadata'].get('title', 'Article Seminary'),
-                    'meta_description': improved_article['metadata'].get('description', ''),
-                    'article_content': final_html,
-                    'publish_date': datetime.now().strftime('%d/%m/%Y'),
-                    'reading_time': max(1, improved_article.get('word_count', 400) // 200),
-                    'filename': self.generate_filename(improved_article['metadata']),
-                    'header_html': '',
-                    'footer_html': '',
-                    'article_subtitle': ''
-                }
-                wrapped_html = self.article_template.render(**auto_vars)
+                wrapped_html = self.render_article(improved_article, content=final_html)
 
                 if not self._is_valid_html(wrapped_html):
                     logger.error("❌ ÉCHEC CRITIQUE: HTML invalide même après auto-wrap")
                     return None
                 logger.info("✅ HTML auto-wrap réussi et validé")
-                final_html = wrapped_html
+                final_html = final_result['final_html'] = wrapped_html
             else:
                 logger.info("✅ HTML final validé via analyse DOM")
             
             # Sauvegarder l'article
             file_path = self.save_article(final_result)
             
+            # Références d'images pour la garbage collection du magasin
+            self.image_handler.image_store.set_article_references(Path(file_path).name, final_result.get('image_refs', []))
+            self.image_handler.image_scheduler.record_article(Path(file_path).name, final_result.get('selected_images', []))
+            
+            # Source structurée dans le catalogue : l'article sera re-rendu par le builder si le template
+            # ou un fragment change, et ses métadonnées sont lues sans analyser le HTML
+            # Score de la page publiée (HTML minifié tel qu'écrit sur disque)
+            final_audit = self.audit_html(final_result['published_html'])
+            keyword_analysis = final_audit.get('detailed_results', {}).get('content', {}).get('keyword_analysis', {})
+            self.site_builder.record_article(
+                file_path,
+                image_refs=final_result.get('image_refs', []),
+                word_count=final_word_count,
+                keywords=[kw for kw, stats in sorted(keyword_analysis.items(), key=lambda kv: -kv[1]['count']) if stats['count']],
+                seo_score=final_audit.get('global_score'),
+                metrics={
+                    'duration_s': round(time.time() - start_time, 1),
+                    'initial_seo_score': seo_audit.get('global_score'),
+                    'improvement_score': improved_article.get('improvement_score', 0),
+                    'seminary_links': final_result['seminary_integration'].get('links_added', 0),
+                    'generated_at': datetime.now().isoformat(timespec='seconds'),
+                    **final_result.get('size_report', {})
+                }
+            )
+            
             # VALIDATION POST-SAUVEGARDE: Vérifier que le fichier n'est pas vide
             if os.path.exists(file_path):
                 file_size = os.path.getsize(file_path)
@@ -14,11 +14,15 @@ import os
 import re
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict
 from pathlib import Path
 import requests
 from bs4 import BeautifulSoup
 
+from rate_limiter import RateLimiter
+from article_catalog import ArticleCatalog
+from llm_output import clean_summary, extract_summary
+
 # Configuration du logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -37,57 +41,19 @@ class ContextManager:
         self.data_dir = Path(data_dir)
         self.articles_dir = Path(articles_dir)
         self.context_file = self.data_dir / "context_window.json"
+        self.rate_limiter = RateLimiter(self.data_dir / "rate_limits.json")
         
         # Créer les répertoires s'ils n'existent pas
         self.data_dir.mkdir(exist_ok=True)
         self.articles_dir.mkdir(exist_ok=True)
         
+        # Catalogue des articles : titre, description et contenu sans analyser le HTML publié
+        self.catalog = ArticleCatalog(self.data_dir / "articles.db")
+        
         # Initialiser le fichier de contexte s'il n'existe pas
         if not self.context_file.exists():
             self._initialize_context_file()
     
-    def _extract_final_content_from_deepseek(self, raw_content: str) -> str:
-        """
-        Extrait le contenu final du modèle DeepSeek-R1 qui expose son reasoning.
-        Version simplifiée pour les résumés.
-        """
-        import re
-        
-        # Cas 1: Contenu avec balises <think>
-        if '<think>' in raw_content:
-            think_pattern = r'<think>.*?</think>\s*(.*)'
-            match = re.search(think_pattern, raw_content, re.DOTALL)
-            if match:
-                final_content = match.group(1).strip()
-                if final_content and len(final_content) > 20:
-                    return final_content
-        
-        # Cas 2: Supprimer les phrases de reasoning typiques
-        lines = raw_content.split('\n')
-        final_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Ignorer les phrases de reasoning
-            if any(phrase in line.lower() for phrase in [
-                'je vais', 'il faut', 'l\'utilisateur', 'hmm', 'probablement',
-                'semble', 'visiblement', 'il faudra', 'j\'éviterai'
-            ]):
-                continue
-                
-            # Garder les phrases substantielles
-            if len(line.split()) > 3:
-                final_lines.append(line)
-        
-        if final_lines:
-            return '\n'.join(final_lines)
-        
-        # Fallback
-        return raw_content
-    
     def _initialize_context_file(self) -> None:
         """Initialise le fichier context_window.json."""
         initial_context = {
@@ -159,7 +125,7 @@ class ContextManager:
     
     def extract_article_content(self, article_path: Path) -> Dict[str, str]:
         """
-        Extrait le contenu d'un article HTML.
+        Extrait le contenu d'un article (catalogue, sinon analyse du HTML publié).
         
         Args:
             article_path: Chemin vers le fichier HTML de l'article
@@ -168,6 +134,17 @@ class ContextManager:
             Dictionnaire contenant titre, contenu et métadonnées
         """
         try:
+            record = self.catalog.get(article_path.name)
+            if record:
+                content_text = BeautifulSoup(record['content'], 'html.parser').get_text(separator=' ', strip=True)
+                return {
+                    'title': record['title'],
+                    'description': record['description'],
+                    'content': re.sub(r'\s+', ' ', content_text).strip(),
+                    'filename': article_path.name,
+                    'date': self._extract_date_from_filename(article_path.name)
+                }
+            
             with open(article_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
@@ -263,7 +240,15 @@ Résumé ({max_words} mots):"""
             
             api_url = "https://openrouter.ai/api/v1/chat/completions"
             
+            # Quota OpenRouter partagé avec article_generator
+            if not self.rate_limiter.acquire('openrouter', timeout=120):
+                logger.warning("Quota OpenRouter épuisé - résumé de fallback")
+                return self._generate_fallback_summary(content_preview, max_words)
+            
             response = requests.post(api_url, headers=headers, json=payload, timeout=120)  # 2 minutes pour DeepSeek-R1
+            self.rate_limiter.sync_from_headers('openrouter', response.headers)
+            if response.status_code == 429:
+                self.rate_limiter.block('openrouter')
             response.raise_for_status()
             
             result = response.json()
@@ -272,14 +257,14 @@ Résumé ({max_words} mots):"""
             if 'choices' in result and len(result['choices']) > 0:
                 raw_summary = result['choices'][0]['message']['content'].strip()
                 # Extraire le contenu final (après le reasoning de DeepSeek-R1)
-                summary = self._extract_final_content_from_deepseek(raw_summary)
+                summary = extract_summary(raw_summary)
             else:
                 summary = ''
             
             # Nettoyer et valider le résumé
             if summary:
                 # Supprimer les préfixes indésirables
-                summary = re.sub(r'^(Résumé|Summary):\s*', '', summary, flags=re.IGNORECASE)
+                summary = clean_summary(summary)
                 
                 # Limiter à max_words mots
                 words = summary.split()
@@ -13,6 +13,9 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import logging
 
+from site_fragments import SiteFragments
+from templating import get_environment
+
 logger = logging.getLogger(__name__)
 
 class FallbackArticleGenerator:
@@ -225,9 +228,6 @@ def create_fallback_article(target_word_count: int = 400) -> str:
         # Charger le template d'article
         template_path = Path(__file__).parent.parent / 'templates' / 'article_template.html'
         if template_path.exists():
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_content = f.read()
-            
             # Variables pour le template
             template_vars = {
                 'article_title': article_data['metadata']['title'],
@@ -238,10 +238,17 @@ def create_fallback_article(target_word_count: int = 400) -> str:
                 'filename': filename
             }
             
-            # Remplacer les variables dans le template
-            final_html = template_content
-            for var_name, var_value in template_vars.items():
-                final_html = final_html.replace(f'{{{{ {var_name} }}}}', str(var_value))
+            # Styles, header et footer inclus au build (mêmes fragments que le pipeline principal)
+            root_dir = template_path.parent.parent
+            try:
+                fragments = SiteFragments(template_path.parent, root_dir / 'data' / 'site_fragments.json',
+                                          root_dir / 'assets').render()
+                template_vars.update({f'{name}_html': html for name, html in fragments.items()})
+            except Exception as e:
+                logger.warning(f"Fragments du site indisponibles: {e}")
+            
+            # Rendu Jinja2 (le template hérite de la mise en page de base)
+            final_html = get_environment(template_path.parent).get_template(template_path.name).render(**template_vars)
         else:
             # Template de fallback simple
             final_html = f'''<!DOCTYPE html>
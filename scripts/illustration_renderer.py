@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Illustration Renderer - Illustrations CSS/SVG pilotées par les données
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module rend les illustrations d'articles à partir de :
+1. Templates Jinja2 (templates/illustrations/*.html), compilés une fois (cache de bytecode)
+2. Un registre JSON : template, schéma des données, valeurs par défaut et règles de suggestion
+3. Des chiffres extraits du contenu de l'article (pourcentages) pour alimenter les graphiques
+
+Ajouter un type d'illustration = un template + une entrée de registre, sans code Python.
+"""
+
+import re
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from templating import get_environment
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# "85 % des participants", "une hausse de 30% de la productivité"
+FIGURE_PATTERN = re.compile(r"(\d{1,3}(?:[.,]\d+)?)\s?%\s+((?:[^\W\d_]+['’]?\s*){1,5})", re.UNICODE)
+LABEL_STOPWORDS = {
+    'de', 'des', 'du', 'la', 'le', 'les', 'd', "d'", 'd’', 'l', "l'", 'l’', 'en', 'et', 'à', 'au', 'aux',
+    'sur', 'pour', 'par', 'dans', 'leur', 'leurs', 'ses', 'sa', 'son', 'plus', 'moins', 'ont', 'sont', 'qui'
+}
+
+
+def extract_figures(text: str, limit: int = 5) -> Dict[str, float]:
+    """
+    Extrait les pourcentages cités dans un texte, avec un libellé court.
+
+    Args:
+        text: Contenu de l'article (HTML accepté)
+        limit: Nombre maximal de chiffres retenus
+
+    Returns:
+        Dictionnaire ordonné {libellé: valeur}
+    """
+    figures: Dict[str, float] = {}
+    for match in FIGURE_PATTERN.finditer(TAG_PATTERN.sub(' ', text)):
+        value = float(match.group(1).replace(',', '.'))
+        if not 0 < value <= 100:
+            continue
+
+        words = [w for w in re.split(r"\s+|(?<=['’])", match.group(2).strip()) if w]
+        significant = [w for w in words if w.lower() not in LABEL_STOPWORDS]
+        if not significant:
+            continue
+        label = ' '.join(significant[:2])
+        label = label[0].upper() + label[1:]
+        if label in figures:
+            continue
+
+        figures[label] = int(value) if value.is_integer() else value
+        if len(figures) >= limit:
+            break
+    return figures
+
+
+class IllustrationRenderer:
+    """Rendu des illustrations à partir des templates Jinja2 et du registre de données."""
+
+    def __init__(self, templates_dir: Path = Path("templates"), registry_name: str = "illustrations/registry.json"):
+        """
+        Initialise le moteur de rendu.
+
+        Args:
+            templates_dir: Racine des templates (contient illustrations/)
+            registry_name: Registre des illustrations, relatif à templates_dir
+        """
+        self.env = get_environment(Path(templates_dir))
+        with open(Path(templates_dir) / registry_name, 'r', encoding='utf-8') as f:
+            self.registry = json.load(f)
+        self.illustrations: Dict[str, Dict] = self.registry['illustrations']
+
+    # ------------------------------------------------------------------
+    # Résolution et validation
+    # ------------------------------------------------------------------
+    def resolve(self, illustration_type: str, params: Dict[str, Any]) -> str:
+        """Clé de registre d'une illustration ('chart' + chart_type='bar' → 'chart:bar')."""
+        variant = self.registry.get('variants', {}).get(illustration_type)
+        if variant:
+            key = f"{illustration_type}:{params.get(variant['param']) or variant['default']}"
+            if key not in self.illustrations:
+                key = f"{illustration_type}:{variant['default']}"
+        else:
+            key = illustration_type
+        return key if key in self.illustrations else 'default'
+
+    def _coerce(self, spec: Dict, value: Any) -> Any:
+        """Valide une valeur selon le schéma ; lève ValueError si elle est invalide."""
+        kind = spec['type']
+        if kind == 'text':
+            if not isinstance(value, (str, int, float)) or not str(value).strip():
+                raise ValueError("texte attendu")
+            return str(value)
+        if kind == 'percentages':
+            if not isinstance(value, dict) or not value:
+                raise ValueError("dictionnaire {libellé: pourcentage} attendu")
+            items = list(value.items())[:spec.get('max_items', len(value))]
+            if not all(isinstance(v, (int, float)) and 0 <= v <= 100 for _, v in items):
+                raise ValueError("pourcentages entre 0 et 100 attendus")
+            return {str(k): v for k, v in items}
+        if kind == 'list':
+            if not isinstance(value, (list, tuple)) or not value:
+                raise ValueError("liste non vide attendue")
+            item_spec = spec.get('items', 'text')
+            items = []
+            for item in list(value)[:spec.get('max_items', len(value))]:
+                if isinstance(item_spec, dict):
+                    if not isinstance(item, dict):
+                        raise ValueError("objet attendu")
+                    items.append({field: str(item.get(field, '')) for field in item_spec})
+                else:
+                    items.append(self._coerce({'type': item_spec}, item))
+            return items
+        raise ValueError(f"type de schéma inconnu: {kind}")
+
+    def build_context(self, key: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fusionne paramètres et valeurs par défaut selon le schéma de l'illustration."""
+        spec = self.illustrations[key]
+        context = {'palette': self.registry.get('palette', [])}
+        for field, field_spec in spec.get('schema', {}).items():
+            value = params.get(field)
+            if value is not None:
+                try:
+                    context[field] = self._coerce(field_spec, value)
+                    continue
+                except ValueError as e:
+                    logger.warning(f"Illustration {key}: champ '{field}' ignoré ({e})")
+            context[field] = spec.get('defaults', {}).get(field)
+        return context
+
+    # ------------------------------------------------------------------
+    # Rendu et suggestions
+    # ------------------------------------------------------------------
+    def render(self, illustration_type: str, theme: str = 'professional', **params) -> str:
+        """
+        Rend une illustration.
+
+        Args:
+            illustration_type: Type d'illustration ('chart', 'infographic', 'icon', 'diagram'...)
+            theme: Thème Seminary (exposé aux templates)
+            **params: Données de l'illustration (validées par le schéma du registre)
+        """
+        key = self.resolve(illustration_type, params)
+        context = self.build_context(key, params)
+        context['theme'] = theme
+        return self.env.get_template(f"illustrations/{self.illustrations[key]['template']}").render(context)
+
+    def suggest(self, article_content: str, title: str) -> List[Dict]:
+        """
+        Suggère des illustrations selon les déclencheurs du registre.
+
+        Les graphiques reçoivent les pourcentages extraits de l'article quand il en cite assez.
+        """
+        content_lower = (article_content + " " + title).lower()
+        figures: Optional[Dict[str, float]] = None
+        suggestions = []
+
+        for key, spec in self.illustrations.items():
+            rule = spec.get('suggestion')
+            if not rule or not rule.get('triggers'):
+                continue
+            if not any(word in content_lower for word in rule['triggers']):
+                continue
+
+            suggestion = self._suggestion(key, rule)
+            min_figures = rule.get('figures_from_content')
+            if min_figures:
+                if figures is None:
+                    figures = extract_figures(article_content)
+                if len(figures) >= min_figures:
+                    suggestion.update(rule.get('figures_params', {}), data=figures)
+            suggestions.append(suggestion)
+
+        fallback = self.registry.get('fallback_suggestion')
+        if not suggestions and fallback in self.illustrations:
+            suggestions.append(self._suggestion(fallback, self.illustrations[fallback].get('suggestion', {})))
+        return suggestions
+
+    def _suggestion(self, key: str, rule: Dict) -> Dict:
+        """Suggestion au format attendu par generate_css_illustration."""
+        illustration_type, _, variant = key.partition(':')
+        suggestion = {
+            'illustration_type': illustration_type,
+            'title': rule.get('title', key),
+            'description': rule.get('description', '')
+        }
+        if variant:
+            suggestion[self.registry['variants'][illustration_type]['param']] = variant
+        return suggestion
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Image Cache - Cache persistant des recherches Unsplash
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module fournit un cache clé/valeur borné pour les recherches d'images :
+1. Journal append-only (une ligne JSON par modification)
+2. Compaction périodique par écriture atomique (fichier temporaire + rename)
+3. Expiration des entrées (TTL) et éviction LRU au-delà d'une taille maximale
+4. Chargement paresseux au premier accès
+"""
+
+import json
+import os
+import time
+import logging
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    """Écrit un fichier de façon atomique (fichier temporaire puis os.replace)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=str(path.parent))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp crée le fichier en 0600 : on applique les droits usuels (pages publiées)
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_name, 0o666 & ~umask)
+        os.replace(tmp_name, path)
+    except Exception:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(path: Path, content: str, encoding: str = 'utf-8') -> None:
+    """Écrit un fichier texte de façon atomique."""
+    atomic_write_bytes(path, content.encode(encoding))
+
+
+class SearchCache:
+    """Cache des recherches Unsplash persisté sous forme de journal append-only."""
+
+    def __init__(self, log_file: Path, ttl: int = 3600, max_entries: int = 200,
+                 compaction_ratio: float = 2.0, legacy_file: Optional[Path] = None):
+        """
+        Initialise le cache sans lire le disque (chargement paresseux).
+
+        Args:
+            log_file: Fichier journal (JSON Lines)
+            ttl: Durée de validité d'une entrée en secondes
+            max_entries: Nombre maximum d'entrées conservées (éviction LRU)
+            compaction_ratio: Ratio lignes du journal / entrées vivantes déclenchant une compaction
+            legacy_file: Ancien cache JSON monolithique à migrer au premier chargement
+        """
+        self.log_file = Path(log_file)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.compaction_ratio = compaction_ratio
+        self.legacy_file = Path(legacy_file) if legacy_file else None
+
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._log_lines = 0
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # Chargement
+    # ------------------------------------------------------------------
+    def _ensure_loaded(self) -> None:
+        """Charge le journal au premier accès."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.log_file.exists():
+            if self.legacy_file and self.legacy_file.exists():
+                self._migrate_legacy_file()
+            return
+
+        needs_compaction = False
+        try:
+            with open(self.log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    self._log_lines += 1
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Ligne tronquée (écriture interrompue) : on la saute et on compacte
+                        needs_compaction = True
+                        continue
+                    self._apply_record(record)
+        except OSError as e:
+            logger.warning(f"Erreur lors du chargement du cache: {e}")
+            return
+
+        evicted = self._evict()
+        if needs_compaction or evicted or self._should_compact():
+            self.compact()
+
+    def _apply_record(self, record: Dict) -> None:
+        """Rejoue un enregistrement du journal."""
+        key = record.get('key')
+        if not key:
+            return
+        if record.get('op') == 'del':
+            self._entries.pop(key, None)
+        elif 'value' in record:
+            self._entries.pop(key, None)
+            self._entries[key] = record['value']
+
+    def _migrate_legacy_file(self) -> None:
+        """Importe l'ancien fichier unsplash_cache.json puis le supprime."""
+        try:
+            with open(self.legacy_file, 'r', encoding='utf-8') as f:
+                legacy = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ancien cache illisible, ignoré: {e}")
+            return
+
+        # Les plus anciennes d'abord pour respecter l'ordre LRU
+        for key, value in sorted(legacy.items(), key=lambda kv: kv[1].get('timestamp', 0)):
+            self._entries[key] = value
+        self._evict()
+        self.compact()
+
+        try:
+            self.legacy_file.unlink()
+        except OSError:
+            pass
+        logger.info(f"Cache migré vers {self.log_file.name}: {len(self._entries)} entrées")
+
+    # ------------------------------------------------------------------
+    # Éviction et compaction
+    # ------------------------------------------------------------------
+    def _is_expired(self, value: Dict, now: Optional[float] = None) -> bool:
+        """Indique si une entrée a dépassé son TTL."""
+        now = now if now is not None else time.time()
+        return now - value.get('timestamp', 0) >= self.ttl
+
+    def _evict(self) -> int:
+        """Supprime en mémoire les entrées expirées et les plus anciennes au-delà de max_entries."""
+        now = time.time()
+        expired = [key for key, value in self._entries.items() if self._is_expired(value, now)]
+        for key in expired:
+            del self._entries[key]
+
+        overflow = 0
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            overflow += 1
+
+        return len(expired) + overflow
+
+    def _should_compact(self) -> bool:
+        """Le journal contient-il trop de lignes mortes ?"""
+        live = max(len(self._entries), 1)
+        return self._log_lines > max(live * self.compaction_ratio, 32)
+
+    def compact(self) -> None:
+        """Réécrit le journal avec les seules entrées vivantes (écriture atomique)."""
+        lines = [
+            json.dumps({'op': 'set', 'key': key, 'value': value}, ensure_ascii=False, separators=(',', ':'))
+            for key, value in self._entries.items()
+        ]
+        try:
+            atomic_write_text(self.log_file, ''.join(line + '\n' for line in lines))
+            self._log_lines = len(lines)
+        except OSError as e:
+            logger.error(f"Erreur lors de la compaction du cache: {e}")
+
+    def _append(self, record: Dict) -> None:
+        """Ajoute un enregistrement en fin de journal."""
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+        try:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+            self._log_lines += 1
+        except OSError as e:
+            logger.error(f"Erreur lors de la sauvegarde du cache: {e}")
+
+    # ------------------------------------------------------------------
+    # API publique
+    # ------------------------------------------------------------------
+    def get(self, key: str) -> Optional[Dict]:
+        """Retourne l'entrée si elle existe et n'a pas expiré (et la marque comme récente)."""
+        self._ensure_loaded()
+        value = self._entries.get(key)
+        if value is None:
+            return None
+        if self._is_expired(value):
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Dict) -> None:
+        """Enregistre une entrée et n'ajoute qu'une ligne au journal."""
+        self._ensure_loaded()
+        value.setdefault('timestamp', time.time())
+        self._entries.pop(key, None)
+        self._entries[key] = value
+        self._append({'op': 'set', 'key': key, 'value': value})
+
+        if self._evict() or self._should_compact():
+            self.compact()
+
+    def delete(self, key: str) -> None:
+        """Supprime une entrée."""
+        self._ensure_loaded()
+        if self._entries.pop(key, None) is not None:
+            self._append({'op': 'del', 'key': key})
+            if self._should_compact():
+                self.compact()
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        """Itère sur les entrées non expirées, de la plus ancienne à la plus récente."""
+        self._ensure_loaded()
+        now = time.time()
+        for key, value in list(self._entries.items()):
+            if not self._is_expired(value, now):
+                yield key, value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._entries)
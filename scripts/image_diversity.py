@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Image Diversity - Ordonnancement des images entre articles
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module évite que les mêmes photos (ou des photos quasi identiques)
+reviennent d'un article à l'autre :
+1. Index d'usage data/image_usage.json : dernier article ayant utilisé chaque image et chaque cluster
+2. Cluster perceptuel dérivé du blur_hash Unsplash (aucun téléchargement nécessaire)
+3. Pénalités décroissantes avec l'ancienneté, calculées en O(1) par candidat
+4. Classement des suggestions par pertinence pénalisée, sans appel API supplémentaire
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from image_cache import atomic_write_text
+from image_placeholders import blurhash_cluster
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class DiversityScheduler:
+    """Pénalise les images et clusters visuels utilisés par les articles récents."""
+
+    def __init__(self, usage_file: Path = Path("data/image_usage.json"), window: int = 10,
+                 image_penalty: float = 10.0, cluster_penalty: float = 3.0):
+        """
+        Initialise l'ordonnanceur.
+
+        Args:
+            usage_file: Index d'usage persistant
+            window: Nombre d'articles au-delà duquel une utilisation n'est plus pénalisée
+            image_penalty: Pénalité d'une image utilisée par l'article précédent
+            cluster_penalty: Pénalité d'un cluster visuel utilisé par l'article précédent
+        """
+        self.usage_file = Path(usage_file)
+        self.window = window
+        self.image_penalty = image_penalty
+        self.cluster_penalty = cluster_penalty
+        self.usage = self._load_usage()
+
+    def _load_usage(self) -> Dict:
+        """Charge l'index d'usage (structure vide si absent ou corrompu)."""
+        try:
+            with open(self.usage_file, 'r', encoding='utf-8') as f:
+                usage = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            usage = {}
+        usage.setdefault('sequence', 0)
+        usage.setdefault('images', {})
+        usage.setdefault('clusters', {})
+        usage.setdefault('articles', {})
+        return usage
+
+    def _decay(self, last_sequence) -> float:
+        """1.0 pour l'article précédent, puis décroissance linéaire jusqu'à 0 sur la fenêtre."""
+        if last_sequence is None:
+            return 0.0
+        age = self.usage['sequence'] - last_sequence
+        return max(0.0, (self.window - age) / self.window)
+
+    def penalty(self, image: Dict) -> float:
+        """Pénalité de récence d'un candidat (deux lookups de dictionnaire)."""
+        penalty = self.image_penalty * self._decay(self.usage['images'].get(image.get('id')))
+        cluster = blurhash_cluster(image.get('blur_hash'))
+        if cluster:
+            penalty += self.cluster_penalty * self._decay(self.usage['clusters'].get(cluster))
+        return penalty
+
+    def rank(self, candidates: Iterable[Dict]) -> List[Dict]:
+        """
+        Classe les candidats par pertinence pénalisée (tri stable).
+
+        Returns:
+            Copies des candidats avec diversity_penalty, de la meilleure à la moins bonne
+        """
+        ranked = []
+        for candidate in candidates:
+            ranked.append({**candidate, 'diversity_penalty': self.penalty(candidate)})
+        ranked.sort(key=lambda c: c.get('relevance_score', 0.0) - c['diversity_penalty'], reverse=True)
+        return ranked
+
+    def record_article(self, article_filename: str, images: Iterable[Dict]) -> None:
+        """
+        Enregistre les images retenues pour un article publié.
+
+        Args:
+            article_filename: Nom du fichier de l'article
+            images: Images insérées dans l'article (format search_images)
+        """
+        images = [image for image in images if image.get('id')]
+        self.usage['sequence'] += 1
+        sequence = self.usage['sequence']
+
+        for image in images:
+            self.usage['images'][image['id']] = sequence
+            cluster = blurhash_cluster(image.get('blur_hash'))
+            if cluster:
+                self.usage['clusters'][cluster] = sequence
+        self.usage['articles'][article_filename] = {
+            'sequence': sequence,
+            'images': [image['id'] for image in images]
+        }
+
+        # Les utilisations hors fenêtre ne pénalisent plus : l'index reste borné
+        oldest = sequence - self.window
+        for section in ('images', 'clusters'):
+            self.usage[section] = {key: seq for key, seq in self.usage[section].items() if seq > oldest}
+        self.usage['articles'] = {name: entry for name, entry in self.usage['articles'].items()
+                                  if entry['sequence'] > oldest}
+
+        atomic_write_text(self.usage_file, json.dumps(self.usage, indent=2, ensure_ascii=False))
+        logger.info(f"Usage d'images enregistré pour {article_filename}: {len(images)} image(s)")
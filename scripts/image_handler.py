@@ -25,6 +25,17 @@ import base64
 import random
 from dataclasses import dataclass
 
+from image_cache import SearchCache
+from rate_limiter import RateLimiter
+from image_processing import process_image
+from image_variants import build_variants, render_picture_html
+from image_placeholders import placeholder_style
+from image_store import ImageStore, blob_digest
+from image_library import ImageLibrary
+from image_diversity import DiversityScheduler
+from static_assets import minify_markup
+from illustration_renderer import IllustrationRenderer
+
 # Configuration du logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -75,7 +86,11 @@ class ImageHandler:
             'quality': 85,
             'formats': ['jpg', 'jpeg', 'webp'],
             'max_file_size': 2 * 1024 * 1024,  # 2MB
-            'timeout': 30
+            'timeout': 30,
+            'cache_ttl': 3600,  # Cache valide 1h
+            'cache_max_entries': 200,
+            'local_relevance_threshold': 4.0,  # Score minimal d'une image locale pour éviter l'API
+            'local_min_results': 3
         }
         
         # Mots-clés Seminary pour recherche d'images
@@ -88,59 +103,45 @@ class ImageHandler:
             'leadership training', 'corporate wellness', 'professional development'
         ]
         
-        # Cache des recherches pour éviter les appels répétitifs
-        self.search_cache_file = self.cache_dir / "unsplash_cache.json"
-        self.search_cache = self._load_search_cache()
+        # Magasin d'images adressé par contenu (manifeste + déduplication perceptuelle)
+        self.image_store = ImageStore(self.images_dir, Path("data") / "image_manifest.json")
         
-        # Système de tracking des requêtes pour respecter les limites
-        self.request_tracker = {
-            'count': 0,
-            'last_reset': time.time(),
-            'limit_reached': False
-        }
-    
-    def _check_rate_limit(self) -> bool:
-        """Vérifie si on peut faire une requête API selon les limites."""
-        current_time = time.time()
+        # Cache des recherches pour éviter les appels répétitifs (chargé au premier accès)
+        self.search_cache_file = self.cache_dir / "unsplash_cache.jsonl"
+        self.search_cache = SearchCache(
+            self.search_cache_file,
+            ttl=self.image_config['cache_ttl'],
+            max_entries=self.image_config['cache_max_entries'],
+            legacy_file=self.cache_dir / "unsplash_cache.json"
+        )
         
-        # Reset du compteur toutes les heures
-        if current_time - self.request_tracker['last_reset'] >= 3600:
-            self.request_tracker = {
-                'count': 0,
-                'last_reset': current_time,
-                'limit_reached': False
-            }
+        # Bibliothèque locale indexée (cache de recherche + magasin) consultée avant l'API
+        self.image_library = ImageLibrary(Path("data") / "image_library.json")
+        
+        # Illustrations CSS/SVG : rendus mémorisés (styles dans la feuille partagée des articles)
+        self.illustration_renderer = IllustrationRenderer(Path("templates"))
+        self._illustration_cache: Dict[Tuple[str, str, str], str] = {}
         
-        # Vérifier la limite
-        if self.request_tracker['count'] >= self.unsplash_config.rate_limit_per_hour:
-            self.request_tracker['limit_reached'] = True
+        # Index d'usage inter-articles pour varier les images d'un article à l'autre
+        self.image_scheduler = DiversityScheduler(Path("data") / "image_usage.json")
+        
+        # Token bucket partagé entre processus et runs pour respecter les limites
+        self.rate_limiter = RateLimiter(Path("data") / "rate_limits.json")
+        self.rate_limiter.configure('unsplash', self.unsplash_config.rate_limit_per_hour, 3600)
+    
+    def _check_rate_limit(self) -> bool:
+        """Consomme un jeton Unsplash si le quota partagé le permet."""
+        if not self.rate_limiter.try_acquire('unsplash'):
             logger.warning(f"Limite de requêtes Unsplash atteinte: {self.unsplash_config.rate_limit_per_hour}/h")
             return False
-        
         return True
     
-    def _increment_request_count(self):
-        """Incrémente le compteur de requêtes."""
-        self.request_tracker['count'] += 1
-    
-    def _load_search_cache(self) -> Dict:
-        """Charge le cache des recherches Unsplash."""
-        try:
-            if self.search_cache_file.exists():
-                with open(self.search_cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception as e:
-            logger.warning(f"Erreur lors du chargement du cache: {e}")
-        
-        return {}
-    
-    def _save_search_cache(self) -> None:
-        """Sauvegarde le cache des recherches."""
-        try:
-            with open(self.search_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.search_cache, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Erreur lors de la sauvegarde du cache: {e}")
+    def _handle_rate_limit_response(self, response: requests.Response) -> None:
+        """Synchronise le quota partagé avec les en-têtes de la réponse Unsplash."""
+        self.rate_limiter.sync_from_headers('unsplash', response.headers)
+        if response.status_code in (403, 429):
+            retry_after = response.headers.get('Retry-After')
+            self.rate_limiter.block('unsplash', float(retry_after) if retry_after and retry_after.isdigit() else None)
     
     def _generate_cache_key(self, query: str, orientation: str = 'landscape') -> str:
         """Génère une clé de cache unique pour une recherche."""
@@ -163,18 +164,17 @@ class ImageHandler:
             logger.warning("Clé API Unsplash manquante - utilisation du fallback")
             return self._get_fallback_images(query, count)
         
+        # Vérifier le cache d'abord (ne consomme pas de quota)
+        cache_key = self._generate_cache_key(query, orientation)
+        cached_result = self.search_cache.get(cache_key)  # Entrées expirées supprimées
+        if cached_result is not None:
+            logger.info(f"Utilisation du cache pour la recherche: {query}")
+            return cached_result['images'][:count]
+        
         if not self._check_rate_limit():
             logger.warning("Limite de requêtes atteinte - utilisation du cache/fallback")
             return self._get_fallback_images(query, count)
         
-        # Vérifier le cache d'abord
-        cache_key = self._generate_cache_key(query, orientation)
-        if cache_key in self.search_cache:
-            cached_result = self.search_cache[cache_key]
-            if time.time() - cached_result['timestamp'] < 3600:  # Cache valide 1h
-                logger.info(f"Utilisation du cache pour la recherche: {query}")
-                return cached_result['images'][:count]
-        
         try:
             # Headers avec configuration complète selon la documentation Unsplash
             headers = {
@@ -196,8 +196,6 @@ class ImageHandler:
                 'utm_medium': 'referral'
             }
             
-            self._increment_request_count()
-            
             response = requests.get(
                 f"{self.unsplash_base_url}/search/photos",
                 headers=headers,
@@ -205,6 +203,7 @@ class ImageHandler:
                 timeout=self.image_config['timeout']
             )
             
+            self._handle_rate_limit_response(response)
             response.raise_for_status()
             search_data = response.json()
             
@@ -233,15 +232,19 @@ class ImageHandler:
                 }
                 images.append(image_info)
             
-            # Mettre en cache le résultat
-            self.search_cache[cache_key] = {
+            # Mettre en cache le résultat (une seule ligne ajoutée au journal)
+            self.search_cache.set(cache_key, {
                 'timestamp': time.time(),
                 'query': query,
                 'images': images
-            }
-            self._save_search_cache()
+            })
+            
+            # Indexer les résultats pour les recherches locales futures
+            self.image_library.add_many(images, query)
+            self.image_library.save()
             
-            logger.info(f"Trouvé {len(images)} images Unsplash pour '{query}' (requêtes: {self.request_tracker['count']}/{self.unsplash_config.rate_limit_per_hour})")
+            quota = self.rate_limiter.status('unsplash')
+            logger.info(f"Trouvé {len(images)} images Unsplash pour '{query}' (requêtes restantes: {quota['remaining']}/{quota['capacity']})")
             return images
             
         except requests.exceptions.RequestException as e:
@@ -255,590 +258,34 @@ class ImageHandler:
         """
         Génère des illustrations CSS/SVG pour améliorer le SEO et l'engagement.
         
+        Le rendu (template Jinja2 + données validées par le registre) est déterministe
+        pour un (type, thème, paramètres) donné : il est mémorisé et minifié ; les styles
+        communs sont dans la feuille partagée des articles (templates/css/illustrations.css).
+        
         Args:
             illustration_type: Type d'illustration ('chart', 'infographic', 'icon', 'diagram')
             theme: Thème Seminary ('team-building', 'nature', 'professional', 'statistics')
-            **kwargs: Paramètres spécifiques selon le type
+            **kwargs: Paramètres spécifiques selon le type (chart_type, data, heading...)
             
         Returns:
-            Code HTML/CSS/SVG de l'illustration
+            Code HTML/SVG de l'illustration
         """
-        if illustration_type == 'chart':
-            return self._generate_chart_css(theme, **kwargs)
-        elif illustration_type == 'infographic':
-            return self._generate_infographic_css(theme, **kwargs)
-        elif illustration_type == 'icon':
-            return self._generate_icon_illustration(theme, **kwargs)
-        elif illustration_type == 'diagram':
-            return self._generate_diagram_css(theme, **kwargs)
-        else:
-            return self._generate_default_illustration(theme)
-    
-    def _generate_chart_css(self, theme: str, data: Optional[Dict] = None, chart_type: str = 'bar', **kwargs) -> str:
-        """Génère un graphique CSS animé."""
-        if not data:
-            # Données par défaut pour les séminaires
-            data = {
-                'Cohésion équipe': 85,
-                'Productivité': 78,
-                'Communication': 92,
-                'Motivation': 88,
-                'Innovation': 76
-            }
-        
-        if chart_type == 'bar':
-            return self._generate_bar_chart(data, theme)
-        elif chart_type == 'progress':
-            return self._generate_progress_chart(data, theme)
-        else:
-            return self._generate_bar_chart(data, theme)
-    
-    def _generate_bar_chart(self, data: Dict, theme: str) -> str:
-        """Génère un graphique en barres CSS animé."""
-        chart_html = """
-<div class="seminary-chart-container" style="margin: 2rem 0; padding: 2rem; background: linear-gradient(135deg, #f8f9ff 0%, #e8edff 100%); border-radius: 12px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-    <h3 style="text-align: center; color: #7E22CE; margin-bottom: 2rem; font-weight: 600;">Impact des séminaires Seminary sur les équipes</h3>
-    <div class="chart-bars" style="display: flex; align-items: end; justify-content: space-between; height: 200px; margin-bottom: 1rem;">
-"""
-        
-        max_value = max(data.values())
-        colors = ['#7E22CE', '#A94BE0', '#6B1B9A', '#8B5A9F', '#9F4BBD']
-        
-        for i, (label, value) in enumerate(data.items()):
-            height_percent = (value / max_value) * 100
-            color = colors[i % len(colors)]
-            
-            chart_html += f"""
-        <div class="chart-bar" style="
-            width: {100 / len(data) - 2}%;
-            height: {height_percent}%;
-            background: linear-gradient(to top, {color}, {color}AA);
-            border-radius: 4px 4px 0 0;
-            position: relative;
-            animation: seminary-bar-grow 1.5s ease-out {i * 0.2}s both;
-            margin: 0 1%;
-        ">
-            <div style="
-                position: absolute;
-                top: -30px;
-                left: 50%;
-                transform: translateX(-50%);
-                font-weight: 600;
-                color: #333;
-                font-size: 0.9rem;
-            ">{value}%</div>
-            <div style="
-                position: absolute;
-                bottom: -40px;
-                left: 50%;
-                transform: translateX(-50%);
-                font-size: 0.8rem;
-                color: #666;
-                text-align: center;
-                width: 120%;
-            ">{label}</div>
-        </div>"""
-        
-        chart_html += """
-    </div>
-    <p style="text-align: center; color: #666; font-size: 0.9rem; margin-top: 2rem;">
-        📊 Amélioration moyenne constatée 3 mois après un séminaire Seminary dans les Vosges
-    </p>
-</div>
-
-<style>
-@keyframes seminary-bar-grow {
-    from {
-        height: 0%;
-    }
-    to {
-        height: var(--final-height);
-    }
-}
-
-.seminary-chart-container:hover .chart-bar {
-    transform: scale(1.05);
-    transition: transform 0.3s ease;
-}
-</style>
-"""
-        return chart_html
-    
-    def _generate_progress_chart(self, data: Dict, theme: str) -> str:
-        """Génère un graphique de progression circulaire."""
-        if len(data) > 1:
-            # Prendre la première valeur pour le cercle principal
-            main_value = list(data.values())[0]
-            main_label = list(data.keys())[0]
-        else:
-            main_value = 85
-            main_label = "Satisfaction globale"
-        
-        # Calculer le stroke-dasharray pour l'animation
-        circumference = 2 * 3.14159 * 45  # rayon de 45
-        stroke_offset = circumference - (main_value / 100) * circumference
-        
-        chart_html = f"""
-<div class="seminary-progress-chart" style="
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    padding: 2rem;
-    margin: 2rem 0;
-    background: linear-gradient(135deg, #7E22CE10, #A94BE020);
-    border-radius: 16px;
-    box-shadow: 0 4px 12px rgba(126, 34, 206, 0.1);
-">
-    <div style="position: relative; width: 200px; height: 200px;">
-        <svg width="200" height="200" style="transform: rotate(-90deg);">
-            <!-- Cercle de fond -->
-            <circle
-                cx="100"
-                cy="100"
-                r="45"
-                fill="none"
-                stroke="#e5e7eb"
-                stroke-width="8"
-            />
-            <!-- Cercle de progression -->
-            <circle
-                cx="100"
-                cy="100"
-                r="45"
-                fill="none"
-                stroke="url(#seminary-gradient)"
-                stroke-width="8"
-                stroke-linecap="round"
-                stroke-dasharray="{circumference}"
-                stroke-dashoffset="{stroke_offset}"
-                style="
-                    animation: seminary-progress-draw 2s ease-out forwards;
-                "
-            />
-            <defs>
-                <linearGradient id="seminary-gradient" x1="0%" y1="0%" x2="100%" y2="0%">
-                    <stop offset="0%" stop-color="#7E22CE"/>
-                    <stop offset="100%" stop-color="#A94BE0"/>
-                </linearGradient>
-            </defs>
-        </svg>
-        
-        <!-- Texte central -->
-        <div style="
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            text-align: center;
-        ">
-            <div style="
-                font-size: 2.5rem;
-                font-weight: 700;
-                color: #7E22CE;
-                line-height: 1;
-            ">{main_value}%</div>
-            <div style="
-                font-size: 0.9rem;
-                color: #666;
-                margin-top: 0.5rem;
-                font-weight: 500;
-            ">{main_label}</div>
-        </div>
-    </div>
-</div>
-
-<style>
-@keyframes seminary-progress-draw {{
-    from {{
-        stroke-dashoffset: {circumference};
-    }}
-    to {{
-        stroke-dashoffset: {stroke_offset};
-    }}
-}}
-</style>
-"""
-        return chart_html
-    
-    def _generate_infographic_css(self, theme: str, **kwargs) -> str:
-        """Génère une infographie CSS interactive."""
-        steps = [
-            "1. Analyse des besoins",
-            "2. Conception du programme",
-            "3. Séminaire dans les Vosges", 
-            "4. Suivi post-formation",
-            "5. Évaluation des résultats"
-        ]
-        
-        infographic_html = """
-<div class="seminary-infographic" style="
-    margin: 2rem 0;
-    padding: 2rem;
-    background: linear-gradient(135deg, #7E22CE 0%, #A94BE0 50%, #6B1B9A 100%);
-    border-radius: 16px;
-    color: white;
-    box-shadow: 0 8px 24px rgba(126, 34, 206, 0.3);
-">
-    <h3 style="text-align: center; margin-bottom: 2rem; font-size: 1.5rem; font-weight: 600;">
-        🎯 Processus Seminary - De l'idée au succès
-    </h3>
-    
-    <div class="infographic-timeline" style="position: relative;">
-"""
-        
-        for i, step in enumerate(steps):
-            is_last = i == len(steps) - 1
-            
-            infographic_html += f"""
-        <div class="timeline-item" style="
-            display: flex;
-            align-items: center;
-            margin-bottom: {0 if is_last else 1.5}rem;
-            animation: seminary-fade-in-up 0.6s ease-out {i * 0.2}s both;
-        ">
-            <div class="step-number" style="
-                width: 40px;
-                height: 40px;
-                background: rgba(255, 255, 255, 0.2);
-                border: 2px solid rgba(255, 255, 255, 0.4);
-                border-radius: 50%;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                font-weight: 600;
-                margin-right: 1rem;
-                backdrop-filter: blur(10px);
-            ">{i + 1}</div>
-            
-            <div class="step-content" style="
-                flex: 1;
-                padding: 1rem;
-                background: rgba(255, 255, 255, 0.1);
-                border-radius: 8px;
-                backdrop-filter: blur(10px);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            ">
-                <h4 style="margin: 0; font-size: 1.1rem; font-weight: 500;">{step}</h4>
-            </div>
-        </div>"""
-            
-            # Ajouter une ligne de connexion sauf pour le dernier élément
-            if not is_last:
-                infographic_html += """
-        <div class="timeline-connector" style="
-            width: 2px;
-            height: 20px;
-            background: rgba(255, 255, 255, 0.3);
-            margin-left: 19px;
-            margin-bottom: 0.5rem;
-        "></div>"""
-        
-        infographic_html += """
-    </div>
-    
-    <div style="text-align: center; margin-top: 2rem; padding-top: 1.5rem; border-top: 1px solid rgba(255,255,255,0.2);">
-        <p style="margin: 0; font-size: 0.9rem; opacity: 0.9;">
-            ✨ Chaque étape est personnalisée selon vos objectifs d'équipe
-        </p>
-    </div>
-</div>
-
-<style>
-@keyframes seminary-fade-in-up {
-    from {
-        opacity: 0;
-        transform: translateY(20px);
-    }
-    to {
-        opacity: 1;
-        transform: translateY(0);
-    }
-}
-
-.seminary-infographic:hover .timeline-item {
-    transform: scale(1.02);
-    transition: transform 0.3s ease;
-}
-</style>
-"""
-        return infographic_html
-
-    def _generate_icon_illustration(self, theme: str, **kwargs) -> str:
-        """Génère une collection d'icônes CSS pour illustrer les concepts Seminary."""
-        icons_data = [
-            {"icon": "🏔️", "title": "Cadre montagnard", "desc": "Environnement naturel inspirant"},
-            {"icon": "🤝", "title": "Team building", "desc": "Renforcement des liens d'équipe"},
-            {"icon": "🎯", "title": "Objectifs clairs", "desc": "Définition d'objectifs communs"},
-            {"icon": "💡", "title": "Innovation", "desc": "Stimulation de la créativité"},
-            {"icon": "📈", "title": "Résultats", "desc": "Amélioration des performances"},
-            {"icon": "🌲", "title": "Nature", "desc": "Ressourcement en pleine nature"}
-        ]
-        
-        icons_html = """
-<div class="seminary-icons-grid" style="
-    margin: 2rem 0;
-    padding: 2rem;
-    background: linear-gradient(135deg, #f8f9ff 0%, #e8edff 100%);
-    border-radius: 16px;
-    box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-">
-    <h3 style="text-align: center; color: #7E22CE; margin-bottom: 2rem; font-weight: 600;">
-        🎯 Les atouts des séminaires Seminary
-    </h3>
-    
-    <div class="icons-container" style="
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-        gap: 1.5rem;
-        margin-bottom: 1rem;
-    ">
-"""
-        
-        for i, icon_data in enumerate(icons_data):
-            icons_html += f"""
-        <div class="icon-item" style="
-            text-align: center;
-            padding: 1.5rem;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 2px 8px rgba(126, 34, 206, 0.1);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-            animation: seminary-icon-appear 0.6s ease-out {i * 0.1}s both;
-        " onmouseover="this.style.transform='translateY(-5px)'; this.style.boxShadow='0 8px 24px rgba(126, 34, 206, 0.2)'" 
-           onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='0 2px 8px rgba(126, 34, 206, 0.1)'">
-            <div style="font-size: 2.5rem; margin-bottom: 1rem;">{icon_data['icon']}</div>
-            <h4 style="
-                color: #7E22CE; 
-                margin: 0 0 0.5rem 0; 
-                font-size: 1.1rem; 
-                font-weight: 600;
-            ">{icon_data['title']}</h4>
-            <p style="
-                color: #666; 
-                margin: 0; 
-                font-size: 0.9rem; 
-                line-height: 1.4;
-            ">{icon_data['desc']}</p>
-        </div>"""
-        
-        icons_html += """
-    </div>
-    
-    <div style="text-align: center; margin-top: 2rem; padding-top: 1.5rem; border-top: 1px solid #ddd;">
-        <p style="color: #666; font-size: 0.9rem; margin: 0;">
-            🌟 Une approche complète pour dynamiser vos équipes dans un cadre exceptionnel
-        </p>
-    </div>
-</div>
-
-<style>
-@keyframes seminary-icon-appear {
-    from {
-        opacity: 0;
-        transform: scale(0.8);
-    }
-    to {
-        opacity: 1;
-        transform: scale(1);
-    }
-}
-</style>
-"""
-        return icons_html
-
-    def _generate_diagram_css(self, theme: str, **kwargs) -> str:
-        """Génère un diagramme CSS pour illustrer les flux et processus Seminary."""
-        diagram_type = kwargs.get('diagram_type', 'process')
-        
-        if diagram_type == 'process':
-            return self._generate_process_diagram(theme)
-        elif diagram_type == 'organizational':
-            return self._generate_org_diagram(theme)
-        else:
-            return self._generate_process_diagram(theme)  # Fallback par défaut
-    
-    def _generate_process_diagram(self, theme: str) -> str:
-        """Génère un diagramme de processus Seminary."""
-        process_steps = [
-            {"title": "Analyse", "desc": "Évaluation des besoins", "color": "#7E22CE"},
-            {"title": "Conception", "desc": "Programme sur mesure", "color": "#A94BE0"},
-            {"title": "Exécution", "desc": "Séminaire dans les Vosges", "color": "#9F4BBD"},
-            {"title": "Suivi", "desc": "Accompagnement post-formation", "color": "#8B5A9F"}
-        ]
-        
-        diagram_html = """
-<div class="seminary-process-diagram" style="
-    margin: 2rem 0;
-    padding: 2rem;
-    background: linear-gradient(135deg, #f8f9ff 0%, #e8edff 100%);
-    border-radius: 16px;
-    box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-">
-    <h3 style="text-align: center; color: #7E22CE; margin-bottom: 2rem; font-weight: 600;">
-        🔄 Processus Seminary - De A à Z
-    </h3>
-    
-    <div class="process-flow" style="
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        flex-wrap: wrap;
-        gap: 1rem;
-    ">
-"""
-        
-        for i, step in enumerate(process_steps):
-            is_last = i == len(process_steps) - 1
-            
-            diagram_html += f"""
-        <div class="process-step" style="
-            flex: 1;
-            min-width: 200px;
-            text-align: center;
-            animation: seminary-step-slide-in 0.8s ease-out {i * 0.2}s both;
-        ">
-            <div class="step-circle" style="
-                width: 80px;
-                height: 80px;
-                background: {step['color']};
-                border-radius: 50%;
-                margin: 0 auto 1rem auto;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                color: white;
-                font-weight: 600;
-                font-size: 1.2rem;
-                box-shadow: 0 4px 12px {step['color']}40;
-                transition: transform 0.3s ease;
-            " onmouseover="this.style.transform='scale(1.1)'" onmouseout="this.style.transform='scale(1)'">
-                {i + 1}
-            </div>
-            
-            <h4 style="
-                color: {step['color']};
-                margin: 0 0 0.5rem 0;
-                font-size: 1.1rem;
-                font-weight: 600;
-            ">{step['title']}</h4>
-            
-            <p style="
-                color: #666;
-                margin: 0;
-                font-size: 0.9rem;
-                line-height: 1.4;
-            ">{step['desc']}</p>
-        </div>"""
-            
-            # Ajouter une flèche sauf pour le dernier élément
-            if not is_last:
-                diagram_html += f"""
-        <div class="arrow" style="
-            color: #7E22CE;
-            font-size: 1.5rem;
-            animation: seminary-arrow-pulse 2s ease-in-out infinite {i * 0.2}s;
-        ">→</div>"""
-        
-        diagram_html += """
-    </div>
+        cache_key = (illustration_type, theme, json.dumps(kwargs, sort_keys=True, ensure_ascii=False, default=str))
+        cached = self._illustration_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        illustration_html = minify_markup(self.illustration_renderer.render(illustration_type, theme, **kwargs))
+        self._illustration_cache[cache_key] = illustration_html
+        return illustration_html
     
-    <div style="text-align: center; margin-top: 2rem; padding-top: 1.5rem; border-top: 1px solid #ddd;">
-        <p style="color: #666; font-size: 0.9rem; margin: 0;">
-            ⚡ Un processus éprouvé pour maximiser l'impact de vos séminaires
-        </p>
-    </div>
-</div>
-
-<style>
-@keyframes seminary-step-slide-in {
-    from {
-        opacity: 0;
-        transform: translateX(-20px);
-    }
-    to {
-        opacity: 1;
-        transform: translateX(0);
-    }
-}
-
-@keyframes seminary-arrow-pulse {
-    0%, 100% { opacity: 0.5; transform: scale(1); }
-    50% { opacity: 1; transform: scale(1.1); }
-}
-</style>
-"""
-        return diagram_html
-    
-    def _generate_org_diagram(self, theme: str) -> str:
-        """Génère un diagramme organisationnel Seminary."""
-        return """
-<div class="seminary-org-diagram" style="
-    margin: 2rem 0;
-    padding: 2rem;
-    background: linear-gradient(135deg, #7E22CE10, #A94BE020);
-    border-radius: 16px;
-    text-align: center;
-">
-    <h3 style="color: #7E22CE; margin-bottom: 2rem;">🏢 Structure d'accompagnement Seminary</h3>
-    <div style="display: flex; justify-content: center; align-items: center; flex-wrap: wrap; gap: 2rem;">
-        <div style="padding: 1rem; background: white; border-radius: 8px; box-shadow: 0 2px 8px rgba(126,34,206,0.1);">
-            <strong>👥 Équipe</strong><br>
-            <small>Participants</small>
-        </div>
-        <div style="color: #7E22CE; font-size: 1.5rem;">↕️</div>
-        <div style="padding: 1rem; background: white; border-radius: 8px; box-shadow: 0 2px 8px rgba(126,34,206,0.1);">
-            <strong>🎯 Facilitateur</strong><br>
-            <small>Expert Seminary</small>
-        </div>
-        <div style="color: #7E22CE; font-size: 1.5rem;">↕️</div>
-        <div style="padding: 1rem; background: white; border-radius: 8px; box-shadow: 0 2px 8px rgba(126,34,206,0.1);">
-            <strong>🏔️ Environnement</strong><br>
-            <small>Vosges</small>
-        </div>
-    </div>
-</div>"""
-
-    def _generate_default_illustration(self, theme: str) -> str:
-        """Génère une illustration par défaut quand aucun type spécifique n'est demandé."""
-        return """
-<div class="seminary-default-illustration" style="
-    margin: 2rem 0;
-    padding: 2rem;
-    background: linear-gradient(135deg, #7E22CE 0%, #A94BE0 100%);
-    border-radius: 16px;
-    color: white;
-    text-align: center;
-    box-shadow: 0 8px 24px rgba(126, 34, 206, 0.3);
-">
-    <div style="font-size: 4rem; margin-bottom: 1rem;">🏔️</div>
-    <h3 style="margin: 0 0 1rem 0; font-size: 1.5rem; font-weight: 600;">
-        Seminary - Séminaires d'Exception dans les Vosges
-    </h3>
-    <p style="margin: 0; font-size: 1.1rem; opacity: 0.9; line-height: 1.6;">
-        Transformez votre équipe dans un cadre naturel inspirant.<br>
-        Des résultats durables grâce à notre expertise unique.
-    </p>
-    
-    <div style="
-        margin-top: 2rem;
-        padding: 1rem;
-        background: rgba(255, 255, 255, 0.1);
-        border-radius: 8px;
-        backdrop-filter: blur(10px);
-    ">
-        <div style="display: flex; justify-content: center; gap: 2rem; flex-wrap: wrap;">
-            <div><strong>🎯</strong> Team Building</div>
-            <div><strong>📈</strong> Performance</div>
-            <div><strong>🌲</strong> Nature</div>
-            <div><strong>🤝</strong> Cohésion</div>
-        </div>
-    </div>
-</div>"""
-
     def suggest_illustrations_for_article(self, article_content: str, title: str) -> List[Dict]:
         """
         Suggère des illustrations CSS appropriées pour un article.
         
+        Les règles (mots déclencheurs) viennent du registre des illustrations ; les
+        graphiques reprennent les pourcentages cités dans l'article.
+        
         Args:
             article_content: Contenu de l'article
             title: Titre de l'article
@@ -846,61 +293,19 @@ class ImageHandler:
         Returns:
             Liste de suggestions d'illustrations
         """
-        suggestions = []
-        content_lower = (article_content + " " + title).lower()
-        
-        # Suggestions basées sur le contenu
-        if any(word in content_lower for word in ['statistique', 'pourcentage', '%', 'étude', 'résultat']):
-            suggestions.append({
-                'illustration_type': 'chart',
-                'chart_type': 'bar',
-                'title': 'Graphique statistiques',
-                'description': 'Graphique en barres avec données sur les séminaires'
-            })
-        
-        if any(word in content_lower for word in ['processus', 'étape', 'méthode', 'comment']):
-            suggestions.append({
-                'illustration_type': 'infographic',
-                'title': 'Infographie processus',
-                'description': 'Étapes du processus Seminary'
-            })
-        
-        if any(word in content_lower for word in ['performance', 'amélioration', 'progression', 'succès']):
-            suggestions.append({
-                'illustration_type': 'chart',
-                'chart_type': 'progress',
-                'title': 'Graphique de progression',
-                'description': 'Cercle de progression pour montrer l\'amélioration'
-            })
-        
-        if any(word in content_lower for word in ['organisation', 'flux', 'workflow']):
-            suggestions.append({
-                'illustration_type': 'diagram',
-                'diagram_type': 'process',
-                'title': 'Diagramme de flux',
-                'description': 'Flux d\'organisation Seminary'
-            })
-        
-        # Suggestion par défaut
-        if not suggestions:
-            suggestions.append({
-                'illustration_type': 'icon',
-                'title': 'Icônes thématiques',
-                'description': 'Collection d\'icônes représentant les séminaires'
-            })
-        
-        return suggestions
+        return self.illustration_renderer.suggest(article_content, title)
 
     def get_unsplash_config_status(self) -> Dict[str, Any]:
         """Retourne le statut de la configuration Unsplash."""
+        quota = self.rate_limiter.status('unsplash')
         return {
             'access_key_configured': bool(self.unsplash_config.access_key),
             'secret_key_configured': bool(self.unsplash_config.secret_key),
             'demo_mode': self.unsplash_config.demo_mode,
             'rate_limit_per_hour': self.unsplash_config.rate_limit_per_hour,
-            'requests_used': self.request_tracker['count'],
-            'requests_remaining': self.unsplash_config.rate_limit_per_hour - self.request_tracker['count'],
-            'limit_reached': self.request_tracker['limit_reached']
+            'requests_used': quota['capacity'] - quota['remaining'],
+            'requests_remaining': quota['remaining'],
+            'limit_reached': quota['blocked'] or quota['remaining'] < 1
         }
 
     def suggest_images_for_article(self, article_content: str, title: str) -> List[Dict]:
@@ -922,7 +327,16 @@ class ImageHandler:
             # Préparer les requêtes de recherche
             search_queries = self._generate_search_queries(content_keywords)
             
-            all_suggestions = []
+            # Bibliothèque locale d'abord : l'API n'est appelée que si elle est insuffisante
+            # (candidats plus nombreux que nécessaire pour laisser jouer la diversité)
+            local_suggestions = self._search_local_library(content_keywords, search_queries[:3], limit=15)
+            relevant = [s for s in local_suggestions
+                        if s['relevance_score'] >= self.image_config['local_relevance_threshold']]
+            if len(relevant) >= self.image_config['local_min_results']:
+                logger.info(f"Images trouvées dans la bibliothèque locale: {len(relevant)} (aucun appel API)")
+                return self.image_scheduler.rank(relevant)[:5]
+            
+            all_suggestions = list(local_suggestions)
             
             for query in search_queries[:3]:  # Limiter à 3 requêtes pour éviter les quotas
                 images = self.search_images(query, count=5)
@@ -954,12 +368,33 @@ class ImageHandler:
                     seen_ids.add(suggestion['id'])
                     unique_suggestions.append(suggestion)
             
-            return unique_suggestions[:5]  # Retourner les 5 meilleures suggestions
+            # Pénaliser les images et clusters visuels des articles récents
+            return self.image_scheduler.rank(unique_suggestions)[:5]  # Retourner les 5 meilleures suggestions
             
         except Exception as e:
             logger.error(f"Erreur dans suggest_images_for_article: {e}")
             return []  # Retourner une liste vide en cas d'erreur
 
+    def _search_local_library(self, keywords: List[str], queries: List[str], limit: int = 5) -> List[Dict]:
+        """Recherche dans la bibliothèque locale (construite au premier usage)."""
+        if not len(self.image_library):
+            self.image_library.rebuild(self.search_cache, self.image_store)
+        
+        return [
+            {
+                **image,
+                'suggested_alt_text': self._generate_alt_text(image, keywords),
+                'suggested_title': self._generate_image_title(image, keywords)
+            }
+            for image in self.image_library.search(keywords, queries, limit=limit)
+        ]
+    
+    def _get_fallback_images(self, query: str, count: int) -> List[Dict]:
+        """Images de repli quand l'API est indisponible : bibliothèque locale uniquement."""
+        images = self._search_local_library([], [query], limit=count)
+        logger.info(f"Fallback bibliothèque locale pour '{query}': {len(images)} image(s)")
+        return images
+    
     def _extract_keywords_from_content(self, content: str, title: str) -> List[str]:
         """Extrait les mots-clés pertinents du contenu."""
         # Combiner titre et contenu
@@ -1060,66 +495,123 @@ class ImageHandler:
         
         return title[:150]  # Limiter la longueur
 
-    def download_image(self, image_info: Dict, filename: Optional[str] = None) -> Optional[str]:
+    def _build_download_url(self, image_info: Dict) -> str:
+        """Construit l'URL de téléchargement redimensionnée par le CDN Unsplash (imgix)."""
+        raw_url = image_info.get('url_raw')
+        if raw_url and not image_info.get('is_fallback', False):
+            separator = '&' if '?' in raw_url else '?'
+            return (f"{raw_url}{separator}fm=jpg&fit=max"
+                    f"&w={self.image_config['default_width']}&q={self.image_config['quality']}")
+        return image_info.get('url_regular', image_info.get('download_url'))
+    
+    def _stream_to_file(self, url: str, destination: Path) -> Optional[int]:
+        """
+        Télécharge une URL par blocs dans un fichier, sans dépasser max_file_size.
+        
+        Returns:
+            Nombre d'octets écrits, ou None si le plafond est dépassé
         """
-        Télécharge une image et la sauvegarde localement.
+        max_size = self.image_config['max_file_size']
+        
+        with requests.get(url, stream=True, timeout=self.image_config['timeout']) as response:
+            response.raise_for_status()
+            
+            declared_size = int(response.headers.get('Content-Length') or 0)
+            if declared_size > max_size:
+                logger.warning(f"Image trop volumineuse: {declared_size} bytes annoncés")
+                return None
+            
+            written = 0
+            too_large = False
+            try:
+                with open(destination, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        written += len(chunk)
+                        if written > max_size:
+                            too_large = True
+                            break
+                        f.write(chunk)
+            except Exception:
+                destination.unlink(missing_ok=True)
+                raise
+        
+        if too_large:
+            logger.warning(f"Image trop volumineuse: téléchargement interrompu à {written} bytes")
+            destination.unlink(missing_ok=True)
+            return None
+        
+        return written
+    
+    def download_image(self, image_info: Dict) -> Optional[str]:
+        """
+        Télécharge une image et la range dans le magasin adressé par contenu.
         
         Args:
             image_info: Informations de l'image (depuis search_images)
-            filename: Nom de fichier personnalisé (optionnel)
             
         Returns:
-            Chemin local de l'image téléchargée ou None si échec
+            Chemin local de l'image (images/<hash>.jpg), ou None si échec, doublon visuel
+            ou photo déjà utilisée par un autre article
         """
         try:
-            # Générer le nom de fichier
-            if not filename:
-                # Utiliser l'ID de l'image et nettoyer la description
-                clean_desc = re.sub(r'[^\w\s-]', '', image_info.get('description', ''))
-                clean_desc = re.sub(r'\s+', '-', clean_desc.strip())[:50]
-                filename = f"{image_info['id']}_{clean_desc}.jpg"
-            
-            # Assurer l'extension .jpg
-            if not filename.lower().endswith(('.jpg', '.jpeg')):
-                filename += '.jpg'
+            # Image déjà présente dans le magasin : aucun téléchargement,
+            # mais rejetée comme un doublon visuel si un autre article l'utilise déjà
+            existing = self.image_store.find_by_unsplash_id(image_info['id'])
+            if existing and self.image_store.is_referenced(existing):
+                logger.info(f"Image rejetée: {image_info['id']} déjà utilisée par un article")
+                return None
+            if existing:
+                logger.info(f"Image déjà présente: {image_info['id']} → {existing}")
+                return str(self.image_store.blob_path(existing))
             
-            file_path = self.images_dir / filename
+            file_path = self.images_dir / f".{image_info['id']}.tmp.jpg"
             
-            # Vérifier si l'image existe déjà
-            if file_path.exists():
-                logger.info(f"Image déjà présente: {filename}")
-                return str(file_path)
-            
-            # Télécharger l'image
-            download_url = image_info.get('url_regular', image_info.get('download_url'))
+            # Une seule URL, déjà dimensionnée côté CDN quand Unsplash le permet
+            download_url = self._build_download_url(image_info)
             
             # Pour Unsplash, déclencher le download tracking
             if not image_info.get('is_fallback', False) and 'download_url' in image_info:
                 try:
-                    headers = {'Authorization': f'Client-ID {self.unsplash_config.access_key}'}
-                    requests.get(image_info['download_url'], headers=headers, timeout=10)
+                    if self._check_rate_limit():
+                        headers = {'Authorization': f'Client-ID {self.unsplash_config.access_key}'}
+                        tracking = requests.get(image_info['download_url'], headers=headers, timeout=10)
+                        self._handle_rate_limit_response(tracking)
                 except Exception:
                     pass  # Le tracking n'est pas critique
             
-            # Télécharger l'image
-            response = requests.get(download_url, timeout=self.image_config['timeout'])
-            response.raise_for_status()
-            
-            # Vérifier la taille du fichier
-            if len(response.content) > self.image_config['max_file_size']:
-                logger.warning(f"Image trop volumineuse: {len(response.content)} bytes")
-                # Essayer avec l'URL small
-                small_url = image_info.get('url_small')
-                if small_url:
-                    response = requests.get(small_url, timeout=self.image_config['timeout'])
-                    response.raise_for_status()
+            # Téléchargement en streaming vers un fichier temporaire, interrompu au plafond
+            raw_path = file_path.with_name(file_path.name + '.part')
+            downloaded = self._stream_to_file(download_url, raw_path)
+            if downloaded is None:
+                return None
+            
+            # Post-traitement Pillow : EXIF supprimé, largeur et qualité configurées
+            try:
+                processed = process_image(
+                    raw_path,
+                    file_path,
+                    max_width=self.image_config['default_width'],
+                    quality=self.image_config['quality']
+                )
+            finally:
+                raw_path.unlink(missing_ok=True)
+            
+            # Nom final = hash du contenu ; rejet des doublons visuels d'images existantes
+            digest = self.image_store.add(file_path, unsplash_id=image_info['id'], metadata={
+                'description': image_info.get('description', ''),
+                'photographer': image_info.get('photographer', ''),
+                'tags': image_info.get('tags', []),
+                'blur_hash': image_info.get('blur_hash'),
+                'color': image_info.get('color')
+            })
+            if not digest:
+                return None
             
-            # Sauvegarder l'image
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
+            self.image_library.add({**image_info, 'blob': digest})
+            self.image_library.save()
             
-            logger.info(f"Image téléchargée: {filename} ({len(response.content)} bytes)")
-            return str(file_path)
+            logger.info(f"Image téléchargée: {digest} ({downloaded} → {processed['bytes']} bytes, {processed['width']}x{processed['height']})")
+            return str(self.image_store.blob_path(digest))
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Erreur lors du téléchargement: {e}")
@@ -1128,6 +620,25 @@ class ImageHandler:
             logger.error(f"Erreur lors de la sauvegarde de l'image: {e}")
             return None
 
+    def build_responsive_picture(self, image_path: str, alt: str, title: str = '') -> str:
+        """
+        Génère les variantes AVIF/WebP/JPEG d'une image téléchargée et leur balisage <picture>.
+        
+        Args:
+            image_path: Chemin local de l'image (depuis download_image)
+            alt: Texte alternatif
+            title: Titre de l'image
+            
+        Returns:
+            Code HTML <picture> avec srcset/sizes, width/height, placeholder flouté et chargement différé
+        """
+        variants = build_variants(Path(image_path), self.images_dir, quality=self.image_config['quality'])
+        
+        # Placeholder décodé au build depuis le blur_hash/la couleur conservés dans le manifeste
+        blob = self.image_store.blob_metadata(blob_digest(Path(image_path).name) or '')
+        placeholder = placeholder_style(blob.get('blur_hash'), blob.get('color'), variants['width'], variants['height'])
+        return render_picture_html(variants, alt=alt, title=title, placeholder=placeholder)
+
 def main():
     """Point d'entrée pour les tests CLI."""
     import argparse
@@ -1136,7 +647,7 @@ def main():
     parser.add_argument('--search', help='Rechercher des images')
     parser.add_argument('--api-key', help='Clé API Unsplash')
     parser.add_argument('--download', help='ID image à télécharger')
-    parser.add_argument('--cleanup', type=int, help='Nettoyer images plus anciennes que X jours')
+    parser.add_argument('--cleanup', action='store_true', help='Supprimer les images non référencées par les articles')
     
     args = parser.parse_args()
     
@@ -1159,8 +670,8 @@ def main():
                 print("Échec du téléchargement")
     
     if args.cleanup:
-        deleted = handler.cleanup_old_images(args.cleanup)
-        print(f"Images supprimées: {deleted}")
+        deleted = handler.image_store.collect_garbage()
+        print(f"Images supprimées: {len(deleted)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Image Library - Bibliothèque locale d'images indexée
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module maintient un index local des images déjà connues :
+1. Résultats de recherche Unsplash mis en cache et images du magasin (déjà téléchargées)
+2. Index inversé terme → images sur descriptions, tags et textes alt
+   (la requête d'origine est conservée pour la provenance, sans être notée)
+3. Caractéristiques de pertinence précalculées (termes, dimensions) par image
+4. Recherche locale en quelques millisecondes, sans appel réseau
+"""
+
+import json
+import re
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from image_cache import atomic_write_text
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# Champs textuels indexés pour chaque image (search_query n'en fait pas partie : une image
+# renvoyée pour une requête ne doit pas correspondre à cette requête par sa seule provenance)
+INDEXED_FIELDS = ('description', 'alt_description', 'suggested_alt_text')
+
+# Champs de l'API conservés dans la bibliothèque (les scores de suggestion sont recalculés)
+TRANSIENT_FIELDS = ('relevance_score', 'suggested_title')
+
+
+def tokenize(text: str) -> List[str]:
+    """Découpe un texte en termes normalisés (minuscules, 2 caractères minimum)."""
+    return [token for token in TOKEN_PATTERN.findall((text or '').lower()) if len(token) > 1]
+
+
+class ImageLibrary:
+    """Index inversé persistant des images Unsplash connues localement."""
+
+    def __init__(self, library_file: Path = Path("data/image_library.json")):
+        """
+        Initialise la bibliothèque (chargée au premier accès).
+
+        Args:
+            library_file: Fichier JSON de la bibliothèque et de son index
+        """
+        self.library_file = Path(library_file)
+        self._images: Dict[str, Dict] = {}
+        self._index: Dict[str, Set[str]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # Chargement / sauvegarde
+    # ------------------------------------------------------------------
+    def _ensure_loaded(self) -> None:
+        """Charge la bibliothèque depuis le disque au premier accès."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.library_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except json.JSONDecodeError as e:
+            logger.warning(f"Bibliothèque d'images corrompue, reconstruction: {e}")
+            return
+
+        self._images = data.get('images', {})
+        self._index = {term: set(ids) for term, ids in data.get('index', {}).items()}
+
+    def save(self) -> None:
+        """Sauvegarde la bibliothèque de façon atomique si elle a changé."""
+        if not self._dirty:
+            return
+        data = {
+            'version': 1,
+            'images': self._images,
+            'index': {term: sorted(ids) for term, ids in sorted(self._index.items())}
+        }
+        atomic_write_text(self.library_file, json.dumps(data, ensure_ascii=False))
+        self._dirty = False
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._images)
+
+    # ------------------------------------------------------------------
+    # Indexation
+    # ------------------------------------------------------------------
+    def _features(self, image: Dict) -> Dict:
+        """Caractéristiques de pertinence précalculées (cf. ImageHandler._calculate_relevance_score)."""
+        terms = set()
+        for field in INDEXED_FIELDS:
+            terms.update(tokenize(image.get(field, '')))
+        for tag in image.get('tags', []) or []:
+            terms.update(tokenize(tag))
+        return {
+            'terms': sorted(terms),
+            'large': image.get('width', 0) >= 1200 and image.get('height', 0) >= 600
+        }
+
+    def add(self, image: Dict, search_query: Optional[str] = None) -> None:
+        """
+        Ajoute ou enrichit une image de la bibliothèque.
+
+        Args:
+            image: Informations de l'image (format search_images)
+            search_query: Requête ayant renvoyé l'image (provenance, non indexée)
+        """
+        if not image.get('id') or image.get('is_fallback'):
+            return
+        self._ensure_loaded()
+
+        image_id = image['id']
+        previous = self._images.get(image_id, {})
+        entry = {**previous, **{k: v for k, v in image.items() if k not in TRANSIENT_FIELDS and v not in (None, '', [])}}
+
+        # Les requêtes successives s'accumulent plutôt que de s'écraser
+        queries = set(filter(None, previous.get('search_query', '').split(' | ')))
+        if search_query:
+            queries.add(search_query)
+        if queries:
+            entry['search_query'] = ' | '.join(sorted(queries))
+
+        features = self._features(entry)
+        if previous == {**entry, 'features': features}:
+            return
+
+        for term in previous.get('features', {}).get('terms', []):
+            ids = self._index.get(term)
+            if ids:
+                ids.discard(image_id)
+                if not ids:
+                    del self._index[term]
+
+        entry['features'] = features
+        self._images[image_id] = entry
+        for term in features['terms']:
+            self._index.setdefault(term, set()).add(image_id)
+        self._dirty = True
+
+    def add_many(self, images: Iterable[Dict], search_query: Optional[str] = None) -> None:
+        """Ajoute plusieurs images (résultat d'une recherche)."""
+        for image in images:
+            self.add(image, search_query)
+
+    def rebuild(self, search_cache, image_store) -> int:
+        """
+        Alimente la bibliothèque depuis le cache de recherche et le magasin d'images.
+
+        Args:
+            search_cache: SearchCache des recherches Unsplash
+            image_store: ImageStore des images téléchargées
+
+        Returns:
+            Nombre d'images dans la bibliothèque
+        """
+        for _, cached in search_cache.items():
+            self.add_many(cached.get('images', []), cached.get('query'))
+
+        for digest, blob in image_store.manifest['blobs'].items():
+            if blob.get('unsplash_id'):
+                self.add({
+                    'id': blob['unsplash_id'],
+                    'description': blob.get('description', ''),
+                    'photographer': blob.get('photographer', ''),
+                    'tags': blob.get('tags', []),
+                    'width': blob.get('width', 0),
+                    'height': blob.get('height', 0),
+                    'blur_hash': blob.get('blur_hash'),
+                    'color': blob.get('color'),
+                    'blob': digest
+                })
+
+        self.save()
+        logger.info(f"Bibliothèque d'images: {len(self._images)} images, {len(self._index)} termes indexés")
+        return len(self._images)
+
+    # ------------------------------------------------------------------
+    # Recherche
+    # ------------------------------------------------------------------
+    def _matching_ids(self, phrase: str) -> Set[str]:
+        """Images contenant tous les termes d'une expression (intersection des listes)."""
+        terms = tokenize(phrase)
+        if not terms:
+            return set()
+        postings = sorted((self._index.get(term, set()) for term in terms), key=len)
+        return set.intersection(*postings) if postings[0] else set()
+
+    def search(self, keywords: Sequence[str], queries: Sequence[str], limit: int = 5) -> List[Dict]:
+        """
+        Recherche locale notée comme ImageHandler._calculate_relevance_score.
+
+        +2 par mot-clé présent, +1 par mot de la requête présent, +1 pour les grandes
+        images ; chaque image garde le meilleur score parmi les requêtes.
+
+        Returns:
+            Images triées par pertinence décroissante (avec relevance_score et search_query)
+        """
+        self._ensure_loaded()
+        if not self._images:
+            return []
+
+        keyword_scores: Dict[str, float] = {}
+        for keyword in keywords:
+            for image_id in self._matching_ids(keyword):
+                keyword_scores[image_id] = keyword_scores.get(image_id, 0.0) + 2.0
+
+        best: Dict[str, Dict] = {}
+        for query in queries or ['']:
+            query_scores = dict(keyword_scores)
+            for word in tokenize(query):
+                for image_id in self._index.get(word, ()):
+                    query_scores[image_id] = query_scores.get(image_id, 0.0) + 1.0
+
+            for image_id, score in query_scores.items():
+                if self._images[image_id]['features']['large']:
+                    score += 1.0
+                if image_id not in best or score > best[image_id]['relevance_score']:
+                    best[image_id] = {'relevance_score': score, 'search_query': query}
+
+        ranked = sorted(best.items(), key=lambda item: item[1]['relevance_score'], reverse=True)[:limit]
+        results = []
+        for image_id, match in ranked:
+            image = {k: v for k, v in self._images[image_id].items() if k not in ('features', 'search_query')}
+            results.append({**image, **match})
+        return results
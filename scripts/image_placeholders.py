@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Image Placeholders - Placeholders LQIP à partir des métadonnées Unsplash
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module transforme le blur_hash et la couleur dominante renvoyés par
+Unsplash (déjà présents dans le cache de recherche) en placeholder inline :
+1. Décodage BlurHash en pur Python
+2. Mini PNG encodé en data-URI (aucun appel réseau)
+3. Style CSS réservant le ratio d'aspect et affichant le flou sous l'image
+"""
+
+import base64
+import io
+import math
+import logging
+import re
+from typing import List, Optional, Tuple
+
+from PIL import Image
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE83_CHARACTERS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+BASE83_VALUES = {char: index for index, char in enumerate(BASE83_CHARACTERS)}
+
+HEX_COLOR_PATTERN = re.compile(r'^#[0-9a-fA-F]{3,8}$')
+
+
+def _decode83(value: str) -> int:
+    """Décode une chaîne base83."""
+    result = 0
+    for char in value:
+        result = result * 83 + BASE83_VALUES[char]
+    return result
+
+
+def _srgb_to_linear(value: int) -> float:
+    v = value / 255
+    return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value: float) -> int:
+    v = max(0.0, min(1.0, value))
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def _sign_pow(value: float, exponent: float) -> float:
+    return math.copysign(abs(value) ** exponent, value)
+
+
+def decode_blurhash(blur_hash: str, width: int, height: int, punch: float = 1.0) -> List[Tuple[int, int, int]]:
+    """
+    Décode un BlurHash en liste de pixels RGB (ligne par ligne).
+
+    Raises:
+        ValueError: si le hash est invalide
+    """
+    if not blur_hash or len(blur_hash) < 6 or any(c not in BASE83_VALUES for c in blur_hash):
+        raise ValueError("BlurHash invalide")
+
+    size_flag = _decode83(blur_hash[0])
+    num_y = size_flag // 9 + 1
+    num_x = size_flag % 9 + 1
+    if len(blur_hash) != 4 + 2 * num_x * num_y:
+        raise ValueError("Longueur de BlurHash incohérente")
+
+    max_value = (_decode83(blur_hash[1]) + 1) / 166 * punch
+
+    colours = []
+    for index in range(num_x * num_y):
+        if index == 0:
+            dc = _decode83(blur_hash[2:6])
+            colours.append((_srgb_to_linear(dc >> 16), _srgb_to_linear((dc >> 8) & 255), _srgb_to_linear(dc & 255)))
+        else:
+            ac = _decode83(blur_hash[4 + index * 2:6 + index * 2])
+            colours.append((
+                _sign_pow(((ac // (19 * 19)) - 9) / 9, 2.0) * max_value,
+                _sign_pow((((ac // 19) % 19) - 9) / 9, 2.0) * max_value,
+                _sign_pow(((ac % 19) - 9) / 9, 2.0) * max_value,
+            ))
+
+    # Les cosinus ne dépendent que d'une dimension : précalcul par axe
+    cos_x = [[math.cos(math.pi * x * i / width) for i in range(num_x)] for x in range(width)]
+    cos_y = [[math.cos(math.pi * y * j / height) for j in range(num_y)] for y in range(height)]
+
+    pixels = []
+    for y in range(height):
+        for x in range(width):
+            r = g = b = 0.0
+            for j in range(num_y):
+                for i in range(num_x):
+                    basis = cos_x[x][i] * cos_y[y][j]
+                    colour = colours[i + j * num_x]
+                    r += colour[0] * basis
+                    g += colour[1] * basis
+                    b += colour[2] * basis
+            pixels.append((_linear_to_srgb(r), _linear_to_srgb(g), _linear_to_srgb(b)))
+    return pixels
+
+
+def blurhash_data_uri(blur_hash: str, aspect_ratio: float, width: int = 32) -> Optional[str]:
+    """Rend un BlurHash en mini PNG data-URI (None si le hash est invalide)."""
+    height = max(1, round(width / aspect_ratio)) if aspect_ratio > 0 else width
+    try:
+        pixels = decode_blurhash(blur_hash, width, height)
+    except (ValueError, KeyError) as e:
+        logger.warning(f"BlurHash ignoré ({blur_hash}): {e}")
+        return None
+
+    img = Image.new('RGB', (width, height))
+    img.putdata(pixels)
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG', optimize=True)
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def placeholder_style(blur_hash: Optional[str], color: Optional[str], width: int, height: int) -> str:
+    """
+    Style inline du placeholder : ratio réservé, couleur dominante puis flou BlurHash.
+
+    Args:
+        blur_hash: BlurHash Unsplash (optionnel)
+        color: Couleur dominante Unsplash (#rrggbb, optionnelle)
+        width: Largeur intrinsèque de l'image affichée
+        height: Hauteur intrinsèque de l'image affichée
+    """
+    declarations = [f"aspect-ratio: {width} / {height}"]
+    if color and HEX_COLOR_PATTERN.match(color):
+        declarations.append(f"background-color: {color}")
+    if blur_hash and width and height:
+        data_uri = blurhash_data_uri(blur_hash, width / height)
+        if data_uri:
+            declarations.append(f"background-image: url({data_uri})")
+            declarations.append("background-size: cover")
+    return '; '.join(declarations) + ';'
+
+
+def blurhash_cluster(blur_hash: Optional[str]) -> Optional[str]:
+    """
+    Clé de regroupement perceptuel grossière d'un BlurHash, sans décodage des pixels.
+
+    Couleur moyenne quantifiée sur 4 niveaux par canal, puis sens des premiers
+    gradients horizontal et vertical : deux photos de même sujet/cadrage
+    partagent généralement la même clé.
+    """
+    try:
+        if not blur_hash or len(blur_hash) < 6:
+            return None
+        size_flag = _decode83(blur_hash[0])
+        num_x = size_flag % 9 + 1
+        dc = _decode83(blur_hash[2:6])
+        key = f"{(dc >> 16) // 64}{((dc >> 8) & 255) // 64}{(dc & 255) // 64}"
+
+        for index in (1, num_x):
+            if len(blur_hash) < 6 + index * 2:
+                key += '0'
+                continue
+            green = (_decode83(blur_hash[4 + index * 2:6 + index * 2]) // 19) % 19
+            key += '-' if green < 7 else '+' if green > 11 else '0'
+        return key
+    except KeyError:
+        return None
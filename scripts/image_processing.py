@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Image Processing - Post-traitement Pillow des images téléchargées
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module transforme un fichier image brut en image publiable :
+1. Décodage réduit (draft JPEG) pour borner la mémoire
+2. Application de l'orientation EXIF puis suppression des métadonnées
+3. Redimensionnement à la largeur configurée
+4. Ré-encodage JPEG progressif à la qualité configurée
+"""
+
+import os
+import logging
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+from PIL import Image, ImageOps
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def process_image(source: Path, destination: Path, max_width: int, quality: int = 85) -> Dict:
+    """
+    Nettoie, redimensionne et ré-encode une image en JPEG.
+
+    Args:
+        source: Fichier image brut (téléchargé)
+        destination: Fichier JPEG final
+        max_width: Largeur maximale en pixels
+        quality: Qualité JPEG (1-95)
+
+    Returns:
+        Dictionnaire avec width, height et bytes de l'image finale
+    """
+    destination = Path(destination)
+
+    with Image.open(source) as img:
+        # Le décodeur JPEG peut réduire de 1/2 à 1/8 dès le décodage : la mémoire
+        # dépend alors de la taille cible et non de la taille source
+        img.draft('RGB', (max_width, max_width * img.height // max(img.width, 1)))
+        img = ImageOps.exif_transpose(img)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        if img.width > max_width:
+            img.thumbnail((max_width, img.height), Image.LANCZOS)
+
+        fd, tmp_name = tempfile.mkstemp(suffix='.jpg', dir=str(destination.parent))
+        os.close(fd)
+        try:
+            # Aucun paramètre exif/icc : les métadonnées ne sont pas recopiées
+            img.save(tmp_name, 'JPEG', quality=quality, optimize=True, progressive=True)
+            os.replace(tmp_name, destination)
+        except Exception:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+        width, height = img.size
+
+    return {'width': width, 'height': height, 'bytes': destination.stat().st_size}
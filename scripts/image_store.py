@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Image Store - Stockage des images adressé par contenu
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module gère le répertoire images/ comme un magasin de blobs :
+1. Fichiers nommés par le hash SHA-256 de leur contenu (<hash>.jpg, <hash>-<largeur>.<ext>)
+2. Manifeste data/image_manifest.json : blobs, identifiants Unsplash et articles
+3. Hash perceptuel (dHash) pour rejeter les doublons visuels entre articles
+4. Garbage collection pilotée par les références des articles (et non par l'âge)
+"""
+
+import json
+import re
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from PIL import Image
+
+from image_cache import atomic_write_text
+from image_variants import content_hash
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Références d'images dans le HTML publié (src, srcset, url(...))
+IMAGE_REFERENCE_PATTERN = re.compile(r'images/([^"\'\s,)?#]+)')
+
+# Blob (<hash>.jpg) ou variante (<hash>-<largeur>.<ext>)
+BLOB_FILENAME_PATTERN = re.compile(r'^([0-9a-f]{16})(?:-\d+)?\.\w+$')
+
+
+def dhash(path: Path, hash_size: int = 8) -> str:
+    """Calcule le hash perceptuel par différence (dHash) d'une image, en hexadécimal."""
+    with Image.open(path) as img:
+        img.draft('L', (hash_size * 8, hash_size * 8))
+        small = img.convert('L').resize((hash_size + 1, hash_size), Image.LANCZOS)
+        pixels = small.tobytes()
+
+    bits = 0
+    for row in range(hash_size):
+        for col in range(hash_size):
+            left = pixels[row * (hash_size + 1) + col]
+            right = pixels[row * (hash_size + 1) + col + 1]
+            bits = (bits << 1) | (1 if left > right else 0)
+    return f"{bits:0{hash_size * hash_size // 4}x}"
+
+
+def blob_digest(filename: str) -> Optional[str]:
+    """Hash du blob auquel appartient un nom de fichier (None pour les fichiers hérités)."""
+    match = BLOB_FILENAME_PATTERN.match(filename)
+    return match.group(1) if match else None
+
+
+def hamming_distance(hash_a: str, hash_b: str) -> int:
+    """Nombre de bits différents entre deux hash hexadécimaux."""
+    return bin(int(hash_a, 16) ^ int(hash_b, 16)).count('1')
+
+
+class ImageStore:
+    """Magasin d'images adressé par contenu avec manifeste et déduplication perceptuelle."""
+
+    def __init__(self, images_dir: Path = Path("images"), manifest_file: Path = Path("data/image_manifest.json"),
+                 similarity_threshold: int = 8):
+        """
+        Initialise le magasin.
+
+        Args:
+            images_dir: Répertoire des blobs et de leurs variantes
+            manifest_file: Fichier manifeste JSON
+            similarity_threshold: Distance de Hamming maximale entre deux dHash considérés identiques
+        """
+        self.images_dir = Path(images_dir)
+        self.manifest_file = Path(manifest_file)
+        self.similarity_threshold = similarity_threshold
+        self.images_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict:
+        """Charge le manifeste (structure vide si absent ou corrompu)."""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            manifest = {}
+        manifest.setdefault('version', 1)
+        manifest.setdefault('blobs', {})
+        manifest.setdefault('unsplash', {})
+        manifest.setdefault('articles', {})
+        return manifest
+
+    def save(self) -> None:
+        """Sauvegarde le manifeste de façon atomique."""
+        atomic_write_text(self.manifest_file, json.dumps(self.manifest, indent=2, ensure_ascii=False))
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    def blob_path(self, digest: str) -> Path:
+        """Chemin du fichier principal d'un blob."""
+        return self.images_dir / self.manifest['blobs'][digest]['file']
+
+    def blob_metadata(self, digest: str) -> Dict:
+        """Métadonnées d'un blob (dictionnaire vide si inconnu)."""
+        return self.manifest['blobs'].get(digest, {})
+
+    def find_by_unsplash_id(self, unsplash_id: str) -> Optional[str]:
+        """Retourne le hash du blob déjà téléchargé pour un identifiant Unsplash."""
+        digest = self.manifest['unsplash'].get(unsplash_id)
+        if digest and digest in self.manifest['blobs'] and self.blob_path(digest).exists():
+            return digest
+        return None
+
+    def is_referenced(self, digest: str) -> bool:
+        """Indique si un blob est déjà utilisé par un article enregistré."""
+        return any(digest in digests for digests in self.manifest['articles'].values())
+
+    def find_similar(self, perceptual_hash: str, exclude: Optional[str] = None) -> Optional[str]:
+        """Retourne un blob visuellement identique (dHash proche), s'il existe."""
+        for digest, blob in self.manifest['blobs'].items():
+            if digest == exclude or not blob.get('dhash'):
+                continue
+            if hamming_distance(perceptual_hash, blob['dhash']) <= self.similarity_threshold:
+                return digest
+        return None
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+    def add(self, path: Path, unsplash_id: Optional[str] = None, metadata: Optional[Dict] = None) -> Optional[str]:
+        """
+        Ajoute un fichier image au magasin (le fichier source est déplacé).
+
+        Args:
+            path: Image traitée à stocker
+            unsplash_id: Identifiant Unsplash de la photo
+            metadata: Informations complémentaires (description, photographe...)
+
+        Returns:
+            Hash du blob, ou None si l'image est un doublon visuel d'un blob existant
+        """
+        path = Path(path)
+        digest = content_hash(path)
+        perceptual_hash = dhash(path)
+
+        if digest in self.manifest['blobs']:
+            path.unlink(missing_ok=True)
+        else:
+            duplicate = self.find_similar(perceptual_hash)
+            if duplicate:
+                logger.info(f"Image rejetée: doublon visuel du blob {duplicate}")
+                path.unlink(missing_ok=True)
+                return None
+
+            target = self.images_dir / f"{digest}{path.suffix.lower() or '.jpg'}"
+            path.replace(target)
+            with Image.open(target) as img:
+                width, height = img.size
+            self.manifest['blobs'][digest] = {
+                'file': target.name,
+                'dhash': perceptual_hash,
+                'width': width,
+                'height': height,
+                'bytes': target.stat().st_size,
+                'unsplash_id': unsplash_id,
+                **(metadata or {})
+            }
+
+        if unsplash_id:
+            self.manifest['unsplash'][unsplash_id] = digest
+        self.save()
+        return digest
+
+    def set_article_references(self, article_filename: str, digests: Iterable[str]) -> None:
+        """Enregistre les blobs utilisés par un article."""
+        self.manifest['articles'][article_filename] = sorted(set(digests))
+        self.save()
+
+    # ------------------------------------------------------------------
+    # Garbage collection
+    # ------------------------------------------------------------------
+    def _referenced_files(self, articles_dir: Path, extra_pages: Iterable[Path] = ()) -> Set[str]:
+        """Noms de fichiers d'images cités dans le HTML publié."""
+        referenced = set()
+        pages = list(Path(articles_dir).glob('*.html')) + [Path(p) for p in extra_pages]
+        for page in pages:
+            try:
+                content = page.read_text(encoding='utf-8', errors='ignore')
+            except OSError:
+                continue
+            referenced.update(IMAGE_REFERENCE_PATTERN.findall(content))
+        return referenced
+
+    def collect_garbage(self, articles_dir: Path = Path("articles"), extra_pages: Iterable[Path] = (Path("index.html"),),
+                        dry_run: bool = False) -> List[str]:
+        """
+        Supprime les images qui ne sont plus référencées par aucun article.
+
+        Un fichier est conservé s'il est cité dans une page publiée, ou s'il appartient
+        (blob ou variante) à un blob référencé par un article encore présent.
+
+        Returns:
+            Liste des fichiers supprimés (ou à supprimer en mode dry_run)
+        """
+        articles_dir = Path(articles_dir)
+        referenced_files = self._referenced_files(articles_dir, extra_pages)
+
+        # Références du manifeste pour les articles toujours publiés
+        live_articles = {name: digests for name, digests in self.manifest['articles'].items()
+                         if (articles_dir / name).exists()}
+        live_digests = {digest for digests in live_articles.values() for digest in digests}
+        live_digests.update(filter(None, (blob_digest(name) for name in referenced_files)))
+
+        removed = []
+        for file_path in self.images_dir.iterdir():
+            if not file_path.is_file() or file_path.name.startswith('.'):
+                continue
+            if file_path.name in referenced_files or blob_digest(file_path.name) in live_digests:
+                continue
+            removed.append(file_path.name)
+            if not dry_run:
+                file_path.unlink()
+
+        if not dry_run:
+            self.manifest['articles'] = live_articles
+            for digest in [d for d in self.manifest['blobs'] if d not in live_digests]:
+                del self.manifest['blobs'][digest]
+            self.manifest['unsplash'] = {uid: d for uid, d in self.manifest['unsplash'].items()
+                                         if d in self.manifest['blobs']}
+            self.save()
+
+        logger.info(f"Garbage collection images: {len(removed)} fichier(s) {'à supprimer' if dry_run else 'supprimé(s)'}")
+        return removed
+
+
+def main():
+    """Point d'entrée CLI : garbage collection des images non référencées."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Image Store - Seminary Blog")
+    parser.add_argument('--gc', action='store_true', help='Supprimer les images non référencées par les articles')
+    parser.add_argument('--dry-run', action='store_true', help='Lister sans supprimer')
+    args = parser.parse_args()
+
+    if args.gc:
+        removed = ImageStore().collect_garbage(dry_run=args.dry_run)
+        for name in removed:
+            print(f"🗑️ {name}")
+        print(f"Images non référencées: {len(removed)}")
+
+
+if __name__ == "__main__":
+    main()
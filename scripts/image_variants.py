@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Image Variants - Déclinaisons responsives des images d'articles
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module génère, pour une image source :
+1. Plusieurs largeurs (400/800/1200 px)
+2. Les formats AVIF (si Pillow le supporte), WebP et JPEG de repli
+3. Des noms de fichiers basés sur le hash du contenu (cache navigateur illimité)
+4. Le balisage <picture> avec srcset/sizes, dimensions explicites et chargement différé
+"""
+
+import hashlib
+import html
+import logging
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from PIL import Image, features
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+VARIANT_WIDTHS = (400, 800, 1200)
+
+# La colonne de contenu des articles fait 800px de large au maximum
+DEFAULT_SIZES = "(max-width: 800px) 100vw, 800px"
+
+# (extension, format Pillow, type MIME, options d'encodage) - du plus compact au repli
+VARIANT_FORMATS = [
+    ('avif', 'AVIF', 'image/avif', {'quality': 50}),
+    ('webp', 'WEBP', 'image/webp', {'quality': 75, 'method': 6}),
+    ('jpg', 'JPEG', 'image/jpeg', {'optimize': True, 'progressive': True}),
+]
+
+
+def content_hash(path: Path, length: int = 16) -> str:
+    """Calcule le hash SHA-256 (tronqué) du contenu d'un fichier, lu par blocs."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()[:length]
+
+
+def _available_formats() -> List[Tuple[str, str, str, Dict]]:
+    """Formats supportés par l'installation Pillow courante."""
+    available = []
+    for ext, pil_format, mime, options in VARIANT_FORMATS:
+        if pil_format == 'AVIF' and not features.check('avif'):
+            continue
+        if pil_format == 'WEBP' and not features.check('webp'):
+            continue
+        available.append((ext, pil_format, mime, options))
+    return available
+
+
+def build_variants(source: Path, output_dir: Path, widths: Sequence[int] = VARIANT_WIDTHS,
+                   quality: int = 85) -> Dict:
+    """
+    Génère les déclinaisons d'une image (les fichiers déjà présents sont réutilisés).
+
+    Args:
+        source: Image source (JPEG traité)
+        output_dir: Répertoire de sortie des variantes
+        widths: Largeurs cibles en pixels
+        quality: Qualité JPEG du repli
+
+    Returns:
+        Dictionnaire {hash, width, height, sources: {mime: [(fichier, largeur)]}, fallback}
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    digest = content_hash(source)
+
+    with Image.open(source) as img:
+        img = img.convert('RGB')
+        source_width, source_height = img.size
+
+        # Pas d'agrandissement : on garde les largeurs inférieures à la source
+        target_widths = sorted({w for w in widths if w < source_width} | {min(max(widths), source_width)})
+
+        sources: Dict[str, List[Tuple[str, int]]] = {}
+        for ext, pil_format, mime, options in _available_formats():
+            entries = []
+            for width in target_widths:
+                filename = f"{digest}-{width}.{ext}"
+                target = output_dir / filename
+                if not target.exists():
+                    height = round(source_height * width / source_width)
+                    resized = img if width == source_width else img.resize((width, height), Image.LANCZOS)
+                    save_options = dict(options)
+                    if pil_format == 'JPEG':
+                        save_options['quality'] = quality
+                    resized.save(target, pil_format, **save_options)
+                entries.append((filename, width))
+            sources[mime] = entries
+
+    largest = target_widths[-1]
+    logger.info(f"Variantes responsives générées: {digest} ({len(sources)} formats x {len(target_widths)} largeurs)")
+    return {
+        'hash': digest,
+        'width': largest,
+        'height': round(source_height * largest / source_width),
+        'sources': sources,
+        'fallback': f"{digest}-{largest}.jpg"
+    }
+
+
+def render_picture_html(variants: Dict, alt: str, title: str = '', url_prefix: str = '../images/',
+                        sizes: str = DEFAULT_SIZES, css_class: str = 'article-image', placeholder: str = '') -> str:
+    """
+    Produit le balisage <picture> correspondant aux variantes.
+
+    Args:
+        variants: Résultat de build_variants
+        alt: Texte alternatif
+        title: Titre de l'image
+        url_prefix: Chemin relatif du répertoire images depuis la page
+        sizes: Attribut sizes
+        css_class: Classe CSS de la balise <img>
+        placeholder: Style inline affiché sous l'image pendant son chargement (voir image_placeholders)
+    """
+    def srcset(entries: List[Tuple[str, int]]) -> str:
+        return ', '.join(f"{url_prefix}{name} {width}w" for name, width in entries)
+
+    parts = ['<picture>']
+    for mime, entries in variants['sources'].items():
+        if mime == 'image/jpeg':
+            continue
+        parts.append(f'<source type="{mime}" srcset="{srcset(entries)}" sizes="{sizes}">')
+
+    jpeg_srcset = srcset(variants['sources'].get('image/jpeg', []))
+    title_attr = f' title="{html.escape(title)}"' if title else ''
+    style_attr = f' style="{html.escape(placeholder)}"' if placeholder else ''
+    parts.append(
+        f'<img src="{url_prefix}{variants["fallback"]}" srcset="{jpeg_srcset}" sizes="{sizes}" '
+        f'width="{variants["width"]}" height="{variants["height"]}" alt="{html.escape(alt)}"{title_attr}{style_attr} '
+        f'class="{css_class}" loading="lazy" decoding="async">'
+    )
+    parts.append('</picture>')
+    return ''.join(parts)
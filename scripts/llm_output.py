@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LLM Output - Post-traitement des réponses du modèle
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module regroupe le nettoyage des réponses OpenRouter (DeepSeek-R1) :
+1. Retrait du raisonnement <think>...</think> par recherche de l'index de fermeture
+   (aucune expression .* DOTALL sur toute la réponse)
+2. Extraction du HTML de l'article ou du texte d'un résumé, filtrage des lignes de raisonnement
+3. Nettoyage du HTML généré (préfixes, balises mal espacées, titres dupliqués)
+4. Titre, description et correction du <h1> en temps linéaire (ouverture puis fermeture cherchées une fois)
+5. Expressions précompilées partagées par ArticleGenerator et ContextManager
+6. Benchmark sur des réponses synthétiques volumineuses (python llm_output.py --benchmark)
+"""
+
+import re
+import time
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+THINK_OPEN = '<think>'
+THINK_CLOSE = '</think>'
+
+# Lignes de raisonnement exposées par le modèle hors des balises <think>
+ARTICLE_REASONING_PHRASES = ('je vais créer', 'je dois', 'il me faut', 'mon objectif',
+                             'je commence par', 'je vais maintenant', 'laissez-moi')
+SUMMARY_REASONING_PHRASES = ('je vais', 'il faut', "l'utilisateur", 'hmm', 'probablement',
+                             'semble', 'visiblement', 'il faudra', "j'éviterai")
+
+# Début du HTML de l'article : premier <h1>, sinon premier paragraphe ou titre
+H1_START_PATTERN = re.compile(r'<h1>', re.IGNORECASE)
+HTML_START_PATTERN = re.compile(r'<[ph][1-6]?>', re.IGNORECASE)
+
+ARTICLE_PREFIX_PATTERN = re.compile(r'^(Article|Voici|Voilà):\s*', re.IGNORECASE)
+SUMMARY_PREFIX_PATTERN = re.compile(r'^(Résumé|Summary):\s*', re.IGNORECASE)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+PADDED_TAG_PATTERN = re.compile(r'<([^>]+)>')
+DUPLICATE_HEADING_PATTERN = re.compile(r'(<h[1-6][^>]*>)\s*\1')
+
+# Ouverture et fermeture cherchées séparément : (.*?)</h1> DOTALL est quadratique
+# quand la réponse contient beaucoup d'ouvertures sans fermeture
+ELEMENT_PATTERNS = {
+    tag: (re.compile(rf'<{tag}[^>]*>', re.IGNORECASE), re.compile(rf'</{tag}>', re.IGNORECASE))
+    for tag in ('h1', 'p')
+}
+
+DESCRIPTION_LENGTH = 160
+TITLE_MIN_LENGTH = 35
+TITLE_MAX_LENGTH = 80
+FALLBACK_TITLE_LENGTH = 60
+
+
+def strip_reasoning(raw_content: str) -> Optional[str]:
+    """
+    Texte qui suit le premier bloc <think>...</think>.
+
+    Returns:
+        Réponse sans raisonnement, ou None si la réponse n'a pas de bloc <think> fermé
+    """
+    start = raw_content.find(THINK_OPEN)
+    if start < 0:
+        return None
+    end = raw_content.find(THINK_CLOSE, start + len(THINK_OPEN))
+    if end < 0:
+        return None
+    return raw_content[end + len(THINK_CLOSE):].strip()
+
+
+def _filter_lines(raw_content: str, phrases: Iterable[str], min_words: int = 0) -> List[str]:
+    """Lignes non vides sans phrase de raisonnement (de plus de min_words mots), sans blancs de bord."""
+    kept = []
+    for line in raw_content.split('\n'):
+        line = line.strip()
+        if not line or any(phrase in line.lower() for phrase in phrases):
+            continue
+        if len(line.split()) > min_words:
+            kept.append(line)
+    return kept
+
+
+def extract_article_html(raw_content: str) -> str:
+    """
+    Contenu final d'un article généré par un modèle qui expose son raisonnement.
+
+    Ordre : texte après </think>, HTML à partir du premier <h1>, puis du premier paragraphe ou titre,
+    lignes sans raisonnement, réponse brute.
+    """
+    final_content = strip_reasoning(raw_content)
+    if final_content and len(final_content) > 100:
+        logger.info(f"Extraction <think>: {len(final_content)} caractères")
+        return final_content
+
+    for pattern, min_length, label in ((H1_START_PATTERN, 200, '<h1>'), (HTML_START_PATTERN, 150, 'HTML')):
+        match = pattern.search(raw_content)
+        if match:
+            html_content = raw_content[match.start():].strip()
+            if len(html_content) > min_length:
+                logger.info(f"Extraction {label}: {len(html_content)} caractères")
+                return html_content
+
+    filtered_content = '\n'.join(_filter_lines(raw_content, ARTICLE_REASONING_PHRASES)).strip()
+    if len(filtered_content) > 200:
+        logger.info(f"Extraction filtrée: {len(filtered_content)} caractères")
+        return filtered_content
+
+    logger.warning(f"Aucune extraction spécifique, utilisation contenu brut: {len(raw_content)} caractères")
+    return raw_content
+
+
+def extract_summary(raw_content: str) -> str:
+    """Texte d'un résumé sans raisonnement (phrases de plus de 3 mots)."""
+    final_content = strip_reasoning(raw_content)
+    if final_content and len(final_content) > 20:
+        return final_content
+
+    lines = _filter_lines(raw_content, SUMMARY_REASONING_PHRASES, min_words=3)
+    return '\n'.join(lines) if lines else raw_content
+
+
+def clean_summary(summary: str) -> str:
+    """Retire le préfixe 'Résumé :' ajouté par le modèle."""
+    return SUMMARY_PREFIX_PATTERN.sub('', summary.strip())
+
+
+def clean_generated_content(content: str) -> str:
+    """Nettoie le HTML généré : préfixe, espaces dans les balises, titres dupliqués, <h1> non fermé."""
+    content = ARTICLE_PREFIX_PATTERN.sub('', content)
+    content = PADDED_TAG_PATTERN.sub(lambda m: f'<{m.group(1).strip()}>', content)
+    content = DUPLICATE_HEADING_PATTERN.sub(r'\1', content)
+
+    # Assurer les balises fermantes
+    if '<h1>' in content and '</h1>' not in content:
+        content = content.replace('\n', '</h1>\n', 1)
+
+    return content.strip()
+
+
+def element_span(html: str, tag: str, start: int = 0) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Position du premier élément <tag>...</tag> à partir de start, en un seul passage.
+
+    Returns:
+        (début de l'ouverture, début du contenu, fin du contenu, fin de la fermeture), ou None
+    """
+    open_pattern, close_pattern = ELEMENT_PATTERNS[tag]
+    opening = open_pattern.search(html, start)
+    if not opening:
+        return None
+    closing = close_pattern.search(html, opening.end())
+    if not closing:
+        # Aucune fermeture après la première ouverture : aucune après les suivantes non plus
+        return None
+    return opening.start(), opening.end(), closing.start(), closing.end()
+
+
+def element_text(html: str, tag: str) -> Optional[str]:
+    """Texte (balises retirées) du premier élément <tag>, ou None s'il est absent."""
+    span = element_span(html, tag)
+    if span is None:
+        return None
+    return TAG_PATTERN.sub('', html[span[1]:span[2]]).strip()
+
+
+def extract_metadata(content: str) -> Dict:
+    """Titre (<h1>) et meta description (premier paragraphe, 160 caractères) du contenu généré."""
+    metadata = {}
+
+    title = element_text(content, 'h1')
+    if title is not None:
+        metadata['title'] = title
+
+    first_p = element_text(content, 'p')
+    if first_p is not None:
+        if len(first_p) > DESCRIPTION_LENGTH:
+            metadata['description'] = first_p[:DESCRIPTION_LENGTH - 3] + '...'
+        else:
+            metadata['description'] = first_p
+
+    return metadata
+
+
+def ensure_valid_title(html_content: str) -> str:
+    """Garantit un <h1> de 35 à 80 caractères : sinon titre tiré du premier paragraphe, remplacé ou inséré."""
+    title_span = element_span(html_content, 'h1')
+    title_text = TAG_PATTERN.sub('', html_content[title_span[1]:title_span[2]]).strip() if title_span else ''
+    if title_span and TITLE_MIN_LENGTH <= len(title_text) <= TITLE_MAX_LENGTH:
+        return html_content
+
+    # Titre de secours à partir du premier paragraphe
+    words = (element_text(html_content, 'p') or '').split()[:12]
+    fallback_title = ' '.join(words)
+    if len(fallback_title) < TITLE_MIN_LENGTH:
+        fallback_title += ' - Séminaire dans les Vosges'
+    if len(fallback_title) > FALLBACK_TITLE_LENGTH:
+        fallback_title = fallback_title[:FALLBACK_TITLE_LENGTH].rsplit(' ', 1)[0] + '...'
+
+    if not title_span:
+        return f'<h1>{fallback_title}</h1>\n' + html_content
+
+    # Remplacement de chaque <h1> en un seul passage
+    parts, position = [], 0
+    while title_span:
+        parts += [html_content[position:title_span[0]], f'<h1>{fallback_title}</h1>']
+        position = title_span[3]
+        title_span = element_span(html_content, 'h1', position)
+    parts.append(html_content[position:])
+    return ''.join(parts)
+
+
+# ----------------------------------------------------------------------
+# Benchmark
+# ----------------------------------------------------------------------
+def synthetic_response(size: int) -> str:
+    """
+    Réponse synthétique d'environ size caractères, défavorable aux expressions avec retour arrière :
+    raisonnement parsemé d'ouvertures <think> et <h1> sans fermeture, puis l'article.
+    """
+    reasoning = "Je dois structurer l'article <think> puis un titre <h1 class=\"x\"> sans fermeture. "
+    article = ('<h1>Séminaire d\'entreprise dans les Vosges</h1>\n'
+               + '<p>Un séminaire au calme, entre lacs et forêts, pour renforcer la cohésion.</p>\n' * 20)
+    repeat = max(1, (size - len(article)) // len(reasoning))
+    return THINK_OPEN + reasoning * repeat + THINK_CLOSE + '\n' + article
+
+
+def benchmark(sizes: Iterable[int] = (10_000, 100_000, 1_000_000), repeat: int = 3) -> List[Dict]:
+    """
+    Temps de post-traitement (meilleur de repeat exécutions) par taille de réponse.
+
+    Sans bloc <think> fermé ni <h1> fermé, chaque étape reste un passage linéaire sur la réponse.
+    """
+    steps = {
+        'extract_article_html': extract_article_html,
+        'extract_summary': extract_summary,
+        'clean_generated_content': clean_generated_content,
+        'extract_metadata': extract_metadata,
+        'ensure_valid_title': ensure_valid_title,
+    }
+    results = []
+    for size in sizes:
+        response = synthetic_response(size)
+        # Variante sans fermeture : le cas le plus coûteux pour les anciennes expressions
+        unclosed = response.replace(THINK_CLOSE, '').replace('</h1>', '')
+        for name, step in steps.items():
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                step(response)
+                step(unclosed)
+                best = min(best, time.perf_counter() - start)
+            results.append({'step': name, 'size': len(response), 'seconds': best})
+    return results
+
+
+def main():
+    """Point d'entrée CLI : benchmark du post-traitement."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="LLM Output - Seminary Blog")
+    parser.add_argument('--benchmark', action='store_true', help='Mesurer le post-traitement sur des réponses synthétiques')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help='Tailles des réponses synthétiques (caractères)')
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.print_help()
+        return
+
+    for result in benchmark(args.sizes):
+        print(f"{result['step']:24} {result['size']:>9} caractères  {result['seconds'] * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
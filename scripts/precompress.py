@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Precompress - Versions gzip et brotli pré-compressées des fichiers publiés
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module prépare le site pour un serveur statique ou un CDN servant des fichiers pré-compressés :
+1. Fichier frère .gz (niveau 9) et .br (qualité 11, si le module brotli est installé) pour chaque
+   page HTML, feuille CSS, script JS, XML (sitemap, flux) et JSON (index de recherche)
+2. Seuls les fichiers modifiés sont recompressés (hash du contenu dans data/precompress.json ;
+   mtime/taille seulement dans le cache de stat local, ignoré par git)
+3. Compression en parallèle dans plusieurs processus quand les fichiers sont nombreux
+4. Sortie déterministe (gzip sans horodatage) : un fichier inchangé donne les mêmes octets
+5. Rapport des taux de compression par type de fichier
+"""
+
+import os
+import gzip
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from image_cache import atomic_write_bytes, atomic_write_text
+from stat_cache import STAT_CACHE_DIR, StatCache
+
+try:
+    import brotli
+except ImportError:  # Optionnel : seuls les fichiers .gz sont produits
+    brotli = None
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PRECOMPRESS_STATE = Path("data") / "precompress.json"
+PRECOMPRESS_STAT_CACHE = STAT_CACHE_DIR / "precompress.json"
+CODECS = ('.gz', '.br') if brotli is not None else ('.gz',)
+COMPRESSIBLE_SUFFIXES = ('.html', '.css', '.js', '.xml', '.json')
+# Fichiers et répertoires publiés (relatifs à la racine du site)
+PUBLISHED_FILES = ('index.html', 'feed.xml')
+PUBLISHED_GLOBS = ('sitemap*.xml',)
+PUBLISHED_DIRS = ('articles', 'archive', 'topics', 'search', 'assets')
+
+# En dessous, l'en-tête de compression annule le gain
+MIN_SIZE = 256
+PARALLEL_THRESHOLD = 8
+
+
+def published_files(root: Path = Path(".")) -> List[Path]:
+    """Fichiers publiés compressibles du site."""
+    root = Path(root)
+    files = [root / name for name in PUBLISHED_FILES]
+    for pattern in PUBLISHED_GLOBS:
+        files += sorted(root.glob(pattern))
+    for directory in PUBLISHED_DIRS:
+        files += sorted(path for path in (root / directory).rglob('*') if path.is_file())
+    return [path for path in files if path.is_file() and path.suffix in COMPRESSIBLE_SUFFIXES]
+
+
+def compress_file(path: str) -> Tuple[str, int, Dict[str, int]]:
+    """
+    Écrit les versions compressées d'un fichier (fonction de module : exécutable dans un processus séparé).
+
+    Returns:
+        (chemin, taille originale, {extension: taille compressée})
+    """
+    data = Path(path).read_bytes()
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['.br'] = brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+
+    sizes = {}
+    for extension, compressed in variants.items():
+        target = Path(path + extension)
+        if len(compressed) >= len(data):
+            # Aucun gain : le serveur enverra le fichier original
+            target.unlink(missing_ok=True)
+            continue
+        atomic_write_bytes(target, compressed)
+        sizes[extension] = len(compressed)
+    return path, len(data), sizes
+
+
+class Precompressor:
+    """Compression incrémentale des fichiers publiés."""
+
+    def __init__(self, state_file: Path = PRECOMPRESS_STATE, workers: Optional[int] = None,
+                 stat_cache_file: Optional[Path] = PRECOMPRESS_STAT_CACHE):
+        """
+        Initialise le compresseur.
+
+        Args:
+            state_file: Hash et tailles compressées de chaque fichier traité
+            workers: Nombre de processus de compression (nombre de CPU par défaut)
+            stat_cache_file: Cache local des hash par (mtime, taille) (None : en mémoire)
+        """
+        self.state_file = Path(state_file)
+        self.stat_cache = StatCache(stat_cache_file)
+        self.workers = workers or os.cpu_count() or 1
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict:
+        """Charge l'état (vide si absent ou corrompu)."""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == 1:
+                return state
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        return {'version': 1, 'files': {}}
+
+    def _save_state(self) -> None:
+        atomic_write_text(self.state_file, json.dumps(self.state, indent=2, ensure_ascii=False, sort_keys=True))
+
+    def _is_current(self, path: Path, entry: Optional[Dict]) -> bool:
+        """Vrai si les versions compressées du fichier sont à jour (même hash de contenu)."""
+        if (not entry or entry.get('codecs') != list(CODECS)
+                or not all(Path(f"{path}{extension}").exists() for extension in entry['sizes'])):
+            return False
+        return entry['hash'] == self.stat_cache.file_hash(path)
+
+    def run(self, files: Iterable[Path]) -> Dict:
+        """
+        Compresse les fichiers nouveaux ou modifiés et supprime les versions compressées orphelines.
+
+        Args:
+            files: Fichiers publiés (voir published_files)
+
+        Returns:
+            Rapport : fichiers compressés et tailles totales par type
+        """
+        entries = self.state['files']
+        before = json.dumps(self.state, sort_keys=True)
+        files = [Path(path) for path in files]
+        pending = []
+        for path in files:
+            if path.stat().st_size < MIN_SIZE:
+                continue
+            if not self._is_current(path, entries.get(str(path))):
+                pending.append(str(path))
+
+        if len(pending) >= PARALLEL_THRESHOLD and self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(compress_file, pending, chunksize=max(1, len(pending) // (self.workers * 4))))
+        else:
+            results = [compress_file(path) for path in pending]
+
+        for path, size, sizes in results:
+            entries[path] = {
+                'size': size,
+                'hash': self.stat_cache.file_hash(Path(path)),
+                'sizes': sizes,
+                'codecs': list(CODECS)
+            }
+
+        # Fichiers supprimés (ou devenus trop petits) : versions compressées orphelines
+        kept = {str(path) for path in files if str(path) in entries and path.stat().st_size >= MIN_SIZE}
+        for path in set(entries) - kept:
+            for extension in ('.gz', '.br'):
+                Path(f"{path}{extension}").unlink(missing_ok=True)
+            del entries[path]
+
+        self.state['report'] = self.report()
+        if json.dumps(self.state, sort_keys=True) != before:
+            self._save_state()
+        self.stat_cache.save()
+        report = dict(self.state['report'], compressed=len(results))
+        logger.info(f"Pré-compression: {len(results)} fichier(s) compressé(s) sur {len(entries)}"
+                    f"{'' if brotli else ' (brotli non installé : .gz uniquement)'}")
+        return report
+
+    def report(self) -> Dict:
+        """Tailles originales et compressées par type de fichier, avec taux de compression."""
+        totals: Dict[str, Dict[str, int]] = {}
+        for path, entry in self.state['files'].items():
+            for suffix in (Path(path).suffix, 'total'):
+                bucket = totals.setdefault(suffix, {'files': 0, 'original': 0, '.gz': 0, '.br': 0})
+                bucket['files'] += 1
+                bucket['original'] += entry['size']
+                for extension in ('.gz', '.br'):
+                    # Sans version compressée (aucun gain), le fichier original est servi
+                    bucket[extension] += entry['sizes'].get(extension, entry['size'])
+        for bucket in totals.values():
+            for extension in ('.gz', '.br'):
+                bucket[f"ratio{extension}"] = round(bucket[extension] / bucket['original'], 3) if bucket['original'] else 1.0
+        return totals
+
+
+def main():
+    """Point d'entrée CLI : pré-compression des fichiers publiés et rapport."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Precompress - Seminary Blog")
+    parser.add_argument('--workers', type=int, help='Nombre de processus de compression')
+    args = parser.parse_args()
+
+    report = Precompressor(workers=args.workers).run(published_files())
+    print(f"Fichiers compressés: {report.pop('compressed')}")
+    for suffix, bucket in sorted(report.items()):
+        line = f"  {suffix:6} {bucket['files']:5} fichier(s) {bucket['original'] / 1024:9.1f} Ko → gzip {bucket['ratio.gz']:.1%}"
+        if brotli is not None:
+            line += f", brotli {bucket['ratio.br']:.1%}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rate Limiter - Limitation de débit partagée entre processus
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module maintient un token bucket par API (Unsplash, OpenRouter) :
+1. État persistant dans data/rate_limits.json, partagé entre runs et processus
+2. Verrou fichier (fcntl) autour de chaque lecture/modification
+3. Synchronisation sur les en-têtes X-Ratelimit-* renvoyés par les API
+4. Blocage temporaire après une réponse 403/429
+"""
+
+import json
+import time
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+from image_cache import atomic_write_text
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou inter-processus
+    fcntl = None
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Capacité (requêtes) et période de remplissage (secondes) par défaut
+DEFAULT_BUCKETS = {
+    'unsplash': {'capacity': 50, 'period': 3600},
+    'openrouter': {'capacity': 20, 'period': 60}
+}
+
+
+class RateLimiter:
+    """Token buckets persistants, un par API, protégés par un verrou fichier."""
+
+    def __init__(self, state_file: Path = Path("data/rate_limits.json")):
+        """
+        Initialise le limiteur.
+
+        Args:
+            state_file: Fichier JSON contenant l'état des buckets
+        """
+        self.state_file = Path(state_file)
+        self.lock_file = self.state_file.with_name(self.state_file.name + '.lock')
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        self._buckets = {api: dict(config) for api, config in DEFAULT_BUCKETS.items()}
+
+    def configure(self, api: str, capacity: int, period: float) -> None:
+        """Définit la capacité et la période du bucket d'une API."""
+        self._buckets[api] = {'capacity': capacity, 'period': period}
+
+    # ------------------------------------------------------------------
+    # État partagé
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _locked_state(self, save: bool = True):
+        """
+        Verrouille le fichier d'état et fournit l'état courant.
+
+        Args:
+            save: Sauvegarder l'état en sortie s'il a été modifié (False : lecture seule)
+        """
+        with open(self.lock_file, 'a') as lock:
+            if fcntl:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                state = self._read_state()
+                before = json.dumps(state, sort_keys=True)
+                yield state
+                if save and json.dumps(state, sort_keys=True) != before:
+                    atomic_write_text(self.state_file, json.dumps(state, indent=2, ensure_ascii=False))
+            finally:
+                if fcntl:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def _read_state(self) -> Dict:
+        """Lit l'état des buckets (vide si absent ou corrompu)."""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _refill(self, state: Dict, api: str, now: float) -> Dict:
+        """Met à jour le bucket d'une API selon le temps écoulé."""
+        config = self._buckets.get(api, DEFAULT_BUCKETS['openrouter'])
+        capacity = config['capacity']
+        bucket = state.setdefault(api, {'tokens': float(capacity), 'updated': now, 'blocked_until': 0})
+
+        elapsed = max(0.0, now - bucket.get('updated', now))
+        bucket['tokens'] = min(float(capacity), bucket.get('tokens', capacity) + elapsed * capacity / config['period'])
+        bucket['updated'] = now
+        bucket['capacity'] = capacity
+        return bucket
+
+    # ------------------------------------------------------------------
+    # API publique
+    # ------------------------------------------------------------------
+    def try_acquire(self, api: str, tokens: float = 1.0) -> bool:
+        """Consomme des jetons si disponibles, sans attendre."""
+        return self._acquire_or_wait_time(api, tokens) == 0.0
+
+    def acquire(self, api: str, tokens: float = 1.0, timeout: float = 120.0) -> bool:
+        """Attend jusqu'à `timeout` secondes qu'un jeton soit disponible puis le consomme."""
+        deadline = time.time() + timeout
+        while True:
+            wait = self._acquire_or_wait_time(api, tokens)
+            if wait == 0.0:
+                return True
+            if time.time() + wait > deadline:
+                logger.warning(f"Limite de requêtes {api} atteinte (attente estimée {wait:.0f}s)")
+                return False
+            logger.info(f"Limite de requêtes {api}: attente de {wait:.1f}s")
+            time.sleep(wait)
+
+    def _acquire_or_wait_time(self, api: str, tokens: float) -> float:
+        """Consomme les jetons et retourne 0, ou retourne le délai d'attente nécessaire."""
+        now = time.time()
+        with self._locked_state() as state:
+            bucket = self._refill(state, api, now)
+            if bucket.get('blocked_until', 0) > now:
+                return bucket['blocked_until'] - now
+            if bucket['tokens'] >= tokens:
+                bucket['tokens'] -= tokens
+                return 0.0
+            config = self._buckets.get(api, DEFAULT_BUCKETS['openrouter'])
+            return (tokens - bucket['tokens']) * config['period'] / config['capacity']
+
+    def sync_from_headers(self, api: str, headers: Optional[Mapping]) -> None:
+        """
+        Aligne le bucket sur les en-têtes X-Ratelimit-Remaining / X-Ratelimit-Reset.
+
+        Args:
+            api: Nom de l'API ('unsplash', 'openrouter')
+            headers: En-têtes HTTP de la réponse (insensibles à la casse avec requests)
+        """
+        if not headers:
+            return
+        remaining = headers.get('X-Ratelimit-Remaining')
+        if remaining is None:
+            return
+        try:
+            remaining = float(remaining)
+        except (TypeError, ValueError):
+            return
+
+        now = time.time()
+        with self._locked_state() as state:
+            bucket = self._refill(state, api, now)
+            # Le serveur fait foi : on ne garde jamais plus de jetons qu'il n'en reste réellement
+            bucket['tokens'] = min(bucket['tokens'], remaining)
+            if remaining <= 0:
+                bucket['blocked_until'] = max(bucket.get('blocked_until', 0), self._reset_time(headers, api, now))
+
+    def block(self, api: str, retry_after: Optional[float] = None) -> None:
+        """Vide le bucket après un 403/429 et bloque jusqu'à `retry_after` secondes."""
+        now = time.time()
+        config = self._buckets.get(api, DEFAULT_BUCKETS['openrouter'])
+        with self._locked_state() as state:
+            bucket = self._refill(state, api, now)
+            bucket['tokens'] = 0.0
+            delay = retry_after if retry_after is not None else config['period'] / config['capacity']
+            bucket['blocked_until'] = max(bucket.get('blocked_until', 0), now + delay)
+
+    def _reset_time(self, headers: Mapping, api: str, now: float) -> float:
+        """Calcule l'instant de réinitialisation du quota à partir des en-têtes."""
+        reset = headers.get('X-Ratelimit-Reset')
+        if reset is not None:
+            try:
+                reset = float(reset)
+                # OpenRouter renvoie un timestamp en millisecondes
+                if reset > 1e11:
+                    return reset / 1000
+                # Valeur antérieure à maintenant : délai en secondes, pas un timestamp
+                return now + reset if reset < now else reset
+            except (TypeError, ValueError):
+                pass
+        return now + self._buckets.get(api, DEFAULT_BUCKETS['openrouter'])['period']
+
+    def status(self, api: str) -> Dict:
+        """Retourne l'état courant du bucket d'une API (lecture seule : le fichier d'état n'est pas réécrit)."""
+        now = time.time()
+        with self._locked_state(save=False) as state:
+            bucket = self._refill(state, api, now)
+            return {
+                'capacity': bucket['capacity'],
+                'remaining': int(bucket['tokens']),
+                'blocked': bucket.get('blocked_until', 0) > now
+            }
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Search Index - Index de recherche statique pour le blog
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module construit un index inversé interrogé directement par le navigateur :
+1. Tokenisation du titre, de la description et du corps des articles (minuscules, accents repliés)
+2. Racinisation légère du français (pluriels et suffixes courants) et mots vides exclus
+3. Index découpé par préfixe de 2 caractères (search/<préfixe>.json) : une requête ne charge
+   que les fragments de ses termes
+4. Postings compacts : identifiants d'articles encodés en delta, poids entiers (titre > description > corps)
+5. Mise à jour incrémentale : un nouvel article ne réécrit que les fragments de ses termes
+6. Règles de tokenisation publiées dans search/meta.json (le script de l'index applique les mêmes)
+"""
+
+import re
+import json
+import logging
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+from article_catalog import ArticleCatalog
+from image_cache import atomic_write_text
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SEARCH_DIR = Path("search")
+ARTICLES_DIR = Path("articles")
+
+# Incrémenter quand les règles de tokenisation changent : l'index est alors reconstruit
+INDEX_VERSION = 1
+SHARD_PREFIX = 2
+MIN_STEM = 3
+FIELD_WEIGHTS = {'title': 3, 'description': 2, 'content': 1}
+
+# Suffixes retirés (après repli des accents et du pluriel), du plus long au plus court
+SUFFIXES = ('issement', 'atrice', 'ateur', 'ation', 'ement', 'ence', 'ance', 'euse', 'ique',
+            'isme', 'iste', 'able', 'ite', 'eu', 'ive', 'if', 'ee', 'er', 'e')
+
+STOPWORDS = frozenset("""
+au aux avec ce ces cet cette dans de des du elle en et eux il ils je la le les leur leurs lui ma mais me
+meme mes moi mon ne nos notre nous on ou par pas pour qu que qui sa se ses son sur ta te tes toi ton tu un une
+vos votre vous est sont ont fait etre avoir plus tout tous toute toutes comme ainsi aussi bien entre sans
+sous tres peut peuvent cela ceci ca dont lors chaque si the and
+""".split())
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+LIGATURES = str.maketrans({'œ': 'oe', 'æ': 'ae'})
+
+
+def fold(text: str) -> str:
+    """Minuscules et accents repliés ('Séminaire' → 'seminaire')."""
+    decomposed = unicodedata.normalize('NFD', text.lower().translate(LIGATURES))
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def stem(word: str) -> str:
+    """Racinisation légère du français, identique au script de recherche de l'index."""
+    if word.isdigit():
+        return word
+    if len(word) > MIN_STEM and word[-1] in 'sx':
+        word = word[:-1]
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+            return word[:-len(suffix)]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Termes indexés d'un texte (repliés, sans mots vides, racinisés)."""
+    return [stem(token) for token in TOKEN_PATTERN.findall(fold(text))
+            if len(token) > 1 and token not in STOPWORDS]
+
+
+def plain_text(html: str) -> str:
+    """Texte brut d'un titre ou d'une description (balises et entités HTML retirées)."""
+    return BeautifulSoup(html, 'html.parser').get_text(' ', strip=True)
+
+
+def _encode(postings: Dict[int, int]) -> List[int]:
+    """{id: poids} → [delta_id, poids, delta_id, poids...] (identifiants croissants)."""
+    encoded, previous = [], 0
+    for doc_id in sorted(postings):
+        encoded += [doc_id - previous, postings[doc_id]]
+        previous = doc_id
+    return encoded
+
+
+def _decode(encoded: List[int]) -> Dict[int, int]:
+    postings, doc_id = {}, 0
+    for position in range(0, len(encoded), 2):
+        doc_id += encoded[position]
+        postings[doc_id] = encoded[position + 1]
+    return postings
+
+
+class SearchIndexBuilder:
+    """Construction incrémentale de l'index de recherche découpé par préfixe."""
+
+    def __init__(self, output_dir: Path = SEARCH_DIR, catalog: Optional[ArticleCatalog] = None,
+                 articles_dir: Path = ARTICLES_DIR):
+        """
+        Initialise le builder.
+
+        Args:
+            output_dir: Répertoire publié de l'index (search/)
+            catalog: Catalogue des articles (corps lu depuis le catalogue avant le HTML publié)
+            articles_dir: Articles publiés (articles hors catalogue)
+        """
+        self.output_dir = Path(output_dir)
+        self.catalog = catalog
+        self.articles_dir = Path(articles_dir)
+
+    def _article_text(self, article: Dict) -> str:
+        """Corps de l'article en texte brut."""
+        record = self.catalog.get(article['filename']) if self.catalog else None
+        if record:
+            html = record['content']
+        else:
+            try:
+                html = (self.articles_dir / article['filename']).read_text(encoding='utf-8', errors='replace')
+            except OSError as e:
+                logger.warning(f"Article non indexé {article['filename']}: {e}")
+                return ''
+        soup = BeautifulSoup(html, 'html.parser')
+        content = soup.find('div', class_='article-content') or soup
+        return content.get_text(' ', strip=True)
+
+    def _terms(self, article: Dict) -> Dict[str, int]:
+        """Poids de chaque terme d'un article (occurrences pondérées par champ)."""
+        weights: Counter = Counter()
+        fields = {'title': plain_text(article.get('title', '')),
+                  'description': plain_text(article.get('description', '')),
+                  'content': self._article_text(article)}
+        for field, text in fields.items():
+            for term in tokenize(text):
+                weights[term] += FIELD_WEIGHTS[field]
+        return dict(weights)
+
+    def _load_shard(self, prefix: str) -> Dict[str, Dict[int, int]]:
+        try:
+            with open(self.output_dir / f"{prefix}.json", 'r', encoding='utf-8') as f:
+                return {term: _decode(encoded) for term, encoded in json.load(f).items()}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def build(self, articles: List[Dict], state: Dict) -> List[Path]:
+        """
+        Met à jour l'index pour les articles nouveaux, modifiés ou supprimés.
+
+        Args:
+            articles: Articles triés par date décroissante (filename, date, title, description,
+                      hash ou content_hash)
+            state: Identifiant, hash et fragments de chaque article indexé (mis à jour en place)
+
+        Returns:
+            Fichiers écrits
+        """
+        if state.get('version') != INDEX_VERSION:
+            # Règles changées (ou premier build) : reconstruction complète
+            for shard in self.output_dir.glob('*.json'):
+                shard.unlink()
+            state.clear()
+            state.update(version=INDEX_VERSION, next_id=0, docs={})
+
+        docs = state['docs']
+        current = {article['filename']: article for article in articles}
+        changed = [article for article in articles
+                   if docs.get(article['filename'], {}).get('hash') != (article.get('content_hash') or article['hash'])]
+        removed = [filename for filename in docs if filename not in current]
+        if not changed and not removed and (self.output_dir / 'docs.json').exists():
+            logger.info("Index de recherche à jour")
+            return []
+
+        # Postings à retirer (articles modifiés ou supprimés) et à ajouter, groupés par fragment
+        stale_ids: Dict[str, set] = {}
+        for filename in removed + [a['filename'] for a in changed if a['filename'] in docs]:
+            for prefix in docs[filename]['shards']:
+                stale_ids.setdefault(prefix, set()).add(docs[filename]['id'])
+        for filename in removed:
+            del docs[filename]
+
+        additions: Dict[str, Dict[str, Dict[int, int]]] = {}
+        for article in changed:
+            entry = docs.get(article['filename'])
+            doc_id = entry['id'] if entry else state['next_id']
+            if not entry:
+                state['next_id'] += 1
+            terms = self._terms(article)
+            prefixes = sorted({term[:SHARD_PREFIX] for term in terms})
+            for term, weight in terms.items():
+                additions.setdefault(term[:SHARD_PREFIX], {}).setdefault(term, {})[doc_id] = weight
+            docs[article['filename']] = {
+                'id': doc_id, 'hash': article.get('content_hash') or article['hash'], 'shards': prefixes
+            }
+
+        written = []
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        for prefix in sorted(set(stale_ids) | set(additions)):
+            shard = self._load_shard(prefix)
+            for term in list(shard):
+                for doc_id in stale_ids.get(prefix, ()):
+                    shard[term].pop(doc_id, None)
+                if not shard[term]:
+                    del shard[term]
+            for term, postings in additions.get(prefix, {}).items():
+                shard.setdefault(term, {}).update(postings)
+
+            output = self.output_dir / f"{prefix}.json"
+            if shard:
+                atomic_write_text(output, json.dumps({term: _encode(shard[term]) for term in sorted(shard)},
+                                                     separators=(',', ':')))
+                written.append(output)
+            else:
+                output.unlink(missing_ok=True)
+
+        # Table des articles (indexée par identifiant) et règles de tokenisation pour le navigateur
+        table: List[Optional[List[str]]] = [None] * state['next_id']
+        for filename, entry in docs.items():
+            article = current[filename]
+            table[entry['id']] = [filename, plain_text(article.get('title', '')), article.get('date', '')]
+        meta = {
+            'version': INDEX_VERSION, 'count': len(docs), 'shard_prefix': SHARD_PREFIX, 'min_stem': MIN_STEM,
+            'suffixes': SUFFIXES, 'stopwords': sorted(STOPWORDS)
+        }
+        for name, payload in (('docs.json', table), ('meta.json', meta)):
+            atomic_write_text(self.output_dir / name, json.dumps(payload, ensure_ascii=False, separators=(',', ':')))
+            written.append(self.output_dir / name)
+
+        logger.info(f"Index de recherche: {len(changed)} article(s) indexé(s), {len(removed)} retiré(s), "
+                    f"{len(written) - 2} fragment(s) réécrit(s)")
+        return written
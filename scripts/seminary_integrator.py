@@ -6,6 +6,8 @@ Seminary Blog System - Système de Blog Automatisé SEO-First
 
 Ce module injecte automatiquement des liens pertinents vers les pages
 Seminary dans les articles, en fonction du contexte et des mots-clés.
+Les liens peuvent être insérés directement dans un document BeautifulSoup
+déjà analysé (pipeline de génération) ou dans une chaîne HTML (CLI).
 """
 
 import re
@@ -387,33 +389,47 @@ class SeminaryIntegrator:
         """
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Trouver le contenu principal de l'article
-            content_div = soup.find('div', class_='article-content')
-            if not content_div:
-                logger.warning("Div article-content non trouvée, utilisation du body")
-                content_div = soup.find('body')
-            
-            if not content_div:
-                logger.error("Impossible de localiser le contenu à modifier")
+            if self.integrate_links_into_soup(soup, integration_plan) is None:
                 return html_content
-            
-            # Extraire le texte pour repérage des positions
-            text_content = content_div.get_text()
-            
-            # Intégrer chaque lien
-            links_added = 0
-            for link_info in integration_plan['recommended_links']:
-                if self._integrate_single_link(content_div, link_info, text_content):
-                    links_added += 1
-            
-            logger.info(f"Liens Seminary intégrés: {links_added}/{len(integration_plan['recommended_links'])}")
             return str(soup)
             
         except Exception as e:
             logger.error(f"Erreur lors de l'intégration des liens: {e}")
             return html_content
     
+    def integrate_links_into_soup(self, soup: BeautifulSoup, integration_plan: Dict) -> Optional[int]:
+        """
+        Intègre les liens Seminary dans un document déjà analysé (modifié en place).
+        
+        Args:
+            soup: Document de l'article
+            integration_plan: Plan d'intégration généré
+            
+        Returns:
+            Nombre de liens insérés, ou None si le contenu de l'article est introuvable
+        """
+        # Trouver le contenu principal de l'article
+        content_div = soup.find('div', class_='article-content')
+        if not content_div:
+            logger.warning("Div article-content non trouvée, utilisation du body")
+            content_div = soup.find('body')
+        
+        if not content_div:
+            logger.error("Impossible de localiser le contenu à modifier")
+            return None
+        
+        # Extraire le texte pour repérage des positions
+        text_content = content_div.get_text()
+        
+        # Intégrer chaque lien
+        links_added = 0
+        for link_info in integration_plan['recommended_links']:
+            if self._integrate_single_link(content_div, link_info, text_content):
+                links_added += 1
+        
+        logger.info(f"Liens Seminary intégrés: {links_added}/{len(integration_plan['recommended_links'])}")
+        return links_added
+    
     def _integrate_single_link(self, content_div: Tag, link_info: Dict, text_content: str) -> bool:
         """Intègre un seul lien dans la section de contenu."""
         try:
@@ -528,8 +544,24 @@ class SeminaryIntegrator:
         Returns:
             Résultat du traitement avec HTML modifié et statistiques
         """
-        # Extraire le contenu textuel pour analyse
+        # Un seul parsing : analyse et insertion des liens sur le même document
         soup = BeautifulSoup(html_content, 'html.parser')
+        result = self.process_document(soup, article_title)
+        result['modified_html'] = str(soup) if result['links_added'] else html_content
+        return result
+    
+    def process_document(self, soup: BeautifulSoup, article_title: str = "") -> Dict:
+        """
+        Traite un article déjà analysé : les liens sont insérés dans le document, modifié en place.
+        
+        Args:
+            soup: Document de l'article
+            article_title: Titre de l'article (optionnel)
+            
+        Returns:
+            Analyse, plan d'intégration et statistiques (sans HTML : le document est sérialisé par l'appelant)
+        """
+        # Extraire le contenu textuel pour analyse
         text_content = soup.get_text()
         
         if not article_title:
@@ -543,17 +575,19 @@ class SeminaryIntegrator:
         integration_plan = self.generate_integration_plan(analysis)
         
         # Intégrer les liens si le plan est viable
+        links_added = 0
         if integration_plan['confidence_score'] > 0.3:  # Seuil de confiance minimum
-            modified_html = self.integrate_links_into_html(html_content, integration_plan)
+            try:
+                links_added = self.integrate_links_into_soup(soup, integration_plan) or 0
+            except Exception as e:
+                logger.error(f"Erreur lors de l'intégration des liens: {e}")
         else:
-            modified_html = html_content
             logger.info("Plan d'intégration rejeté (confiance trop faible)")
         
         return {
-            'modified_html': modified_html,
             'analysis': analysis,
             'integration_plan': integration_plan,
-            'links_added': len(integration_plan['recommended_links']) if integration_plan['confidence_score'] > 0.3 else 0,
+            'links_added': links_added,
             'confidence_score': integration_plan['confidence_score']
         }
 
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Site Builder - Reconstruction incrémentale des articles publiés
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module sépare la source d'un article de son rendu HTML :
+1. Source structurée par article dans le catalogue SQLite (data/articles.db) : titre,
+   description, contenu, date, images et liens retenus
+2. Graphe de dépendances par page (data/site_build.json) : source et thèmes, template d'article
+   et mise en page de base, fragments styles/header/footer (CSS inclus)
+3. Re-rendu uniquement des pages dont une entrée a changé, en parallèle si elles sont nombreuses
+4. Build sans changement quasi instantané (une requête sur les hash du catalogue)
+5. Import des articles publiés avant le builder (extraction depuis leur HTML)
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from article_catalog import ArticleCatalog
+from image_cache import atomic_write_text
+from site_fragments import FRAGMENTS, SiteFragments
+from static_assets import minify_html
+from templating import BYTECODE_CACHE_DIR, get_environment, template_hash
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BUILD_MANIFEST = Path("data") / "site_build.json"
+ARTICLES_DIR = Path("articles")
+TEMPLATES_DIR = Path("templates")
+ARTICLE_TEMPLATE = "article_template.html"
+
+# En dessous de ce nombre de pages, le démarrage des processus coûte plus que le rendu
+PARALLEL_THRESHOLD = 16
+
+READING_TIME_PATTERN = re.compile(r'(\d+)\s*min')
+
+
+def _hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def extract_source(html: str, filename: str) -> Optional[Dict]:
+    """
+    Extrait la source structurée d'un article rendu avec le template.
+
+    Args:
+        html: HTML complet de l'article
+        filename: Nom du fichier publié
+
+    Returns:
+        Source de l'article, ou None si la page ne suit pas la structure du template
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    content_div = soup.find('div', class_='article-content')
+    title_tag = soup.find('h1', class_='article-title')
+    date_tag = soup.select_one('.article-meta .date')
+    if not content_div or not title_tag or not date_tag:
+        return None
+
+    description_tag = soup.find('meta', attrs={'name': 'description'})
+    reading_tag = soup.select_one('.article-meta .reading-time')
+    subtitle_tag = soup.find('p', class_='article-subtitle')
+    reading_match = READING_TIME_PATTERN.search(reading_tag.get_text(' ', strip=True)) if reading_tag else None
+
+    return {
+        'filename': filename,
+        'title': title_tag.get_text(' ', strip=True),
+        'description': description_tag.get('content', '') if description_tag else '',
+        'subtitle': subtitle_tag.get_text(' ', strip=True) if subtitle_tag else '',
+        'publish_date': date_tag.get_text(' ', strip=True),
+        'reading_time': int(reading_match.group(1)) if reading_match else 1,
+        'content': content_div.decode_contents().strip(),
+        'links': [a['href'] for a in content_div.find_all('a', href=True)],
+        'image_refs': []
+    }
+
+
+def render_page(templates_dir: str, fragments: Dict[str, str], source: Dict,
+                cache_dir: str = str(BYTECODE_CACHE_DIR)) -> str:
+    """
+    Rend un article minifié depuis sa source (fonction de module : exécutable dans un processus séparé).
+
+    Chaque processus réutilise l'environnement Jinja2 partagé : le template n'est compilé
+    qu'une fois (puis relu depuis le cache de bytecode par les builds suivants).
+    """
+    template = get_environment(templates_dir, cache_dir).get_template(ARTICLE_TEMPLATE)
+    return minify_html(template.render(
+        article_title=source['title'],
+        meta_description=source.get('description', ''),
+        article_subtitle=source.get('subtitle', ''),
+        article_content=source['content'],
+        publish_date=source.get('publish_date', ''),
+        reading_time=source.get('reading_time', 1),
+        filename=source['filename'],
+        tags=source.get('tags', []),
+        **{f'{name}_html': html for name, html in fragments.items()}
+    ))
+
+
+def _render_job(job: Tuple[str, Dict[str, str], Dict, str]) -> str:
+    return render_page(*job)
+
+
+class SiteBuilder:
+    """Reconstruction incrémentale des articles à partir de leurs sources structurées."""
+
+    def __init__(self, catalog: Optional[ArticleCatalog] = None, manifest_file: Path = BUILD_MANIFEST,
+                 output_dir: Path = ARTICLES_DIR, templates_dir: Path = TEMPLATES_DIR,
+                 fragments: Optional[SiteFragments] = None, workers: Optional[int] = None,
+                 cache_dir: Path = BYTECODE_CACHE_DIR):
+        """
+        Initialise le builder.
+
+        Args:
+            catalog: Catalogue des sources d'articles (data/articles.db par défaut)
+            manifest_file: Graphe de dépendances du dernier build
+            output_dir: Répertoire des articles publiés
+            templates_dir: Répertoire du template d'article et des fragments
+            fragments: Fragments styles/header/footer (créés depuis templates_dir par défaut)
+            workers: Nombre de processus de rendu (nombre de CPU par défaut)
+            cache_dir: Cache de bytecode Jinja2
+        """
+        self.catalog = catalog if catalog is not None else ArticleCatalog()
+        self.manifest_file = Path(manifest_file)
+        self.output_dir = Path(output_dir)
+        self.templates_dir = Path(templates_dir)
+        self.cache_dir = Path(cache_dir)
+        self.fragments = fragments or SiteFragments(self.templates_dir, cache_dir=self.cache_dir)
+        self.workers = workers or os.cpu_count() or 1
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> Dict:
+        """Charge le graphe de dépendances (vide si absent ou corrompu)."""
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == 1:
+                return manifest
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        return {'version': 1, 'pages': {}, 'unmanaged': []}
+
+    def _save_manifest(self) -> None:
+        atomic_write_text(self.manifest_file, json.dumps(self.manifest, indent=2, ensure_ascii=False, sort_keys=True))
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+    def save_source(self, source: Dict) -> str:
+        """Enregistre la source structurée d'un article dans le catalogue (retourne son hash)."""
+        return self.catalog.upsert(source)
+
+    def record_article(self, html_path: Path, **extra) -> Optional[Dict]:
+        """
+        Enregistre la source d'un article que le générateur vient de publier.
+
+        La page écrite est considérée à jour : le prochain build ne la re-rend
+        que si le template ou un fragment change.
+
+        Args:
+            html_path: Article publié
+            **extra: Champs complémentaires (image_refs, word_count, keywords, seo_score, metrics)
+
+        Returns:
+            Source enregistrée, ou None si la page ne suit pas la structure du template
+        """
+        html_path = Path(html_path)
+        html = html_path.read_text(encoding='utf-8')
+        source = extract_source(html, html_path.name)
+        if source is None:
+            logger.warning(f"Source non extractible, article non géré par le builder: {html_path.name}")
+            return None
+
+        source.update(extra)
+        self.manifest['pages'][html_path.name] = {
+            'deps': dict(self._input_hashes(), source=self.save_source(source)),
+            'output_hash': _hash(html.encode('utf-8'))
+        }
+        self._save_manifest()
+        return source
+
+    def import_published(self) -> int:
+        """Crée les sources des articles publiés qui n'en ont pas encore (articles antérieurs au builder)."""
+        if not self.output_dir.exists():
+            return 0
+        unmanaged = set(self.manifest.get('unmanaged', []))
+        known = self.catalog.hashes()
+
+        imported = 0
+        for page in sorted(self.output_dir.glob('*.html')):
+            if page.name in known or page.name in unmanaged:
+                continue
+            source = extract_source(page.read_text(encoding='utf-8'), page.name)
+            if source is None:
+                unmanaged.add(page.name)
+                logger.info(f"Article conservé tel quel (structure non reconnue): {page.name}")
+                continue
+            self.save_source(source)
+            imported += 1
+
+        self.manifest['unmanaged'] = sorted(unmanaged)
+        if imported:
+            logger.info(f"{imported} article(s) publié(s) importé(s) comme sources")
+        return imported
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+    def _input_hashes(self) -> Dict[str, str]:
+        """Hash des entrées communes à tous les articles (template et mise en page de base, fragments)."""
+        inputs = {'template': template_hash(ARTICLE_TEMPLATE, self.templates_dir, self.cache_dir)}
+        fragments = self.fragments.render()
+        for name in FRAGMENTS:
+            inputs[name] = _hash(fragments[name].encode('utf-8'))
+        return inputs
+
+    def build(self, force: bool = False) -> List[Path]:
+        """
+        Re-rend les articles dont la source, le template ou un fragment a changé.
+
+        Args:
+            force: Re-rendre tous les articles
+
+        Returns:
+            Articles réécrits
+        """
+        start_time = time.time()
+        unmanaged_before = list(self.manifest.get('unmanaged', []))
+        self.import_published()
+        inputs = self._input_hashes()
+        pages = self.manifest['pages']
+
+        # Hash de rendu de toutes les sources en une requête : aucune source n'est relue si rien n'a changé
+        current = self.catalog.render_hashes()
+        stale: List[Tuple[str, Dict]] = []
+        for filename, source_hash in sorted(current.items()):
+            entry = pages.get(filename)
+            if (not force and entry and entry['deps'] == dict(inputs, source=source_hash)
+                    and (self.output_dir / filename).exists()):
+                continue
+            stale.append((source_hash, self.catalog.get(filename)))
+
+        removed = set(pages) - set(current)
+        for filename in removed:
+            del pages[filename]
+
+        rewritten = self._render(stale, inputs) if stale else []
+        if stale or removed or self.manifest['unmanaged'] != unmanaged_before:
+            self._save_manifest()
+
+        logger.info(f"Build: {len(stale)} article(s) re-rendu(s), {len(rewritten)} réécrit(s) "
+                    f"sur {len(current)} en {time.time() - start_time:.2f}s")
+        return rewritten
+
+    def _render(self, stale: List[Tuple[str, Dict]], inputs: Dict[str, str]) -> List[Path]:
+        """Rend les articles obsolètes (en parallèle au-delà de PARALLEL_THRESHOLD) et écrit ceux qui changent."""
+        fragments = self.fragments.render()
+        jobs = [(str(self.templates_dir), fragments, source, str(self.cache_dir)) for _, source in stale]
+
+        if len(jobs) >= PARALLEL_THRESHOLD and self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                rendered = list(executor.map(_render_job, jobs, chunksize=max(1, len(jobs) // (self.workers * 4))))
+        else:
+            rendered = [_render_job(job) for job in jobs]
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        rewritten = []
+        for (source_hash, source), html in zip(stale, rendered):
+            filename = source['filename']
+            output = self.output_dir / filename
+            output_hash = _hash(html.encode('utf-8'))
+            previous = self.manifest['pages'].get(filename, {})
+            if previous.get('output_hash') != output_hash or not output.exists():
+                atomic_write_text(output, html)
+                rewritten.append(output)
+            self.manifest['pages'][filename] = {'deps': dict(inputs, source=source_hash), 'output_hash': output_hash}
+        return rewritten
+
+
+def main():
+    """Point d'entrée CLI : build incrémental des articles."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Site Builder - Seminary Blog")
+    parser.add_argument('--force', action='store_true', help='Re-rendre tous les articles')
+    parser.add_argument('--workers', type=int, help='Nombre de processus de rendu')
+    args = parser.parse_args()
+
+    rewritten = SiteBuilder(workers=args.workers).build(force=args.force)
+    print(f"Articles reconstruits: {len(rewritten)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Site Feeds - Sitemap XML et flux Atom du blog
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module expose les articles aux moteurs de recherche et aux lecteurs de flux :
+1. sitemap.xml : accueil, articles et pages d'archives, avec <lastmod> par page
+2. lastmod incrémental : la date n'avance que lorsque le hash de contenu d'une page change
+3. Index de sitemaps (sitemap.xml → sitemap-N.xml) au-delà de 50 000 URL
+4. Flux Atom (feed.xml) des derniers articles
+5. Construit depuis le manifeste de l'index, fichiers écrits atomiquement et seulement s'ils changent
+"""
+
+import json
+import hashlib
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from image_cache import atomic_write_text
+from templating import get_environment
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SITE_URL = "https://blog.goseminary.com"
+SITEMAP_FILE = "sitemap.xml"
+FEED_FILE = "feed.xml"
+MAX_SITEMAP_URLS = 50000  # Limite du protocole sitemaps.org par fichier
+FEED_SIZE = 20
+
+
+class SiteFeeds:
+    """Génération incrémentale du sitemap et du flux Atom."""
+
+    def __init__(self, output_dir: Path = Path("."), templates_dir: Path = Path("templates"),
+                 site_url: str = SITE_URL, feed_size: int = FEED_SIZE,
+                 max_sitemap_urls: int = MAX_SITEMAP_URLS):
+        """
+        Initialise le générateur.
+
+        Args:
+            output_dir: Racine du site publié (sitemap.xml, feed.xml)
+            templates_dir: Répertoire contenant sitemap.xml, sitemap_index.xml et feed.xml
+            site_url: URL publique du blog, sans slash final
+            feed_size: Nombre d'articles du flux Atom
+            max_sitemap_urls: Nombre maximal d'URL par fichier sitemap
+        """
+        self.output_dir = Path(output_dir)
+        self.templates_dir = Path(templates_dir)
+        self.site_url = site_url.rstrip('/')
+        self.feed_size = feed_size
+        self.max_sitemap_urls = max_sitemap_urls
+
+    def _url(self, path: str) -> str:
+        """URL absolue d'une page (caractères non ASCII encodés, comme l'exige le protocole sitemap)."""
+        return f"{self.site_url}/{quote(path)}"
+
+    # ------------------------------------------------------------------
+    # Dates de modification
+    # ------------------------------------------------------------------
+    def _lastmods(self, pages: Dict[str, Dict], state: Dict, today: str) -> Dict[str, str]:
+        """
+        Date de dernière modification de chaque page, avancée seulement quand son hash change.
+
+        Args:
+            pages: {chemin: {'hash': ..., 'date': date de première publication (optionnelle)}}
+            state: Hash et lastmod connus (mis à jour en place)
+            today: Date du build (AAAA-MM-JJ)
+        """
+        known = state.setdefault('pages', {})
+        lastmods = {}
+        for path, page in pages.items():
+            entry = known.get(path)
+            if not entry:
+                # Première apparition : date de publication de l'article, ou date du build
+                entry = known[path] = {'hash': page['hash'], 'lastmod': page.get('date') or today}
+            elif entry['hash'] != page['hash']:
+                entry.update(hash=page['hash'], lastmod=today)
+            lastmods[path] = entry['lastmod']
+        for path in set(known) - set(pages):
+            del known[path]
+        return lastmods
+
+    # ------------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------------
+    def build(self, articles: List[Dict], archive_pages: Dict[str, str], state: Dict,
+              today: Optional[str] = None) -> List[Path]:
+        """
+        Met à jour sitemap.xml et feed.xml.
+
+        Args:
+            articles: Articles triés par date décroissante (filename, date, title, description,
+                      hash ou content_hash)
+            archive_pages: Signature de chaque page d'archives {chemin relatif: signature}
+            state: État du build précédent (mis à jour en place)
+            today: Date du build (AAAA-MM-JJ, date UTC courante par défaut)
+
+        Returns:
+            Fichiers écrits
+        """
+        today = today or datetime.now(timezone.utc).date().isoformat()
+        pages = {
+            f"articles/{article['filename']}": {
+                'hash': article.get('content_hash') or article['hash'],
+                'date': article['date']
+            }
+            for article in articles
+        }
+        # Ordre stable (le manifeste rechargé depuis JSON a ses clés triées)
+        pages.update({f"archive/{path}": {'hash': archive_pages[path]} for path in sorted(archive_pages)})
+        lastmods = self._lastmods(pages, state, today)
+
+        # L'accueil change avec l'article modifié le plus récemment
+        home_lastmod = max((lastmods[path] for path in pages if path.startswith('articles/')), default=today)
+        urls = [{'loc': self._url(''), 'lastmod': home_lastmod}]
+        urls += [{'loc': self._url(path), 'lastmod': lastmods[path]} for path in pages]
+        entries = [
+            dict(article, url=self._url(f"articles/{article['filename']}"),
+                 lastmod=lastmods[f"articles/{article['filename']}"])
+            for article in articles[:self.feed_size]
+        ]
+
+        # Rien à réécrire si les URL, leurs dates et les entrées du flux sont inchangées
+        signature = hashlib.sha256(json.dumps(
+            [urls, [[e['url'], e['title'], e['description'], e['date'], e['lastmod']] for e in entries]],
+            ensure_ascii=False
+        ).encode('utf-8')).hexdigest()[:16]
+        outputs = state.get('outputs', [])
+        if state.get('signature') == signature and all((self.output_dir / name).exists() for name in outputs):
+            logger.info("Sitemap et flux inchangés")
+            return []
+
+        env = get_environment(self.templates_dir)
+        files = self._sitemap_files(env, urls)
+        files[FEED_FILE] = env.get_template("feed.xml").render(
+            site_url=self.site_url,
+            feed_url=self._url(FEED_FILE),
+            updated=max((entry['lastmod'] for entry in entries), default=today),
+            entries=entries
+        )
+
+        written = []
+        for name, content in files.items():
+            output = self.output_dir / name
+            if output.exists() and output.read_text(encoding='utf-8') == content:
+                continue
+            atomic_write_text(output, content)
+            written.append(output)
+
+        # Sitemaps découpés qui n'existent plus (le site est repassé sous la limite)
+        for name in set(outputs) - set(files):
+            (self.output_dir / name).unlink(missing_ok=True)
+
+        state.update(signature=signature, outputs=sorted(files))
+        logger.info(f"Sitemap: {len(urls)} URL, flux: {len(entries)} article(s), {len(written)} fichier(s) écrit(s)")
+        return written
+
+    def _sitemap_files(self, env, urls: List[Dict]) -> Dict[str, str]:
+        """sitemap.xml seul, ou index de sitemaps et fichiers sitemap-N.xml au-delà de la limite."""
+        template = env.get_template("sitemap.xml")
+        if len(urls) <= self.max_sitemap_urls:
+            return {SITEMAP_FILE: template.render(urls=urls)}
+
+        files = {}
+        sitemaps = []
+        for start in range(0, len(urls), self.max_sitemap_urls):
+            chunk = urls[start:start + self.max_sitemap_urls]
+            name = f"sitemap-{start // self.max_sitemap_urls + 1}.xml"
+            files[name] = template.render(urls=chunk)
+            sitemaps.append({'loc': self._url(name), 'lastmod': max(url['lastmod'] for url in chunk)})
+        files[SITEMAP_FILE] = env.get_template("sitemap_index.xml").render(sitemaps=sitemaps)
+        return files
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Site Fragments - Inclusion du header, du footer et des styles au build
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module remplace le chargement JavaScript (fetch) du header et du footer :
+1. Rendu des fragments templates/header.html et templates/footer.html (Jinja2, minifiés)
+2. Fragment de styles des articles : CSS critique inline + feuille partagée versionnée
+   (article.css et illustrations.css regroupées dans assets/)
+3. Cache des fragments rendus dans data/site_fragments.json, invalidé par le hash des sources
+4. Insertion entre marqueurs <!-- Seminary Header --> ... <!-- /Seminary Header -->
+5. Réécriture de l'index et des articles uniquement quand les fragments changent
+"""
+
+import re
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from image_cache import atomic_write_text
+from static_assets import ASSETS_DIR, minify_css, minify_html, publish_bundle
+from templating import BYTECODE_CACHE_DIR, get_environment
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FRAGMENTS = ('styles', 'header', 'footer')
+
+# Styles des articles (relatifs au répertoire des templates)
+CRITICAL_STYLESHEET = 'css/article_critical.css'
+ARTICLE_STYLESHEETS = ('css/article.css', 'css/illustrations.css')
+
+# Marqueur ouvrant seul (articles générés avant l'inclusion) ou bloc complet
+FRAGMENT_PATTERNS = {
+    name: re.compile(rf'<!-- Seminary {name.title()} -->(?:.*?<!-- /Seminary {name.title()} -->|)', re.DOTALL)
+    for name in FRAGMENTS
+}
+
+# Conteneurs remplis par fetch() dans les anciennes versions de l'index,
+# <style> complet dans les articles générés avant la feuille partagée
+LEGACY_PATTERNS = {
+    'styles': re.compile(r'<!-- Article-specific styles -->\s*<style>.*?</style>', re.DOTALL),
+    'header': re.compile(r'<div id="header-container"></div>'),
+    'footer': re.compile(r'<div id="footer-container"></div>')
+}
+LEGACY_FETCH_SCRIPT_PATTERN = re.compile(r'\s*<script>(?:(?!</script>).)*?fetch\(\'\./templates/(?:header|footer)\.html\'\).*?</script>', re.DOTALL)
+
+
+class SiteFragments:
+    """Fragments styles/header/footer pré-rendus et leur inclusion dans les pages publiées."""
+
+    def __init__(self, templates_dir: Path = Path("templates"), state_file: Path = Path("data/site_fragments.json"),
+                 assets_dir: Path = ASSETS_DIR, cache_dir: Path = BYTECODE_CACHE_DIR):
+        """
+        Initialise le gestionnaire de fragments.
+
+        Args:
+            templates_dir: Répertoire contenant styles.html, header.html, footer.html et css/
+            state_file: Cache des fragments rendus et hash de la dernière synchronisation
+            assets_dir: Répertoire publié de la feuille de style partagée
+            cache_dir: Cache de bytecode Jinja2
+        """
+        self.templates_dir = Path(templates_dir)
+        self.state_file = Path(state_file)
+        self.assets_dir = Path(assets_dir)
+        self.cache_dir = Path(cache_dir)
+        self.state = self._load_state()
+        self._fragments: Optional[Dict[str, str]] = None
+
+    def _load_state(self) -> Dict:
+        """Charge l'état (vide si absent ou corrompu)."""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_state(self) -> None:
+        atomic_write_text(self.state_file, json.dumps(self.state, indent=2, ensure_ascii=False))
+
+    def _source_hash(self) -> str:
+        """Hash des sources des fragments (templates et feuilles de style)."""
+        digest = hashlib.sha256()
+        sources = [f"{name}.html" for name in FRAGMENTS] + [CRITICAL_STYLESHEET, *ARTICLE_STYLESHEETS]
+        for source in sources:
+            digest.update((self.templates_dir / source).read_bytes())
+        return digest.hexdigest()[:16]
+
+    def stylesheet_href(self, url_prefix: str = '../assets/') -> str:
+        """Publie la feuille partagée des articles (si absente) et retourne son URL versionnée."""
+        return url_prefix + publish_bundle(
+            'article', [self.templates_dir / source for source in ARTICLE_STYLESHEETS], self.assets_dir
+        )
+
+    # ------------------------------------------------------------------
+    # Rendu
+    # ------------------------------------------------------------------
+    def render(self) -> Dict[str, str]:
+        """
+        Retourne les fragments rendus {styles, header, footer}, depuis le cache si les sources n'ont pas changé.
+        """
+        if self._fragments is not None:
+            return self._fragments
+
+        source_hash = self._source_hash()
+        stylesheet_href = self.stylesheet_href()
+        cached = self.state.get('fragments')
+        if cached and self.state.get('source_hash') == source_hash:
+            self._fragments = cached
+            return cached
+
+        env = get_environment(self.templates_dir, self.cache_dir)
+        context = {
+            'critical_css': minify_css((self.templates_dir / CRITICAL_STYLESHEET).read_text(encoding='utf-8')),
+            'stylesheet_href': stylesheet_href
+        }
+        self._fragments = {name: minify_html(env.get_template(f"{name}.html").render(context)) for name in FRAGMENTS}
+        self.state.update({
+            'source_hash': source_hash,
+            'fragments_hash': hashlib.sha256(json.dumps(self._fragments, sort_keys=True).encode('utf-8')).hexdigest()[:16],
+            'fragments': self._fragments
+        })
+        self._save_state()
+        logger.info(f"Fragments styles/header/footer rendus ({', '.join(f'{n}: {len(h)} caractères' for n, h in self._fragments.items())})")
+        return self._fragments
+
+    def block(self, name: str) -> str:
+        """Bloc complet d'un fragment, entouré de ses marqueurs."""
+        return f"<!-- Seminary {name.title()} -->{self.render()[name]}<!-- /Seminary {name.title()} -->"
+
+    def inline(self, html: str) -> str:
+        """
+        Insère (ou remplace) les styles, le header et le footer dans une page.
+
+        Les conteneurs chargés par fetch() et le script correspondant sont supprimés ;
+        le <style> complet des anciens articles est remplacé par le fragment de styles.
+        Une page sans marqueur ni forme ancienne d'un fragment (l'index pour les styles) n'est pas modifiée.
+        """
+        for name in FRAGMENTS:
+            block = self.block(name)
+            if FRAGMENT_PATTERNS[name].search(html):
+                html = FRAGMENT_PATTERNS[name].sub(lambda _: block, html, count=1)
+                html = LEGACY_PATTERNS[name].sub('', html)
+            else:
+                html = LEGACY_PATTERNS[name].sub(lambda _: block, html, count=1)
+        return LEGACY_FETCH_SCRIPT_PATTERN.sub('', html)
+
+    # ------------------------------------------------------------------
+    # Synchronisation des pages
+    # ------------------------------------------------------------------
+    def sync_pages(self, pages: Iterable[Path], force: bool = False) -> List[Path]:
+        """
+        Réécrit les pages dont les fragments ne sont plus à jour.
+
+        Sans changement des fragments depuis la dernière synchronisation, rien n'est relu
+        (les nouveaux articles sont générés directement avec les fragments courants).
+
+        Args:
+            pages: Pages HTML publiées (index, articles...)
+            force: Vérifier toutes les pages même si les fragments n'ont pas changé
+
+        Returns:
+            Pages réécrites
+        """
+        self.render()
+        fragments_hash = self.state['fragments_hash']
+        if not force and self.state.get('synced_hash') == fragments_hash:
+            logger.info("Fragments inchangés : aucune page à réécrire")
+            return []
+
+        rewritten = []
+        for page in pages:
+            page = Path(page)
+            try:
+                content = page.read_text(encoding='utf-8')
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Page ignorée {page}: {e}")
+                continue
+            updated = self.inline(content)
+            if updated != content:
+                atomic_write_text(page, updated)
+                rewritten.append(page)
+
+        self.state['synced_hash'] = fragments_hash
+        self._save_state()
+        logger.info(f"Fragments inclus dans {len(rewritten)} page(s)")
+        return rewritten
+
+
+def published_pages(root: Path = Path(".")) -> List[Path]:
+    """Pages publiées recevant les fragments."""
+    root = Path(root)
+    return [root / "index.html"] + sorted((root / "articles").glob("*.html")) + sorted((root / "archive").glob("*.html"))
+
+
+def main():
+    """Point d'entrée CLI : inclusion des fragments dans les pages publiées."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Site Fragments - Seminary Blog")
+    parser.add_argument('--force', action='store_true', help='Vérifier toutes les pages même sans changement des fragments')
+    args = parser.parse_args()
+
+    rewritten = SiteFragments().sync_pages(published_pages(), force=args.force)
+    print(f"Pages mises à jour: {len(rewritten)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stat Cache - Hash de contenu des fichiers mémorisés par (mtime, taille)
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module évite de relire les fichiers inchangés entre deux runs locaux :
+1. Hash SHA-256 (16 caractères) du contenu d'un fichier, relu seulement si son stat a changé
+2. Cache local dans data/stat_cache/ (ignoré par git) : les états publiés ne gardent que les hash,
+   un checkout (nouveaux mtime) ne les modifie donc pas
+3. Entrées limitées aux fichiers consultés pendant le run
+"""
+
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from image_cache import atomic_write_text
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STAT_CACHE_DIR = Path("data") / "stat_cache"
+
+
+def content_hash(data: bytes) -> str:
+    """Hash court du contenu d'un fichier."""
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+class StatCache:
+    """Hash de contenu par fichier, valides tant que le mtime et la taille ne changent pas."""
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        """
+        Initialise le cache.
+
+        Args:
+            cache_file: Fichier JSON du cache (None : cache en mémoire, non persisté)
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.entries = self._load()
+        self._seen: Dict[str, List] = {}
+
+    def _load(self) -> Dict[str, List]:
+        """Charge le cache (vide si absent ou corrompu)."""
+        if not self.cache_file:
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def file_hash(self, path: Path, data: Optional[bytes] = None) -> str:
+        """
+        Hash du contenu d'un fichier, relu seulement si son stat a changé.
+
+        Args:
+            path: Fichier à hacher
+            data: Contenu déjà lu (évite une seconde lecture)
+        """
+        stat = Path(path).stat()
+        key = str(path)
+        cached = self.entries.get(key)
+        if data is None and cached and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+            digest = cached[2]
+        else:
+            digest = content_hash(Path(path).read_bytes() if data is None else data)
+        self._seen[key] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def save(self) -> None:
+        """Sauvegarde les entrées des fichiers consultés pendant le run (si elles ont changé)."""
+        if self.cache_file and self._seen != self.entries:
+            atomic_write_text(self.cache_file, json.dumps(self._seen, sort_keys=True))
+            self.entries = dict(self._seen)
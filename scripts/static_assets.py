@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Static Assets - Minification et publication des ressources partagées
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module publie les feuilles de style communes aux articles :
+1. Minification CSS et minification du balisage HTML/SVG généré
+2. Minification sûre des pages complètes (articles) avant écriture
+3. Regroupement de plusieurs feuilles en un seul fichier
+4. Nom de fichier versionné par le hash du contenu (cache navigateur illimité)
+5. Écriture atomique, uniquement si la version n'existe pas encore
+"""
+
+import re
+import hashlib
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Tuple
+
+from image_cache import atomic_write_text
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ASSETS_DIR = Path("assets")
+
+CSS_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+CSS_SPACE_PATTERN = re.compile(r'\s*([{}:;,>])\s*')
+# Marqueurs conservés : liste d'articles de l'index et fragments inclus au build (<!-- Seminary Header -->...)
+HTML_COMMENT_PATTERN = re.compile(
+    r'<!--(?!\s*(?:Articles dynamiques|Fin articles dynamiques|/?Seminary [A-Z][a-z]+ -->)).*?-->', re.DOTALL
+)
+BETWEEN_TAGS_PATTERN = re.compile(r'>\s+<')
+STYLE_BLOCK_PATTERN = re.compile(r'(<style[^>]*>)(.*?)(</style>)', re.DOTALL)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Pages complètes : blocs dont le contenu est conservé tel quel
+PRESERVED_BLOCK_PATTERN = re.compile(r'(<(pre|textarea|script)\b[^>]*>)(.*?)(</\2\s*>)', re.DOTALL | re.IGNORECASE)
+PLACEHOLDER_PATTERN = re.compile('\x00(\\d+)\x00')
+# Les blancs autour de ces balises ne sont jamais rendus (éléments de bloc, en-tête, SVG)
+BLOCK_TAGS = ('html|head|body|meta|link|title|style|script|base|div|section|article|aside|nav|header|footer|main|'
+              'p|h[1-6]|ul|ol|li|dl|dt|dd|table|thead|tbody|tfoot|tr|td|th|figure|figcaption|blockquote|form|'
+              'fieldset|br|hr|svg|g|defs|path|rect|circle|ellipse|line|polyline|polygon|lineargradient|stop')
+BLOCK_TAG_SPACE_PATTERN = re.compile(rf'\s*(</?(?:{BLOCK_TAGS})\b[^>]*>)\s*', re.IGNORECASE)
+TAG_PATTERN = re.compile(r'<[a-zA-Z][^>]*>')
+BOOLEAN_ATTRIBUTE_PATTERN = re.compile(
+    r'\s(async|defer|checked|disabled|selected|readonly|required|multiple|hidden|autofocus|novalidate|'
+    r'autoplay|controls|loop|muted|open|reversed|nomodule)=(?:"(?:\1)?"|\'(?:\1)?\')', re.IGNORECASE
+)
+STYLE_ATTRIBUTE_PATTERN = re.compile(r'(\sstyle=")([^"]*)(")')
+
+
+def minify_css(css: str) -> str:
+    """Supprime commentaires et espaces superflus d'une feuille de style."""
+    css = CSS_COMMENT_PATTERN.sub('', css)
+    css = WHITESPACE_PATTERN.sub(' ', css)
+    css = CSS_SPACE_PATTERN.sub(r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+def minify_markup(markup: str) -> str:
+    """
+    Minifie un fragment HTML/SVG généré : commentaires, indentation et blancs entre balises.
+
+    Les blocs <style> sont minifiés comme du CSS ; les marqueurs de l'index
+    (<!-- Articles dynamiques -->) sont conservés.
+    """
+    markup = STYLE_BLOCK_PATTERN.sub(lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3), markup)
+    markup = HTML_COMMENT_PATTERN.sub('', markup)
+    markup = BETWEEN_TAGS_PATTERN.sub('><', markup)
+    return WHITESPACE_PATTERN.sub(' ', markup).strip()
+
+
+def minify_html(html: str) -> str:
+    """
+    Minifie une page HTML complète sans changer son rendu.
+
+    - blancs réduits à un espace, supprimés autour des balises de bloc et SVG ;
+      contenu de <pre>, <textarea> et <script> conservé tel quel
+    - commentaires supprimés, sauf marqueurs de l'index et des fragments inclus au build
+    - attributs booléens raccourcis (defer="defer" → defer)
+    - CSS des blocs <style> et des attributs style minifié
+    """
+    preserved: list = []
+
+    def protect(match: re.Match) -> str:
+        # Seul le contenu est protégé : les attributs de la balise ouvrante restent minifiés
+        preserved.append(match.group(3))
+        return f"{match.group(1)}\x00{len(preserved) - 1}\x00{match.group(4)}"
+
+    html = PRESERVED_BLOCK_PATTERN.sub(protect, html)
+    html = STYLE_BLOCK_PATTERN.sub(lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3), html)
+    html = HTML_COMMENT_PATTERN.sub('', html)
+    html = WHITESPACE_PATTERN.sub(' ', html)
+    html = BLOCK_TAG_SPACE_PATTERN.sub(r'\1', html)
+    html = TAG_PATTERN.sub(
+        lambda m: STYLE_ATTRIBUTE_PATTERN.sub(
+            lambda s: s.group(1) + minify_css(s.group(2)).rstrip(';') + s.group(3),
+            BOOLEAN_ATTRIBUTE_PATTERN.sub(r' \1', m.group(0))
+        ),
+        html
+    )
+    return PLACEHOLDER_PATTERN.sub(lambda m: preserved[int(m.group(1))], html).strip()
+
+
+@lru_cache(maxsize=None)
+def _publish(name: str, sources: Tuple[Tuple[str, int], ...], output_dir: str) -> str:
+    """Minifie et publie une feuille de style (mémorisé par version des fichiers sources)."""
+    content = ''.join(minify_css(Path(source).read_text(encoding='utf-8')) for source, _ in sources)
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:10]
+    filename = f"{name}.{digest}.css"
+
+    target = Path(output_dir) / filename
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(target, content)
+        logger.info(f"Feuille de style publiée: {target} ({len(content)} caractères)")
+    return filename
+
+
+def publish_bundle(name: str, sources: Iterable[Path], output_dir: Path = ASSETS_DIR) -> str:
+    """
+    Publie plusieurs feuilles de style concaténées et minifiées sous un nom versionné.
+
+    Args:
+        name: Préfixe du fichier publié
+        sources: Feuilles de style sources, dans l'ordre de la cascade
+        output_dir: Répertoire publié des ressources
+
+    Returns:
+        Nom du fichier publié (<nom>.<hash>.css)
+    """
+    versions = tuple((str(source), Path(source).stat().st_mtime_ns) for source in sources)
+    return _publish(name, versions, str(output_dir))
+
+
+def publish_stylesheet(source: Path, output_dir: Path = ASSETS_DIR) -> str:
+    """
+    Publie une feuille de style minifiée sous un nom versionné.
+
+    Args:
+        source: Feuille de style source (templates/css/...)
+        output_dir: Répertoire publié des ressources
+
+    Returns:
+        Nom du fichier publié (<nom>.<hash>.css)
+    """
+    return publish_bundle(Path(source).stem, [source], output_dir)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Templating - Environnement Jinja2 partagé
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module fournit un environnement Jinja2 unique par répertoire de templates :
+1. Chargement des templates depuis le disque (FileSystemLoader)
+2. Cache de bytecode dans data/ : les templates ne sont compilés qu'une fois entre les runs
+   (répertoire du cache injectable, p. ex. un répertoire temporaire dans les tests)
+3. Échappement automatique des variables
+4. Hash d'un template et des templates dont il hérite ou qu'il inclut (invalidation des rendus)
+"""
+
+import hashlib
+import logging
+from functools import lru_cache
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, meta, select_autoescape
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path("templates")
+BYTECODE_CACHE_DIR = Path("data") / "jinja_cache"
+
+
+def get_environment(templates_dir: Path = TEMPLATES_DIR, cache_dir: Path = BYTECODE_CACHE_DIR) -> Environment:
+    """
+    Retourne l'environnement Jinja2 partagé d'un répertoire de templates.
+
+    Args:
+        templates_dir: Racine des templates
+        cache_dir: Répertoire du cache de bytecode
+    """
+    # Chemins normalisés : un seul environnement par couple (templates, cache), quelle que soit la forme des arguments
+    return _environment(Path(templates_dir), Path(cache_dir))
+
+
+@lru_cache(maxsize=None)
+def _environment(templates_dir: Path, cache_dir: Path) -> Environment:
+    """Crée l'environnement Jinja2 d'un répertoire de templates (mémorisé par get_environment)."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(str(templates_dir)),
+        bytecode_cache=FileSystemBytecodeCache(str(cache_dir)),
+        autoescape=select_autoescape(['html', 'xml']),
+        auto_reload=True
+    )
+
+
+def template_hash(name: str, templates_dir: Path = TEMPLATES_DIR, cache_dir: Path = BYTECODE_CACHE_DIR) -> str:
+    """
+    Hash d'un template et de ses dépendances ({% extends %}, {% include %}, {% import %}).
+
+    Modifier la mise en page de base invalide ainsi les pages de tous les templates qui en héritent.
+
+    Args:
+        name: Nom du template (relatif à templates_dir)
+        templates_dir: Racine des templates
+        cache_dir: Répertoire du cache de bytecode
+    """
+    env = get_environment(templates_dir, cache_dir)
+    digest = hashlib.sha256()
+    pending, seen = [name], set()
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        source, _, _ = env.loader.get_source(env, current)
+        digest.update(current.encode('utf-8') + b'\0' + source.encode('utf-8'))
+        # Noms dynamiques (None) ignorés : ils ne sont pas connus avant le rendu
+        pending += [ref for ref in meta.find_referenced_templates(env.parse(source)) if ref]
+    return digest.hexdigest()[:16]
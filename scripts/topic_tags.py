@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Topic Tags - Thèmes des articles par TF-IDF et pages de thèmes
+Seminary Blog System - Système de Blog Automatisé SEO-First
+
+Ce module regroupe les articles par thème :
+1. Termes de chaque article (mêmes règles de tokenisation que l'index de recherche)
+2. Table IDF incrémentale (data/topic_index.json) : un nouvel article ne met à jour
+   que les fréquences de ses propres termes, sans repasser sur le corpus
+3. Jusqu'à 5 thèmes par article (TF-IDF) parmi ses noms, enregistrés dans le catalogue : un terme
+   n'est un thème que si au moins deux articles le reçoivent (vocabulaire choisi sur le corpus)
+4. Pages de thèmes (topics/<thème>.html) et page d'accueil des thèmes, réécrites seulement si elles changent
+"""
+
+import re
+import json
+import math
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from archive_pages import ArchiveBuilder
+from article_catalog import ArticleCatalog
+from image_cache import atomic_write_text
+from search_index import FIELD_WEIGHTS, STOPWORDS, fold, stem, plain_text
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TOPIC_STATE = Path("data") / "topic_index.json"
+TOPICS_DIR = Path("topics")
+# Version de la table : une version différente (règles de sélection modifiées) réétiquette tout le catalogue
+STATE_VERSION = 3
+
+MIN_TAGS = 3  # Thèmes retenus sans condition de score (s'il y a assez de termes partagés)
+MAX_TAGS = 5
+MAX_CANDIDATES = 10  # Meilleurs termes de chaque article, thèmes s'ils sont retenus par un autre article
+MIN_TERM_LENGTH = 4
+MIN_TOPIC_DF = 2  # Un thème doit être retenu par au moins deux articles
+SCORE_RATIO = 0.4  # Au-delà de MIN_TAGS, un thème doit atteindre 40 % du score du meilleur
+NOUN_SHARE = 2  # Un terme est un nom si au moins la moitié de ses occurrences suivent un déterminant
+
+WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+# Déterminants (formes repliées) : un mot qui en suit un est employé comme nom, pas comme verbe,
+# adverbe ou adjectif épithète placé après le nom (« l'hébergement », « un atelier », « des réunions »)
+DETERMINERS = frozenset("""
+l le la les un une des du ce cet cette ces mon ma mes son sa ses notre nos votre vos leur leurs chaque
+plusieurs quelques
+""".split())
+
+# Mots des classes fermées du français (formes repliées), en plus des mots vides de l'index de recherche :
+# adverbes, prépositions, conjonctions, indéfinis et adjectifs placés avant le nom (« le prochain séminaire »)
+FUNCTION_WORDS = frozenset("""
+alors assez beaucoup bientot deja encore enfin ensuite ici jamais loin longtemps maintenant moins parfois
+partout peu plutot presque puis souvent surtout tard tot toujours trop vraiment
+afin apres aupres avant car chez contre depuis derriere devant donc durant envers grace hors jusqu jusque
+lorsque malgre parce parmi pendant pourtant pres puisque quand selon sinon vers via
+autre autres certain certaine certains certaines chacun chacune divers diverses memes nul plusieurs quel
+quelle quels quelles quelque quelques rien tel telle tels telles
+bon bonne bons bonnes beau bel belle beaux belles grand grande grands grandes petit petite petits petites
+nouveau nouvel nouvelle nouveaux nouvelles jeune jeunes vieux vieil vieille vieilles vrai vraie vrais vraies
+meilleur meilleure meilleurs meilleures premier premiere premiers premieres dernier derniere derniers
+dernieres prochain prochaine prochains prochaines seul seule seuls seules simple simples
+""".split())
+
+# Terminaisons propres aux verbes conjugués et aux adverbes en -ment dérivés d'adjectifs :
+# aucun nom courant ne les porte (hébergement, environnement, événement restent candidats)
+VERB_ADVERB_ENDINGS = ('ait', 'aient', 'erait', 'eraient', 'eront', 'erez', 'issent', 'amment', 'emment',
+                       'ablement', 'iblement', 'ellement', 'eusement', 'iquement', 'ivement', 'ierement',
+                       'alement', 'ilement', 'aitement', 'einement')
+
+
+def slugify(label: str) -> str:
+    """'Cohésion' → 'cohesion'."""
+    return re.sub(r'[^a-z0-9]+', '-', fold(label)).strip('-')
+
+
+def article_terms(record: Dict) -> Tuple[Counter, Dict[str, str], Set[str]]:
+    """
+    Termes racinisés d'un article, pondérés par champ, forme la plus fréquente de chaque racine
+    et racines employées surtout comme noms (après un déterminant).
+
+    Returns:
+        (poids par racine, libellé par racine, racines employées comme noms)
+    """
+    weights: Counter = Counter()
+    occurrences: Counter = Counter()
+    noun_uses: Counter = Counter()
+    surfaces: Dict[str, Counter] = {}
+    fields = {field: plain_text(record.get(field, '')) for field in FIELD_WEIGHTS}
+    for field, text in fields.items():
+        previous = ''
+        for word in WORD_PATTERN.findall(text.lower()):
+            folded = fold(word)
+            after_determiner, previous = previous in DETERMINERS, folded
+            if len(folded) < 2 or folded in STOPWORDS:
+                continue
+            term = stem(folded)
+            weights[term] += FIELD_WEIGHTS[field]
+            occurrences[term] += 1
+            noun_uses[term] += after_determiner
+            # Formes employées comme noms préférées pour le libellé (« Engagement » plutôt que « Engagées »)
+            surfaces.setdefault(term, Counter())[word] += 1 + NOUN_SHARE * after_determiner
+    labels = {term: counts.most_common(1)[0][0] for term, counts in surfaces.items()}
+    nouns = {term for term in occurrences if noun_uses[term] * NOUN_SHARE >= occurrences[term]}
+    return weights, labels, nouns
+
+
+def is_topic_word(word: str) -> bool:
+    """Forme candidate à un thème : ni mot vide ou de classe fermée, ni verbe conjugué, ni adverbe en -ment."""
+    folded = fold(word)
+    return folded not in STOPWORDS and folded not in FUNCTION_WORDS and not folded.endswith(VERB_ADVERB_ENDINGS)
+
+
+class TopicPageBuilder(ArchiveBuilder):
+    """Pages de thèmes : mêmes template, style et rendu incrémental que les archives."""
+
+    SECTION = "topics"
+    INDEX_LABEL = "Tous les thèmes"
+
+    def __init__(self, output_dir: Path = TOPICS_DIR, **kwargs):
+        super().__init__(output_dir, **kwargs)
+
+    def _page_specs(self, articles: List[Dict]) -> Dict[str, Dict]:
+        """Une page par thème et une page d'accueil listant les thèmes par nombre d'articles."""
+        labels: Dict[str, str] = {}
+        by_topic: Dict[str, List[Dict]] = {}
+        for article in articles:
+            for tag in article.get('tags') or []:
+                labels.setdefault(tag['slug'], tag['label'])
+                by_topic.setdefault(tag['slug'], []).append(
+                    {field: article.get(field, '') for field in ('filename', 'date', 'title', 'description')}
+                )
+
+        specs: Dict[str, Dict] = {}
+        for slug, items in by_topic.items():
+            specs[f"{slug}.html"] = {
+                'title': f"Thème : {labels[slug]}",
+                'description': f"{len(items)} article(s) sur le thème « {labels[slug]} ».",
+                'articles': items
+            }
+        specs['index.html'] = {
+            'title': "Thèmes",
+            'description': f"Les articles du blog Seminary regroupés par thème ({len(by_topic)} thèmes).",
+            'articles': [],
+            'topics': [{'path': f"{slug}.html", 'label': labels[slug], 'count': len(by_topic[slug])}
+                       for slug in sorted(by_topic, key=lambda s: (-len(by_topic[s]), s))]
+        }
+        return specs
+
+
+class TopicTagger:
+    """Attribution incrémentale des thèmes (TF-IDF) aux articles du catalogue."""
+
+    def __init__(self, catalog: Optional[ArticleCatalog] = None, state_file: Path = TOPIC_STATE):
+        """
+        Initialise le tagger.
+
+        Args:
+            catalog: Catalogue des articles (data/articles.db par défaut)
+            state_file: Table IDF et termes de chaque article indexé
+        """
+        self.catalog = catalog if catalog is not None else ArticleCatalog()
+        self.state_file = Path(state_file)
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict:
+        """Charge la table IDF (vide si absente ou corrompue)."""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == STATE_VERSION:
+                return state
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        return {'version': STATE_VERSION, 'doc_count': 0, 'df': {}, 'labels': {}, 'docs': {}}
+
+    def save(self) -> None:
+        atomic_write_text(self.state_file, json.dumps(self.state, indent=2, ensure_ascii=False, sort_keys=True))
+
+    def _forget(self, filename: str) -> None:
+        """Retire un article de la table IDF."""
+        df = self.state['df']
+        for term in self.state['docs'].pop(filename)['terms']:
+            df[term] -= 1
+            if not df[term]:
+                del df[term]
+        self.state['doc_count'] -= 1
+
+    def _candidates(self, weights: Counter, labels: Dict[str, str], nouns: Set[str]) -> List[List]:
+        """Meilleurs termes d'un article selon le TF-IDF : thèmes possibles s'ils sont partagés."""
+        df, doc_count = self.state['df'], self.state['doc_count']
+        total = sum(weights.values()) or 1
+
+        def score(term: str) -> float:
+            return weights[term] / total * math.log((1 + doc_count) / (1 + df.get(term, 0)))
+
+        # Noms répétés dans l'article et absents d'au moins un autre article
+        eligible = sorted((term for term in weights if term in nouns and len(term) >= MIN_TERM_LENGTH
+                           and weights[term] >= 2 and df.get(term, 0) < doc_count and is_topic_word(labels[term])),
+                          key=score, reverse=True)
+        for term in eligible[:MAX_CANDIDATES]:
+            # Libellé fixé à la première sélection : même page de thème pour toutes les formes du mot
+            self.state['labels'].setdefault(term, labels[term].capitalize())
+        return [[term, round(score(term), 6)] for term in eligible[:MAX_CANDIDATES]]
+
+    def _choose(self, candidates: List[List], vocabulary: Set[str]) -> List[str]:
+        """Jusqu'à 5 thèmes d'un article parmi ses candidats présents dans le vocabulaire."""
+        shared = [(term, score) for term, score in candidates if term in vocabulary]
+        # Au-delà de MIN_TAGS, seuls les thèmes proches du meilleur sont retenus ; un article
+        # sans terme assez partagé reçoit moins de MIN_TAGS thèmes plutôt que des mots quelconques
+        return [term for position, (term, score) in enumerate(shared[:MAX_TAGS])
+                if position < MIN_TAGS or score >= shared[0][1] * SCORE_RATIO]
+
+    def _assign(self) -> Dict[str, List[str]]:
+        """
+        Thèmes de tous les articles indexés, à partir de leurs candidats enregistrés.
+
+        Le vocabulaire se choisit sur le corpus : un terme n'est un thème que si au moins
+        MIN_TOPIC_DF articles le reçoivent (aucune page de thème à un seul article). Retirer
+        un terme peut en écarter d'autres : on recommence jusqu'à stabilité.
+        """
+        docs = self.state['docs']
+        counts = Counter(term for doc in docs.values() for term, _ in doc['candidates'])
+        vocabulary = {term for term, count in counts.items() if count >= MIN_TOPIC_DF}
+        while True:
+            chosen = {filename: self._choose(doc['candidates'], vocabulary) for filename, doc in docs.items()}
+            counts = Counter(term for terms in chosen.values() for term in terms)
+            kept = {term for term in vocabulary if counts[term] >= MIN_TOPIC_DF}
+            if kept == vocabulary:
+                return chosen
+            vocabulary = kept
+
+    def update(self) -> List[str]:
+        """
+        Met à jour la table IDF et les thèmes des articles.
+
+        Seuls les articles nouveaux ou modifiés sont analysés ; les thèmes sont ensuite
+        réattribués à partir des candidats enregistrés, sans relire le catalogue. Un article
+        déjà étiqueté est réétiqueté quand un terme qu'il retient devient un thème (ou cesse
+        de l'être) : le premier article d'un thème reçoit sa page dès que le second arrive.
+
+        Returns:
+            Articles (ré)étiquetés
+        """
+        docs = self.state['docs']
+        current = self.catalog.hashes()
+        removed = [f for f in docs if f not in current]
+        for filename in removed:
+            self._forget(filename)
+
+        changed = sorted(filename for filename, digest in current.items() if docs.get(filename, {}).get('hash') != digest)
+        if not changed and not removed:
+            logger.info("Thèmes à jour")
+            return []
+
+        # Fréquences mises à jour pour tout le lot avant la sélection : les candidats d'un lot
+        # (ou du premier build) profitent de l'IDF de l'ensemble
+        analysed = {}
+        for filename in changed:
+            if filename in docs:
+                self._forget(filename)
+            weights, labels, nouns = article_terms(self.catalog.get(filename))
+            for term in weights:
+                self.state['df'][term] = self.state['df'].get(term, 0) + 1
+            self.state['doc_count'] += 1
+            docs[filename] = {'hash': current[filename], 'terms': sorted(weights)}
+            analysed[filename] = (weights, labels, nouns)
+        for filename, (weights, labels, nouns) in analysed.items():
+            docs[filename]['candidates'] = self._candidates(weights, labels, nouns)
+
+        retagged = []
+        for filename, terms in sorted(self._assign().items()):
+            if filename in analysed or docs[filename].get('tags') != terms:
+                docs[filename]['tags'] = terms
+                labels = [self.state['labels'][term] for term in terms]
+                self.catalog.set_tags(filename, [{'slug': slugify(label), 'label': label} for label in labels])
+                retagged.append(filename)
+
+        logger.info(f"Thèmes: {len(changed)} article(s) analysé(s), {len(retagged)} étiqueté(s), "
+                    f"{self.state['doc_count']} dans la table IDF")
+        return retagged
+
+    def build_pages(self, builder: Optional[TopicPageBuilder] = None) -> List[Path]:
+        """Rend les pages de thèmes qui ont changé."""
+        builder = builder or TopicPageBuilder()
+        return builder.build(self.catalog.latest(None), self.state.setdefault('topic_pages', {}))
+
+
+def main():
+    """Point d'entrée CLI : thèmes des nouveaux articles et pages de thèmes."""
+    tagger = TopicTagger()
+    tagged = tagger.update()
+    pages = tagger.build_pages()
+    tagger.save()
+    print(f"Articles étiquetés: {len(tagged)}, pages de thèmes écrites: {len(pages)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,101 +6,212 @@ Utilisé par le workflow GitHub Actions
 
 import os
 import re
+import html
+import json
 from datetime import datetime
 from pathlib import Path
 import chardet
 
-def detect_encoding(file_path):
-    """Détecte l'encodage d'un fichier"""
+from archive_pages import ArchiveBuilder
+from article_catalog import ArticleCatalog
+from image_cache import atomic_write_text
+from search_index import SearchIndexBuilder
+from site_feeds import SiteFeeds
+from site_fragments import SiteFragments
+from stat_cache import STAT_CACHE_DIR, StatCache
+
+INDEX_MANIFEST = Path('data') / 'index_manifest.json'
+INDEX_STAT_CACHE = STAT_CACHE_DIR / 'index.json'
+INDEX_LIMIT = 10  # Articles affichés sur la page d'accueil
+ARTICLE_NAME_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2})-(.+)\.html$')
+
+def decode_html(raw_data, known_encoding=None):
+    """Décode un fichier HTML : UTF-8 (ou l'encodage déjà connu) d'abord, chardet seulement en cas d'échec"""
+    for encoding in dict.fromkeys([known_encoding or 'utf-8', 'utf-8']):
+        try:
+            return raw_data.decode(encoding), encoding
+        except (UnicodeDecodeError, LookupError):
+            pass
+    encoding = chardet.detect(raw_data)['encoding'] or 'utf-8'
+    return raw_data.decode(encoding, errors='replace'), encoding
+
+def plain_text(markup):
+    """Texte brut d'un fragment HTML : balises retirées, entités décodées, espaces normalisés"""
+    return ' '.join(html.unescape(re.sub(r'<[^>]+>', '', markup)).split())
+
+def extract_index_metadata(content, title_slug):
+    """
+    Extrait titre et description d'un article HTML (articles absents du catalogue).
+
+    Retourne du texte brut (balises retirées, entités décodées), comme les métadonnées du catalogue.
+    """
+    # Extraire le titre avec fallback intelligent
+    title_match = re.search(r'<h1[^>]*>(.*?)</h1>', content, re.IGNORECASE | re.DOTALL)
+    title = ''
+    if title_match and title_match.group(1).strip():
+        title = title_match.group(1).strip()
+    else:
+        # Fallback: extraire depuis <title> si h1 vide
+        title_tag = re.search(r'<title[^>]*>(.*?)</title>', content, re.IGNORECASE)
+        if title_tag and title_tag.group(1).strip():
+            title = title_tag.group(1).strip()
+        else:
+            # Dernier fallback: générer depuis nom fichier
+            title = title_slug.replace('-', ' ').title()
+            if title.endswith(' Html'):
+                title = title[:-5]  # Supprimer " Html" final
+    
+    # Extraire la description avec fallback
+    desc_match = re.search(r'<meta name="description" content="(.*?)"', content)
+    if desc_match and desc_match.group(1).strip():
+        description = desc_match.group(1).strip()
+    else:
+        # Fallback: premières lignes du contenu
+        content_match = re.search(r'<div[^>]*class="article-content"[^>]*>(.*?)</div>', content, re.IGNORECASE | re.DOTALL)
+        if content_match:
+            text_content = re.sub(r'<[^>]+>', '', content_match.group(1))
+            text_content = ' '.join(text_content.split())  # Nettoyer espaces
+            description = text_content[:150] + '...' if len(text_content) > 150 else text_content
+        else:
+            description = f'Article sur les séminaires dans les Vosges - {title}'
+    return plain_text(title), plain_text(description)
+
+def load_index_manifest(manifest_path=INDEX_MANIFEST):
+    """Charge le manifeste de l'index (vide si absent ou corrompu)"""
     try:
-        with open(file_path, 'rb') as f:
-            raw_data = f.read()
-        result = chardet.detect(raw_data)
-        return result['encoding'] or 'utf-8'
-    except:
-        return 'utf-8'
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == 1:
+            return manifest
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {'version': 1, 'articles': {}}
+
+def scan_articles(articles_dir, manifest, catalog=None, stat_cache=None):
+    """
+    Met à jour le manifeste des articles : seuls les fichiers dont le hash a changé sont analysés.
+
+    Le manifeste (versionné) ne garde que les hash de contenu ; le cache de stat local
+    évite de relire les fichiers dont le mtime et la taille n'ont pas changé.
+
+    Returns:
+        Nombre d'articles (ré)analysés
+    """
+    entries = manifest['articles']
+    stat_cache = stat_cache or StatCache()
+    seen = set()
+    parsed = 0
+    
+    for html_file in articles_dir.glob('*.html'):
+        match = ARTICLE_NAME_PATTERN.match(html_file.name)
+        if not match:
+            continue
+        date_str, title_slug = match.groups()
+        try:
+            datetime.strptime(date_str, '%Y-%m-%d')
+        except ValueError:
+            continue
+        seen.add(html_file.name)
+        
+        try:
+            entry = entries.get(html_file.name)
+            if entry and entry['hash'] == stat_cache.file_hash(html_file):
+                continue
+            
+            raw_data = html_file.read_bytes()
+            digest = stat_cache.file_hash(html_file, raw_data)
+            
+            # Titre et description lus dans le catalogue (requête indexée) ; HTML analysé seulement hors catalogue
+            record = catalog.metadata(html_file.name) if catalog else None
+            encoding = entry.get('encoding') if entry else None
+            content_hash = record['content_hash'] if record else digest
+            if record and record['title']:
+                title = record['title']
+                description = record['description'] or f'Article sur les séminaires dans les Vosges - {title}'
+            else:
+                content, encoding = decode_html(raw_data, encoding)
+                title, description = extract_index_metadata(content, title_slug)
+            
+            entries[html_file.name] = {
+                'hash': digest,
+                'content_hash': content_hash,
+                'encoding': encoding or 'utf-8',
+                'date': date_str,
+                'title': title,
+                'description': description[:150] + '...' if len(description) > 150 else description
+            }
+            parsed += 1
+            
+        except Exception as e:
+            print(f'⚠️ Erreur lecture {html_file}: {e}')
+    
+    for filename in set(entries) - seen:
+        del entries[filename]
+    return parsed
 
-def update_index_html():
+def update_index_html(manifest_path=INDEX_MANIFEST):
     """Met à jour index.html avec la liste des articles disponibles"""
     
     # Lister tous les articles
     articles_dir = Path('articles')
-    articles = []
     
     if not articles_dir.exists():
         print("⚠️ Dossier articles/ inexistant")
         articles_dir.mkdir(exist_ok=True)
     
-    for html_file in articles_dir.glob('*.html'):
-        match = re.match(r'^(\d{4}-\d{2}-\d{2})-(.+)\.html$', html_file.name)
-        if match:
-            date_str, title_slug = match.groups()
-            try:
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                
-                # Lire le contenu pour extraire titre et description
-                encoding = detect_encoding(html_file)
-                with open(html_file, 'r', encoding=encoding) as f:
-                    content = f.read()
-                
-                # Extraire le titre avec fallback intelligent
-                title_match = re.search(r'<h1[^>]*>(.*?)</h1>', content, re.IGNORECASE | re.DOTALL)
-                title = ''
-                if title_match and title_match.group(1).strip():
-                    title = title_match.group(1).strip()
-                else:
-                    # Fallback: extraire depuis <title> si h1 vide
-                    title_tag = re.search(r'<title[^>]*>(.*?)</title>', content, re.IGNORECASE)
-                    if title_tag and title_tag.group(1).strip():
-                        title = title_tag.group(1).strip()
-                    else:
-                        # Dernier fallback: générer depuis nom fichier
-                        title = title_slug.replace('-', ' ').title()
-                        if title.endswith(' Html'):
-                            title = title[:-5]  # Supprimer " Html" final
-                
-                # Extraire la description avec fallback
-                desc_match = re.search(r'<meta name="description" content="(.*?)"', content)
-                if desc_match and desc_match.group(1).strip():
-                    description = desc_match.group(1).strip()
-                else:
-                    # Fallback: premières lignes du contenu
-                    content_match = re.search(r'<div[^>]*class="article-content"[^>]*>(.*?)</div>', content, re.IGNORECASE | re.DOTALL)
-                    if content_match:
-                        text_content = re.sub(r'<[^>]+>', '', content_match.group(1))
-                        text_content = ' '.join(text_content.split())  # Nettoyer espaces
-                        description = text_content[:150] + '...' if len(text_content) > 150 else text_content
-                    else:
-                        description = f'Article sur les séminaires dans les Vosges - {title}'
-                
-                articles.append({
-                    'filename': html_file.name,
-                    'date': date_obj,
-                    'date_str': date_str,
-                    'title': title,
-                    'description': description[:150] + '...' if len(description) > 150 else description
-                })
-                
-            except Exception as e:
-                print(f'⚠️ Erreur lecture {html_file}: {e}')
-    
-    # Trier par date décroissante
-    articles.sort(key=lambda x: x['date'], reverse=True)
+    # Manifeste incrémental : seuls les articles nouveaux ou modifiés sont relus
+    manifest = load_index_manifest(manifest_path)
+    before = json.dumps(manifest, sort_keys=True)
+    catalog = ArticleCatalog()
+    stat_cache = StatCache(INDEX_STAT_CACHE)
+    parsed = scan_articles(articles_dir, manifest, catalog, stat_cache)
+    stat_cache.save()
+    print(f"📋 Manifeste: {len(manifest['articles'])} article(s), {parsed} (ré)analysé(s)")
+    
+    # Un seul tri du manifeste : date décroissante (à date égale, ordre stable par nom de fichier)
+    articles = sorted(
+        (dict(entry, filename=filename, date_str=entry['date']) for filename, entry in manifest['articles'].items()),
+        key=lambda x: (x['date'], x['filename']),
+        reverse=True
+    )
+    latest_articles = articles[:INDEX_LIMIT]
+    
+    # Archives paginées et mensuelles : seules les pages dont le contenu change sont rendues
+    archive_pages = ArchiveBuilder().build(articles, manifest.setdefault('archive', {}))
+    print(f"🗂️ Archives: {len(archive_pages)} page(s) mise(s) à jour")
+    
+    # Sitemap et flux Atom : lastmod avancé seulement pour les pages dont le contenu change
+    feed_files = SiteFeeds().build(articles, manifest['archive']['pages'], manifest.setdefault('feeds', {}))
+    print(f"🗺️ Sitemap/flux: {len(feed_files)} fichier(s) mis à jour")
+    
+    # Index de recherche statique : seuls les fragments des termes des articles modifiés sont réécrits
+    search_files = SearchIndexBuilder(catalog=catalog, articles_dir=articles_dir).build(
+        articles, manifest.setdefault('search', {})
+    )
+    print(f"🔎 Index de recherche: {len(search_files)} fichier(s) mis à jour")
+    
+    if json.dumps(manifest, sort_keys=True) != before:
+        atomic_write_text(Path(manifest_path), json.dumps(manifest, indent=2, ensure_ascii=False, sort_keys=True))
     
     # Générer le HTML de la liste des articles
     articles_html = ""
     if articles:
-        for article in articles[:10]:  # Derniers 10 articles
+        for article in latest_articles:
             articles_html += f'''
                 <div class="blog-card p-4">
-                    <h3><a href="articles/{article['filename']}" class="text-decoration-none">{article['title']}</a></h3>
+                    <h3><a href="articles/{article['filename']}" class="text-decoration-none">{html.escape(article['title'])}</a></h3>
                     <p class="text-muted mb-2">
                         <svg class="svg-icon svg-icon-muted me-2" viewBox="0 0 24 24">
                             <path d="M19 3h-1V1h-2v2H8V1H6v2H5c-1.11 0-1.99.9-1.99 2L3 19c0 1.1.89 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zm0 16H5V8h14v11zM7 10h5v5H7z"/>
                         </svg>
                         {article['date_str']}
                     </p>
-                    <p class="mb-0">{article['description']}</p>
+                    <p class="mb-0">{html.escape(article['description'])}</p>
+                </div>'''
+        if len(articles) > INDEX_LIMIT:
+            articles_html += f'''
+                <div class="text-center my-4">
+                    <a href="archive/index.html" class="btn btn-outline-secondary">Tous les articles ({len(articles)})</a>
                 </div>'''
     else:
         articles_html = '''
@@ -117,9 +228,8 @@ def update_index_html():
     index_path = Path('index.html')
     if index_path.exists():
         try:
-            encoding = detect_encoding(index_path)
-            with open(index_path, 'r', encoding=encoding) as f:
-                current_content = f.read()
+            current_content, _ = decode_html(index_path.read_bytes())
+            original_content = current_content
         except Exception as e:
             print(f"⚠️ Erreur lecture index.html: {e}")
             print("📝 Création d'un nouveau index.html")
@@ -145,9 +255,13 @@ def update_index_html():
                 replacement = f'\\1<!-- Articles dynamiques -->{articles_html}<!-- Fin articles dynamiques -->\\3'
                 current_content = re.sub(pattern, replacement, current_content, flags=re.DOTALL)
             
-            # Sauvegarder
-            with open(index_path, 'w', encoding='utf-8') as f:
-                f.write(current_content)
+            # Header/footer inclus au build (remplace l'ancien chargement par fetch)
+            current_content = SiteFragments().inline(current_content)
+            
+            # Sauvegarder (seulement si la page change)
+            if current_content != original_content:
+                with open(index_path, 'w', encoding='utf-8') as f:
+                    f.write(current_content)
         else:
             # Créer un index.html minimal si erreur
             print("📝 Création d'un index.html minimal")
@@ -162,7 +276,8 @@ def update_index_html():
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
 </head>
 <body>
-    <div id="header-container"></div>
+    <!-- Seminary Header -->
+    <!-- /Seminary Header -->
     
     <div class="container my-5">
         <div class="row">
@@ -175,17 +290,13 @@ def update_index_html():
         </div>
     </div>
     
-    <div id="footer-container"></div>
-    
-    <script>
-        fetch('./templates/header.html').then(r => r.text()).then(h => document.getElementById('header-container').innerHTML = h);
-        fetch('./templates/footer.html').then(r => r.text()).then(h => document.getElementById('footer-container').innerHTML = h);
-    </script>
+    <!-- Seminary Footer -->
+    <!-- /Seminary Footer -->
 </body>
 </html>'''
             
             with open(index_path, 'w', encoding='utf-8') as f:
-                f.write(minimal_html)
+                f.write(SiteFragments().inline(minimal_html))
     
     print(f'✅ Index.html mis à jour avec {len(articles)} article(s)')
     return len(articles)
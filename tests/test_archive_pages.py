@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from scripts.archive_pages import ArchiveBuilder, month_label
+from scripts.site_fragments import SiteFragments
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+def _articles(dates):
+    return [{"filename": f"{date}-article.html", "date": date, "title": f"Article du {date}", "description": "Résumé"}
+            for date in sorted(dates, reverse=True)]
+
+
+def test_only_changed_archive_pages_are_rewritten(tmp_path):
+    fragments = SiteFragments(TEMPLATES_DIR, tmp_path / "site_fragments.json", tmp_path / "assets")
+    builder = ArchiveBuilder(tmp_path / "archive", TEMPLATES_DIR, fragments, page_size=2, assets_dir=tmp_path / "assets")
+    state = {}
+
+    written = builder.build(_articles(["2025-07-01", "2025-07-03", "2025-08-01"]), state)
+    assert sorted(p.name for p in written) == ["2025-07.html", "2025-08.html", "index.html", "page-1.html", "page-2.html"]
+    page_1 = (tmp_path / "archive" / "page-1.html").read_text(encoding="utf-8")
+    assert "../articles/2025-07-03-article.html" in page_1 and "<!-- /Seminary Footer -->" in page_1
+    assert builder.build(_articles(["2025-07-01", "2025-07-03", "2025-08-01"]), state) == []
+
+    # Nouvel article : la première page (pleine) et le mois de juillet ne changent pas
+    written = builder.build(_articles(["2025-07-01", "2025-07-03", "2025-08-01", "2025-08-05"]), state)
+    assert sorted(p.name for p in written) == ["2025-08.html", "index.html", "page-2.html"]
+
+
+def test_month_label_is_french():
+    assert month_label("2025-08") == "Août 2025"
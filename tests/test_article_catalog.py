@@ -0,0 +1,28 @@
+from scripts.article_catalog import ArticleCatalog
+
+
+def test_catalog_round_trip_and_latest_order(tmp_path):
+    catalog = ArticleCatalog(tmp_path / "articles.db")
+    first = catalog.upsert({"filename": "2025-01-02-b.html", "title": "B", "content": "<p>un deux trois</p>",
+                            "keywords": ["vosges"], "seo_score": 82.5, "metrics": {"duration_s": 12.0}})
+    catalog.upsert({"filename": "2025-01-01-a.html", "title": "A", "content": "<p>a</p>"})
+
+    record = catalog.get("2025-01-02-b.html")
+    assert record["content"] == "<p>un deux trois</p>" and record["word_count"] == 3
+    assert (record["keywords"], record["seo_score"], record["metrics"]) == (["vosges"], 82.5, {"duration_s": 12.0})
+    assert [a["title"] for a in catalog.latest(5)] == ["B", "A"]
+    assert "content" not in catalog.latest(1)[0]
+
+    # Les métriques ne changent pas le hash de rendu, le contenu si
+    assert catalog.upsert({"filename": "2025-01-02-b.html", "title": "B", "content": "<p>un deux trois</p>",
+                           "seo_score": 90}) == first
+    assert catalog.upsert({"filename": "2025-01-02-b.html", "title": "B", "content": "<p>autre</p>"}) != first
+
+
+def test_database_is_created_on_first_access(tmp_path):
+    db_path = tmp_path / "data" / "articles.db"
+    catalog = ArticleCatalog(db_path)
+    assert not db_path.exists()
+
+    catalog.upsert({"filename": "2025-01-01-a.html", "title": "A", "content": "<p>a</p>"})
+    assert db_path.exists() and len(catalog) == 1
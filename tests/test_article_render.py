@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from scripts import article_generator
+from scripts.article_generator import ArticleGenerator
+from scripts.rate_limiter import RateLimiter
+from scripts.site_fragments import SiteFragments
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+ARTICLE = {
+    "content": "<h2>Pourquoi les Vosges</h2><p>Un séminaire au calme, entre lacs et forêts.</p>",
+    "metadata": {"title": "Séminaire d'entreprise dans les Vosges", "description": "Guide pratique"},
+    "word_count": 400
+}
+
+
+def test_audited_page_is_the_published_page(tmp_path):
+    gen = ArticleGenerator(openrouter_api_key="test_key")
+    gen.site_fragments = SiteFragments(TEMPLATES_DIR, tmp_path / "site_fragments.json", tmp_path / "assets")
+    gen.rate_limiter = RateLimiter(tmp_path / "rate_limits.json")
+    html = gen.render_article(ARTICLE)
+    assert "Séminaire d&#39;entreprise dans les Vosges</title>" in html
+    assert "<p>Un séminaire au calme, entre lacs et forêts.</p>" in html
+
+    # Même version du contenu : rendu et audit réutilisés par le Pass 4
+    assert gen.render_article(dict(ARTICLE)) is html
+    audit = gen.pass2_seo_audit(ARTICLE)
+    assert gen.audit_html(html) is audit
+
+
+def test_pass4_parses_the_rendered_page_once(tmp_path, monkeypatch):
+    gen = ArticleGenerator(openrouter_api_key="test_key")
+    gen.site_fragments = SiteFragments(TEMPLATES_DIR, tmp_path / "site_fragments.json", tmp_path / "assets")
+    gen.rate_limiter = RateLimiter(tmp_path / "rate_limits.json")
+    article = dict(ARTICLE, content=ARTICLE["content"] + "<p>Organisez votre séminaire d'entreprise avec Seminary.</p>" * 3)
+    rendered = gen.render_article(article)
+
+    parsed = []
+    original = article_generator.BeautifulSoup
+    monkeypatch.setattr(article_generator, "BeautifulSoup",
+                        lambda markup, *args, **kwargs: parsed.append(markup) or original(markup, *args, **kwargs))
+
+    result = gen.pass4_seminary_integration(article)
+    assert parsed.count(rendered) == 1 and result["html_valid"]
+    assert "lacs et forêts" in result["final_html"]
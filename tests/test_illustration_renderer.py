@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from scripts.illustration_renderer import IllustrationRenderer, extract_figures
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+def test_extract_figures_labels_percentages():
+    text = "<p>87 % des participants progressent, 30% de la productivité et 250% ignoré.</p>"
+    assert extract_figures(text) == {"Participants progressent": 87, "Productivité": 30}
+
+
+def test_render_uses_registry_defaults_and_validates_data():
+    renderer = IllustrationRenderer(TEMPLATES_DIR)
+
+    default_chart = renderer.render("chart", chart_type="bar")
+    assert '<div class="seminary-chart-container">' in default_chart
+    assert "Cohésion équipe" in default_chart
+
+    custom = renderer.render("chart", chart_type="progress", data={"<b>Engagement</b>": 64})
+    assert "64%" in custom and "&lt;b&gt;Engagement&lt;/b&gt;" in custom
+
+    invalid = renderer.render("chart", chart_type="bar", data={"Trop": 500})
+    assert "Trop" not in invalid and "Cohésion équipe" in invalid
+
+    assert 'class="seminary-default-illustration"' in renderer.render("inconnu")
+
+
+def test_suggest_feeds_article_figures_to_charts():
+    renderer = IllustrationRenderer(TEMPLATES_DIR)
+    suggestions = renderer.suggest("Une étude : 87 % des managers et 64 % des équipes", "Bilan")
+
+    chart = suggestions[0]
+    assert chart["illustration_type"] == "chart" and chart["chart_type"] == "bar"
+    assert chart["data"] == {"Managers": 87, "Équipes": 64}
+    assert renderer.suggest("Texte neutre", "Titre")[0]["illustration_type"] == "icon"
+
+
+def test_bar_chart_accepts_all_zero_data():
+    chart = IllustrationRenderer(TEMPLATES_DIR).render("chart", chart_type="bar", data={"a": 0, "b": 0})
+    assert chart.count("--final-height: 0.0%") == 2
@@ -0,0 +1,42 @@
+import json
+import time
+
+from scripts.image_cache import SearchCache
+
+
+def test_set_appends_single_line(tmp_path):
+    log = tmp_path / "cache.jsonl"
+    cache = SearchCache(log, ttl=3600, max_entries=10)
+    cache.set("a", {"query": "a", "images": []})
+    cache.set("b", {"query": "b", "images": []})
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 2
+
+    reloaded = SearchCache(log, ttl=3600, max_entries=10)
+    assert reloaded.get("a")["query"] == "a"
+
+
+def test_ttl_and_lru_eviction(tmp_path):
+    log = tmp_path / "cache.jsonl"
+    cache = SearchCache(log, ttl=3600, max_entries=2)
+    cache.set("old", {"query": "old", "images": [], "timestamp": time.time() - 7200})
+    assert cache.get("old") is None
+
+    cache.set("a", {"query": "a", "images": []})
+    cache.set("b", {"query": "b", "images": []})
+    cache.get("a")
+    cache.set("c", {"query": "c", "images": []})
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_legacy_migration_and_truncated_line(tmp_path):
+    legacy = tmp_path / "cache.json"
+    legacy.write_text(json.dumps({"k": {"timestamp": time.time(), "query": "k", "images": []}}), encoding="utf-8")
+    log = tmp_path / "cache.jsonl"
+    cache = SearchCache(log, legacy_file=legacy)
+    assert cache.get("k")["query"] == "k"
+    assert not legacy.exists()
+
+    with open(log, "a", encoding="utf-8") as f:
+        f.write('{"op":"set","key":"broken"')
+    assert SearchCache(log).get("k") is not None
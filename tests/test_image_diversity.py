@@ -0,0 +1,30 @@
+from scripts.image_diversity import DiversityScheduler
+
+SAME_LOOK = "LEHV6nWB2yk8pyo0adR*.7kCMdnj"
+
+
+def test_recently_used_images_and_clusters_are_demoted(tmp_path):
+    scheduler = DiversityScheduler(tmp_path / "image_usage.json", window=4)
+    scheduler.record_article("a.html", [{"id": "used", "blur_hash": SAME_LOOK}])
+
+    candidates = [
+        {"id": "used", "relevance_score": 9.0, "blur_hash": SAME_LOOK},
+        {"id": "lookalike", "relevance_score": 8.0, "blur_hash": SAME_LOOK},
+        {"id": "fresh", "relevance_score": 6.0},
+    ]
+    ranked = DiversityScheduler(tmp_path / "image_usage.json", window=4).rank(candidates)
+    assert [c["id"] for c in ranked] == ["fresh", "lookalike", "used"]
+
+
+def test_penalty_decays_and_index_stays_bounded(tmp_path):
+    scheduler = DiversityScheduler(tmp_path / "image_usage.json", window=2)
+    scheduler.record_article("a.html", [{"id": "old"}])
+    assert scheduler.penalty({"id": "old"}) == 10.0
+
+    scheduler.record_article("b.html", [])
+    assert scheduler.penalty({"id": "old"}) == 5.0
+
+    scheduler.record_article("c.html", [])
+    assert scheduler.penalty({"id": "old"}) == 0.0
+    assert "old" not in scheduler.usage["images"]
+    assert set(scheduler.usage["articles"]) == {"b.html", "c.html"}
@@ -0,0 +1,44 @@
+from scripts.image_library import ImageLibrary
+
+
+def _image(image_id, description, tags=(), width=1600, height=900):
+    return {"id": image_id, "description": description, "tags": list(tags), "width": width, "height": height}
+
+
+def test_search_scores_like_relevance_and_persists(tmp_path):
+    library = ImageLibrary(tmp_path / "image_library.json")
+    library.add_many([
+        _image("a", "Team building in the mountains", tags=["nature"]),
+        _image("b", "Office desk", width=800, height=600),
+    ], search_query="corporate retreat mountain")
+    library.save()
+
+    results = ImageLibrary(tmp_path / "image_library.json").search(["team building"], ["mountains outdoor"])
+    assert [image["id"] for image in results] == ["a"]
+    # +2 mot-clé, +1 mot de requête, +1 grande image
+    assert results[0]["relevance_score"] == 4.0
+    assert "features" not in results[0]
+
+
+def test_re_adding_an_image_updates_the_index(tmp_path):
+    library = ImageLibrary(tmp_path / "image_library.json")
+    library.add(_image("a", "forest path"))
+    library.add(_image("a", "lake shore"))
+
+    assert library.search(["lake"], [])[0]["id"] == "a"
+    assert library.search(["lake"], [])[0]["search_query"] == ""
+    assert library.search([], ["corporate"]) == []
+
+
+def test_origin_query_does_not_score_an_off_topic_image(tmp_path):
+    from scripts.image_handler import ImageHandler
+
+    query = "seminaire entreprise vosges"
+    library = ImageLibrary(tmp_path / "image_library.json")
+    library.add(_image("car", "a red car parked on the street"), search_query=query)
+
+    results = library.search(["séminaire"], [query, "Seminaire, Vosges!"])
+    threshold = ImageHandler().image_config["local_relevance_threshold"]
+    assert all(image["relevance_score"] < threshold for image in results)
+    assert library.search([], ["red car"])[0]["search_query"] == "red car"
+
@@ -0,0 +1,26 @@
+import base64
+import io
+
+from PIL import Image
+
+from scripts.image_placeholders import blurhash_data_uri, decode_blurhash, placeholder_style
+
+BLUR_HASH = "LEHV6nWB2yk8pyo0adR*.7kCMdnj"
+
+
+def test_decode_blurhash_returns_one_pixel_per_position():
+    pixels = decode_blurhash(BLUR_HASH, 8, 6)
+    assert len(pixels) == 48
+    assert all(0 <= channel <= 255 for pixel in pixels for channel in pixel)
+
+
+def test_data_uri_is_a_tiny_png_with_the_image_ratio():
+    uri = blurhash_data_uri(BLUR_HASH, 1200 / 800, width=30)
+    with Image.open(io.BytesIO(base64.b64decode(uri.split(",", 1)[1]))) as img:
+        assert img.size == (30, 20)
+
+
+def test_placeholder_style_falls_back_to_colour_on_invalid_hash():
+    style = placeholder_style("not-a-hash", "#d9d9c0", 1200, 800)
+    assert style == "aspect-ratio: 1200 / 800; background-color: #d9d9c0;"
+    assert "url(data:image/png;base64," in placeholder_style(BLUR_HASH, None, 1200, 800)
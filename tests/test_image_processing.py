@@ -0,0 +1,17 @@
+from PIL import Image
+
+from scripts.image_processing import process_image
+
+
+def test_process_image_resizes_and_strips_exif(tmp_path):
+    source = tmp_path / "raw.jpg"
+    img = Image.new("RGB", (2400, 1600), (126, 34, 206))
+    exif = img.getexif()
+    exif[0x010F] = "Camera"
+    img.save(source, exif=exif)
+
+    result = process_image(source, tmp_path / "final.jpg", max_width=1200, quality=80)
+
+    assert (result["width"], result["height"]) == (1200, 800)
+    with Image.open(tmp_path / "final.jpg") as final:
+        assert not dict(final.getexif())
@@ -0,0 +1,64 @@
+from PIL import Image, ImageDraw
+
+from scripts.image_store import ImageStore
+
+
+def _make_image(path, color, seed=0):
+    img = Image.new("RGB", (320, 200), color)
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((seed * 40, 20, seed * 40 + 120, 180), fill=(255, 255, 255))
+    img.save(path, quality=90)
+
+
+def test_blobs_are_content_addressed_and_visual_duplicates_rejected(tmp_path):
+    store = ImageStore(tmp_path / "images", tmp_path / "manifest.json")
+
+    _make_image(tmp_path / "a.jpg", (10, 80, 30))
+    digest = store.add(tmp_path / "a.jpg", unsplash_id="A")
+    assert store.blob_path(digest).name == f"{digest}.jpg"
+    assert store.find_by_unsplash_id("A") == digest
+
+    _make_image(tmp_path / "b.jpg", (10, 80, 30))
+    Image.open(tmp_path / "b.jpg").resize((300, 188)).save(tmp_path / "b.jpg", quality=60)
+    assert store.add(tmp_path / "b.jpg", unsplash_id="B") is None
+
+
+def test_garbage_collection_follows_references(tmp_path):
+    articles = tmp_path / "articles"
+    articles.mkdir()
+    store = ImageStore(tmp_path / "images", tmp_path / "manifest.json")
+
+    _make_image(tmp_path / "kept.jpg", (200, 30, 30), seed=0)
+    _make_image(tmp_path / "dropped.jpg", (30, 30, 200), seed=4)
+    kept = store.add(tmp_path / "kept.jpg", unsplash_id="K")
+    dropped = store.add(tmp_path / "dropped.jpg", unsplash_id="D")
+    (tmp_path / "images" / f"{kept}-400.webp").write_bytes(b"variant")
+
+    (articles / "2025-01-01-post.html").write_text("<html></html>", encoding="utf-8")
+    store.set_article_references("2025-01-01-post.html", [kept])
+    (tmp_path / "images" / "legacy_photo.jpg").write_bytes(b"legacy")
+    (articles / "2025-01-02-old.html").write_text('<img src="../images/legacy_photo.jpg">', encoding="utf-8")
+
+    removed = store.collect_garbage(articles, extra_pages=())
+
+    assert removed == [f"{dropped}.jpg"]
+    assert (tmp_path / "images" / f"{kept}-400.webp").exists()
+    assert store.find_by_unsplash_id("D") is None
+
+
+def test_unsplash_photo_used_by_an_article_is_not_reused(tmp_path):
+    from scripts.image_handler import ImageHandler
+
+    store = ImageStore(tmp_path / "images", tmp_path / "manifest.json")
+    _make_image(tmp_path / "used.jpg", (200, 30, 30), seed=0)
+    _make_image(tmp_path / "free.jpg", (30, 30, 200), seed=4)
+    used = store.add(tmp_path / "used.jpg", unsplash_id="USED")
+    free = store.add(tmp_path / "free.jpg", unsplash_id="FREE")
+    store.set_article_references("2025-01-01-post.html", [used])
+
+    handler = ImageHandler()
+    handler.image_store = store
+
+    assert store.is_referenced(used) and not store.is_referenced(free)
+    assert handler.download_image({"id": "USED"}) is None
+    assert handler.download_image({"id": "FREE"}) == str(store.blob_path(free))
@@ -0,0 +1,21 @@
+from PIL import Image
+
+from scripts.image_variants import build_variants, render_picture_html
+
+
+def test_variants_are_content_hashed_and_rendered(tmp_path):
+    source = tmp_path / "photo.jpg"
+    Image.new("RGB", (1000, 500), (20, 120, 60)).save(source)
+
+    variants = build_variants(source, tmp_path / "out", widths=(400, 800, 1200))
+
+    jpeg_widths = [width for _, width in variants["sources"]["image/jpeg"]]
+    assert jpeg_widths == [400, 800, 1000]
+    assert (tmp_path / "out" / variants["fallback"]).exists()
+    assert variants["fallback"].startswith(variants["hash"])
+
+    html = render_picture_html(variants, alt='Salle "nature"')
+    assert html.startswith("<picture>") and 'type="image/webp"' in html
+    assert 'width="1000" height="500"' in html
+    assert 'loading="lazy"' in html and 'decoding="async"' in html
+    assert "&quot;nature&quot;" in html
@@ -0,0 +1,33 @@
+import time
+
+from scripts.llm_output import (benchmark, clean_generated_content, ensure_valid_title, extract_article_html,
+                                extract_metadata, extract_summary, synthetic_response)
+
+
+def test_reasoning_is_removed_after_the_closing_tag():
+    article = "<h1>Titre</h1>" + "<p>Paragraphe de l'article.</p>" * 10
+    assert extract_article_html(f"<think>Je dois réfléchir</think>\n{article}") == article
+    assert extract_summary("<think>hmm</think> Un résumé de plus de vingt caractères.") == \
+        "Un résumé de plus de vingt caractères."
+    assert extract_summary("Je vais résumer.\nLes Vosges accueillent les séminaires.") == \
+        "Les Vosges accueillent les séminaires."
+
+
+def test_metadata_and_title_helpers():
+    content = clean_generated_content("Voici: < h1 >Séminaire d'entreprise dans les Vosges en été</h1><p>Un <b>séminaire</b> au calme.</p>")
+    assert content.startswith("<h1>")
+    assert extract_metadata(content) == {"title": "Séminaire d'entreprise dans les Vosges en été",
+                                         "description": "Un séminaire au calme."}
+    assert ensure_valid_title(content) == content
+    assert ensure_valid_title("<h1>Court</h1><p>Organiser un séminaire au vert</p>") == \
+        "<h1>Organiser un séminaire au vert - Séminaire dans les Vosges</h1><p>Organiser un séminaire au vert</p>"
+
+
+def test_unclosed_tags_are_processed_in_linear_time():
+    response = synthetic_response(300_000).replace("</think>", "").replace("</h1>", "")
+    start = time.perf_counter()
+    extract_article_html(response)
+    extract_metadata(response)
+    ensure_valid_title(response)
+    assert time.perf_counter() - start < 1.0
+    assert {result["step"] for result in benchmark([5_000], repeat=1)} >= {"extract_article_html", "extract_metadata"}
@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 
 from scripts.article_generator import ArticleGenerator
+from scripts.rate_limiter import RateLimiter
 
 
 def fake_post(url, headers=None, json=None, timeout=60):
@@ -19,7 +20,8 @@ def fake_post(url, headers=None, json=None, timeout=60):
     return FakeResponse()
 
 @patch('scripts.article_generator.requests.post', side_effect=fake_post)
-def test_openrouter_call(mock_post):
+def test_openrouter_call(mock_post, tmp_path):
     gen = ArticleGenerator(openrouter_api_key="test_key")
+    gen.rate_limiter = RateLimiter(tmp_path / "rate_limits.json")
     result = gen.call_openrouter_api("Bonjour", max_tokens=10)
     assert result.startswith("<h1>") 
\ No newline at end of file
@@ -0,0 +1,38 @@
+import gzip
+import os
+
+from scripts.precompress import Precompressor
+
+
+def test_only_changed_files_are_recompressed(tmp_path):
+    page = tmp_path / "page.html"
+    page.write_text("<p>Séminaire dans les Vosges</p>" * 50, encoding="utf-8")
+    tiny = tmp_path / "tiny.json"
+    tiny.write_text("[]", encoding="utf-8")
+    compressor = Precompressor(tmp_path / "precompress.json", workers=1, stat_cache_file=tmp_path / "stat_cache.json")
+
+    report = compressor.run([page, tiny])
+    assert report["compressed"] == 1 and not (tmp_path / "tiny.json.gz").exists()
+    assert gzip.decompress((tmp_path / "page.html.gz").read_bytes()) == page.read_bytes()
+    assert report["total"]["ratio.gz"] < 0.2
+
+    assert compressor.run([page, tiny])["compressed"] == 0
+    page.write_text("<p>Nouveau contenu</p>" * 50, encoding="utf-8")
+    assert compressor.run([page, tiny])["compressed"] == 1
+
+    compressor.run([tiny])
+    assert not (tmp_path / "page.html.gz").exists()
+
+
+def test_touched_files_leave_the_state_unchanged(tmp_path):
+    page = tmp_path / "page.html"
+    page.write_text("<p>Séminaire dans les Vosges</p>" * 50, encoding="utf-8")
+    Precompressor(tmp_path / "precompress.json", workers=1, stat_cache_file=tmp_path / "stat_cache.json").run([page])
+    state = (tmp_path / "precompress.json").read_text(encoding="utf-8")
+    assert "mtime" not in state
+
+    # Checkout : nouveaux mtime, même contenu → rien à recompresser ni à réécrire dans l'état versionné
+    os.utime(page, ns=(1, 1))
+    compressor = Precompressor(tmp_path / "precompress.json", workers=1, stat_cache_file=tmp_path / "stat_cache.json")
+    assert compressor.run([page])["compressed"] == 0
+    assert (tmp_path / "precompress.json").read_text(encoding="utf-8") == state
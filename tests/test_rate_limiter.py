@@ -0,0 +1,37 @@
+from scripts.rate_limiter import RateLimiter
+
+
+def test_buckets_are_shared_between_instances(tmp_path):
+    state = tmp_path / "rate_limits.json"
+    first = RateLimiter(state)
+    second = RateLimiter(state)
+    first.configure("unsplash", 2, 3600)
+    second.configure("unsplash", 2, 3600)
+
+    assert first.try_acquire("unsplash")
+    assert second.try_acquire("unsplash")
+    assert not first.try_acquire("unsplash")
+
+
+def test_sync_from_headers_caps_tokens(tmp_path):
+    limiter = RateLimiter(tmp_path / "rate_limits.json")
+    limiter.configure("unsplash", 50, 3600)
+    limiter.sync_from_headers("unsplash", {"X-Ratelimit-Remaining": "0"})
+
+    assert limiter.status("unsplash")["blocked"]
+    assert not limiter.try_acquire("unsplash")
+
+
+def test_status_does_not_write_state(tmp_path):
+    state = tmp_path / "rate_limits.json"
+    limiter = RateLimiter(state)
+
+    assert limiter.status("unsplash")["remaining"] == 50
+    assert not state.exists()
+
+
+def test_small_reset_header_is_a_delay(tmp_path):
+    limiter = RateLimiter(tmp_path / "rate_limits.json")
+    limiter.sync_from_headers("openrouter", {"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": "30"})
+
+    assert limiter.status("openrouter")["blocked"]
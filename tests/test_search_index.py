@@ -0,0 +1,34 @@
+import json
+
+from scripts.search_index import SearchIndexBuilder, tokenize
+
+
+def _article(tmp_path, name, title, body, digest):
+    (tmp_path / "articles" / name).write_text(f'<div class="article-content"><p>{body}</p></div>', encoding="utf-8")
+    return {"filename": name, "date": name[:10], "title": title, "description": "", "hash": digest}
+
+
+def test_tokenize_folds_accents_and_stems_french():
+    assert tokenize("Les Séminaires d'équipe") == tokenize("seminaire EQUIPES")
+    assert tokenize("Séminaires d'équipe") == ["seminair", "equip"]
+
+
+def test_new_article_only_rewrites_its_shards(tmp_path):
+    (tmp_path / "articles").mkdir()
+    builder = SearchIndexBuilder(tmp_path / "search", articles_dir=tmp_path / "articles")
+    state = {}
+    first = _article(tmp_path, "2025-01-01-a.html", "Séminaire", "Randonnée en montagne", "h1")
+    builder.build([first], state)
+    assert builder.build([first], state) == []
+
+    second = _article(tmp_path, "2025-02-01-b.html", "Cohésion", "Escalade", "h2")
+    written = {path.name for path in builder.build([second, first], state)}
+    assert written == {"co.json", "es.json", "docs.json", "meta.json"}
+
+    shard = json.loads((tmp_path / "search" / "se.json").read_text(encoding="utf-8"))
+    assert shard["seminair"] == [0, 3]
+
+    builder.build([second], state)
+    docs = json.loads((tmp_path / "search" / "docs.json").read_text(encoding="utf-8"))
+    assert docs == [None, ["2025-02-01-b.html", "Cohésion", "2025-02-01"]]
+    assert not (tmp_path / "search" / "se.json").exists()
@@ -0,0 +1,75 @@
+from pathlib import Path
+
+from scripts.article_catalog import ArticleCatalog
+from scripts.site_builder import SiteBuilder, extract_source, render_page
+from scripts.site_fragments import SiteFragments
+
+TEMPLATE = (
+    "<html><head><meta name=\"description\" content=\"{{ meta_description }}\">{{ styles_html | safe }}</head><body>"
+    "{{ header_html | safe }}<div class=\"article-meta\"><span class=\"date\">{{ publish_date }}</span>"
+    "<span class=\"reading-time\">{{ reading_time }} min de lecture</span></div>"
+    "<h1 class=\"article-title\">{{ article_title }}</h1>"
+    "<div class=\"article-content\">{{ article_content | safe }}</div>{{ footer_html | safe }}</body></html>"
+)
+
+
+def _builder(tmp_path, template=TEMPLATE):
+    templates = tmp_path / "templates"
+    (templates / "css").mkdir(parents=True, exist_ok=True)
+    (templates / "article_template.html").write_text(template, encoding="utf-8")
+    for name in ("styles", "header", "footer"):
+        (templates / f"{name}.html").write_text(f"<!-- {name} -->", encoding="utf-8")
+    for name in ("article_critical", "article", "illustrations"):
+        (templates / "css" / f"{name}.css").write_text(".a{}", encoding="utf-8")
+    cache_dir = tmp_path / "data" / "jinja_cache"
+    fragments = SiteFragments(templates, tmp_path / "data" / "site_fragments.json", tmp_path / "assets", cache_dir)
+    return SiteBuilder(ArticleCatalog(tmp_path / "data" / "articles.db"), tmp_path / "data" / "site_build.json",
+                       tmp_path / "articles", templates, fragments, cache_dir=cache_dir)
+
+
+def test_extract_source_requires_template_structure():
+    html = TEMPLATE.replace("{{ publish_date }}", "21/06/2025").replace("{{ reading_time }}", "3") \
+        .replace("{{ article_title }}", "Titre").replace("{{ article_content | safe }}", '<p>Texte <a href="https://goseminary.com">lien</a></p>')
+    source = extract_source(html, "a.html")
+    assert (source["title"], source["publish_date"], source["reading_time"]) == ("Titre", "21/06/2025", 3)
+    assert source["links"] == ["https://goseminary.com"]
+    assert extract_source("<h1>Ancien</h1><div class=\"article-content\"></div>", "b.html") is None
+
+
+def test_build_renders_only_pages_whose_inputs_changed(tmp_path):
+    builder = _builder(tmp_path)
+    for name in ("a", "b"):
+        builder.save_source({"filename": f"{name}.html", "title": name.upper(), "content": f"<p>{name}</p>",
+                             "publish_date": "01/01/2025", "reading_time": 1})
+
+    assert len(builder.build()) == 2
+    assert _builder(tmp_path).build() == []
+
+    builder = _builder(tmp_path)
+    builder.save_source({"filename": "a.html", "title": "A2", "content": "<p>a</p>", "publish_date": "01/01/2025"})
+    assert builder.build() == [tmp_path / "articles" / "a.html"]
+
+    rebuilt = _builder(tmp_path, TEMPLATE.replace("<body>", "<body class=\"v2\">")).build()
+    assert len(rebuilt) == 2 and "v2" in rebuilt[0].read_text(encoding="utf-8")
+
+
+def test_base_layout_change_invalidates_inheriting_pages(tmp_path):
+    builder = _builder(tmp_path, '{% extends "base.html" %}{% block body %}' + TEMPLATE + '{% endblock %}')
+    (tmp_path / "templates" / "base.html").write_text("{% block body %}{% endblock %}", encoding="utf-8")
+    builder.save_source({"filename": "a.html", "title": "A", "content": "<p>a</p>", "publish_date": "01/01/2025"})
+    assert len(builder.build()) == 1
+    assert "<p>a</p>" in (tmp_path / "articles" / "a.html").read_text(encoding="utf-8")
+
+    (tmp_path / "templates" / "base.html").write_text("<i>v2</i>{% block body %}{% endblock %}", encoding="utf-8")
+    assert _builder(tmp_path, '{% extends "base.html" %}{% block body %}' + TEMPLATE + '{% endblock %}').build() != []
+
+
+def test_fragment_sync_leaves_built_pages_untouched(tmp_path):
+    # Fragments réels (attributs style du header) : même sérialisation au build et à la synchronisation
+    templates = Path(__file__).resolve().parent.parent / "templates"
+    fragments = SiteFragments(templates, tmp_path / "site_fragments.json", tmp_path / "assets", tmp_path / "jinja_cache")
+    source = {"filename": "2025-01-01-a.html", "title": "Titre", "content": "<p>Texte</p>"}
+
+    page = render_page(str(templates), fragments.render(), source, str(tmp_path / "jinja_cache"))
+    assert 'style="' in page
+    assert fragments.inline(page) == page
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from scripts.site_feeds import SiteFeeds
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+def _articles(*specs):
+    return [{"filename": f"{date}-article.html", "date": date, "title": f"Article & {date}", "description": "Résumé",
+             "hash": digest} for date, digest in specs]
+
+
+def test_lastmod_only_moves_when_content_hash_changes(tmp_path):
+    feeds = SiteFeeds(tmp_path, TEMPLATES_DIR, feed_size=1)
+    state = {}
+    articles = _articles(("2025-08-01", "a"), ("2025-07-01", "b"))
+
+    written = feeds.build(articles, {"index.html": "s1"}, state, today="2025-08-02")
+    assert sorted(p.name for p in written) == ["feed.xml", "sitemap.xml"]
+    sitemap = (tmp_path / "sitemap.xml").read_text(encoding="utf-8")
+    assert "<loc>https://blog.goseminary.com/articles/2025-07-01-article.html</loc>\n    <lastmod>2025-07-01</lastmod>" in sitemap
+    feed = (tmp_path / "feed.xml").read_text(encoding="utf-8")
+    assert "Article &amp; 2025-08-01" in feed and "2025-07-01-article" not in feed
+
+    assert feeds.build(articles, {"index.html": "s1"}, state, today="2025-08-03") == []
+
+    articles = _articles(("2025-08-01", "a"), ("2025-07-01", "b2"))
+    feeds.build(articles, {"index.html": "s1"}, state, today="2025-08-04")
+    sitemap = (tmp_path / "sitemap.xml").read_text(encoding="utf-8")
+    assert "2025-07-01-article.html</loc>\n    <lastmod>2025-08-04</lastmod>" in sitemap
+    assert "archive/index.html</loc>\n    <lastmod>2025-08-02</lastmod>" in sitemap
+
+
+def test_sitemap_index_above_url_limit(tmp_path):
+    feeds = SiteFeeds(tmp_path, TEMPLATES_DIR, max_sitemap_urls=2)
+    state = {}
+    feeds.build(_articles(("2025-08-01", "a"), ("2025-07-01", "b")), {}, state, today="2025-08-02")
+    assert "<sitemapindex" in (tmp_path / "sitemap.xml").read_text(encoding="utf-8")
+    assert (tmp_path / "sitemap-2.xml").exists()
+
+    feeds.build(_articles(("2025-08-01", "a")), {}, state, today="2025-08-02")
+    assert "<urlset" in (tmp_path / "sitemap.xml").read_text(encoding="utf-8")
+    assert not (tmp_path / "sitemap-2.xml").exists()
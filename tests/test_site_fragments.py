@@ -0,0 +1,54 @@
+from scripts.site_fragments import SiteFragments
+
+
+def _fragments(tmp_path, header="<header>\n  <nav>Menu</nav>\n</header>"):
+    templates = tmp_path / "templates"
+    templates.mkdir(exist_ok=True)
+    (templates / "header.html").write_text(header, encoding="utf-8")
+    (templates / "footer.html").write_text("<footer>Pied</footer>", encoding="utf-8")
+    (templates / "styles.html").write_text(
+        '<style>{{ critical_css|safe }}</style>\n<link rel="stylesheet" href="{{ stylesheet_href }}">', encoding="utf-8"
+    )
+    (templates / "css").mkdir(exist_ok=True)
+    (templates / "css" / "article_critical.css").write_text("body { margin: 0; }", encoding="utf-8")
+    (templates / "css" / "article.css").write_text(".a { color: red; }", encoding="utf-8")
+    (templates / "css" / "illustrations.css").write_text(".b { color: blue; }", encoding="utf-8")
+    return SiteFragments(templates, tmp_path / "data" / "site_fragments.json", tmp_path / "assets",
+                         tmp_path / "data" / "jinja_cache")
+
+
+def test_inline_replaces_fetch_containers_and_legacy_markers(tmp_path):
+    fragments = _fragments(tmp_path)
+    legacy_index = (
+        '<body>\n<!-- Seminary Header -->\n<div id="header-container"></div>\n<main></main>\n'
+        '<div id="footer-container"></div>\n'
+        "<script>\nfetch('./templates/header.html').then(r => r.text());\n</script>\n</body>"
+    )
+    html = fragments.inline(legacy_index)
+    assert "<!-- Seminary Header --><header><nav>Menu</nav></header><!-- /Seminary Header -->" in html
+    assert "<footer>Pied</footer><!-- /Seminary Footer -->" in html
+    assert "container" not in html and "fetch(" not in html
+    assert fragments.inline(html) == html
+
+
+def test_pages_are_rewritten_only_when_fragments_change(tmp_path):
+    page = tmp_path / "article.html"
+    page.write_text("<!-- Seminary Header -->\n<p>Texte</p>\n<!-- Seminary Footer -->", encoding="utf-8")
+
+    assert _fragments(tmp_path).sync_pages([page]) == [page]
+    assert _fragments(tmp_path).sync_pages([page]) == []
+
+    assert _fragments(tmp_path, header="<header>Nouveau</header>").sync_pages([page]) == [page]
+    assert "<header>Nouveau</header>" in page.read_text(encoding="utf-8")
+
+
+def test_legacy_article_styles_are_replaced_by_critical_css_and_shared_stylesheet(tmp_path):
+    fragments = _fragments(tmp_path)
+    article = "<head>\n<!-- Article-specific styles -->\n<style>\n body { margin: 0; }\n .a { color: red; }\n</style>\n</head>"
+
+    html = fragments.inline(article)
+    href = fragments.stylesheet_href()
+    assert '<style>body{margin:0}</style><link rel="stylesheet" href="%s">' % href in html
+    assert "<!-- /Seminary Styles -->" in html and ".a" not in html
+    assert (tmp_path / "assets" / href.rsplit("/", 1)[1]).read_text(encoding="utf-8") == ".a{color:red}.b{color:blue}"
+    assert fragments.inline("<head><style>.index{}</style></head>") == "<head><style>.index{}</style></head>"
@@ -0,0 +1,42 @@
+from scripts.static_assets import minify_css, minify_html, minify_markup, publish_bundle, publish_stylesheet
+
+
+def test_minify_css_and_markup():
+    assert minify_css("/* titre */\n.a ,\n.b {\n  color : red ;\n}\n") == ".a,.b{color:red}"
+    markup = '<div class="x">\n    <!-- commentaire -->\n    <svg width="2">\n        <circle r="1"/>\n    </svg>\n</div>'
+    assert minify_markup(markup) == '<div class="x"><svg width="2"><circle r="1"/></svg></div>'
+    assert minify_markup("<!-- Articles dynamiques -->\n<p>a</p>") == "<!-- Articles dynamiques --><p>a</p>"
+    assert minify_markup("<style>\n  .a { color : red ; }\n</style>") == "<style>.a{color:red}</style>"
+
+
+def test_publish_stylesheet_is_fingerprinted_by_content(tmp_path):
+    source = tmp_path / "illustrations.css"
+    source.write_text(".a { margin: 0; }", encoding="utf-8")
+
+    filename = publish_stylesheet(source, tmp_path / "assets")
+    assert filename.startswith("illustrations.") and filename.endswith(".css")
+    assert (tmp_path / "assets" / filename).read_text(encoding="utf-8") == ".a{margin:0}"
+
+
+def test_publish_bundle_concatenates_sources_in_order(tmp_path):
+    first, second = tmp_path / "article.css", tmp_path / "illustrations.css"
+    first.write_text(".a { margin: 0; }", encoding="utf-8")
+    second.write_text("/* x */ .b { padding: 0; }", encoding="utf-8")
+
+    filename = publish_bundle("article", [first, second], tmp_path / "assets")
+    assert filename.startswith("article.")
+    assert (tmp_path / "assets" / filename).read_text(encoding="utf-8") == ".a{margin:0}.b{padding:0}"
+
+
+def test_minify_html_keeps_preformatted_text_and_markers():
+    html = ('<!DOCTYPE html>\n<html>\n  <head>\n    <!-- commentaire -->\n    <script src="a.js" defer="defer"></script>\n'
+            '  </head>\n  <body>\n    <!-- Seminary Header --><header>Menu</header><!-- /Seminary Header -->\n'
+            '    <div style="color : red ;">\n      <p>Un   texte</p>\n    </div>\n'
+            '    <pre>  ligne 1\n  ligne 2</pre>\n  </body>\n</html>\n')
+    minified = minify_html(html)
+    assert "commentaire" not in minified
+    assert '<script src="a.js" defer></script>' in minified
+    assert "<!-- Seminary Header --><header>Menu</header><!-- /Seminary Header -->" in minified
+    assert '<div style="color:red"><p>Un texte</p></div>' in minified
+    assert "<pre>  ligne 1\n  ligne 2</pre>" in minified
+    assert minify_html(minified) == minified
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+from scripts.article_catalog import ArticleCatalog
+from scripts.topic_tags import TopicPageBuilder, TopicTagger, is_topic_word
+from scripts.site_fragments import SiteFragments
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+BODIES = {
+    "2025-01-01-a.html": "La randonnée en raquettes, la randonnée au sommet. La gastronomie locale et la gastronomie du terroir.",
+    "2025-01-02-b.html": "Une randonnée guidée, l'escalade en falaise, l'escalade en salle. La gastronomie du terroir.",
+    "2025-01-03-c.html": "Un atelier cuisine : la gastronomie, la fromagerie, la fromagerie fermière. L'escalade le matin.",
+}
+
+
+def _record(filename, body):
+    return {"filename": filename, "title": "Séminaire", "content": f"<p>{body}</p>"}
+
+
+def test_topics_need_two_articles_and_promotion_retags_earlier_ones(tmp_path):
+    catalog = ArticleCatalog(tmp_path / "articles.db")
+    for filename, body in BODIES.items():
+        catalog.upsert(_record(filename, body))
+
+    tagger = TopicTagger(catalog, tmp_path / "topic_index.json")
+    assert tagger.update() == sorted(BODIES)
+    # Chaque terme répété n'est retenu que par un article : aucun thème (pas de page à un seul article)
+    assert all(catalog.metadata(filename)["tags"] == [] for filename in BODIES)
+
+    # Seul le nouvel article est analysé ; les articles qui retiennent les termes devenus thèmes sont réétiquetés
+    catalog.upsert(_record("2025-01-04-d.html", "L'escalade et la fromagerie : l'escalade, la fromagerie."))
+    assert tagger.update() == ["2025-01-02-b.html", "2025-01-03-c.html", "2025-01-04-d.html"]
+    assert tagger.state["doc_count"] == 4
+    tags = catalog.metadata("2025-01-02-b.html")["tags"]
+    assert tags == [{"slug": "escalade", "label": "Escalade"}]
+    assert catalog.metadata("2025-01-03-c.html")["tags"] == [{"slug": "fromagerie", "label": "Fromagerie"}]
+    catalog.upsert(_record("2025-01-02-b.html", BODIES["2025-01-02-b.html"]))
+    assert catalog.metadata("2025-01-02-b.html")["tags"] == tags
+    assert tagger.update() == []
+
+    fragments = SiteFragments(TEMPLATES_DIR, tmp_path / "site_fragments.json", tmp_path / "assets")
+    builder = TopicPageBuilder(tmp_path / "topics", templates_dir=TEMPLATES_DIR, fragments=fragments,
+                               assets_dir=tmp_path / "assets")
+    tagger.build_pages(builder)
+    page = (tmp_path / "topics" / "escalade.html").read_text(encoding="utf-8")
+    assert "../articles/2025-01-02-b.html" in page and "https://blog.goseminary.com/topics/escalade.html" in page
+    assert not (tmp_path / "topics" / "randonnee.html").exists()
+    assert tagger.build_pages(builder) == []
+
+    # Un thème qui retombe à un seul article disparaît aussi de l'article restant
+    catalog.delete("2025-01-04-d.html")
+    assert tagger.update() == ["2025-01-02-b.html", "2025-01-03-c.html"]
+    assert catalog.metadata("2025-01-03-c.html")["tags"] == []
+
+
+def test_nouns_survive_and_filler_words_are_not_topics(tmp_path):
+    nouns = ["hébergement", "environnement", "événement", "hôtel", "atelier", "hiver", "plaisir", "réunions",
+             "régions", "formations", "restaurant", "jeux", "lieux", "randonnée"]
+    assert all(is_topic_word(word) for word in nouns)
+    assert not any(is_topic_word(word) for word in ["encore", "enfin", "jusqu", "loin", "prochain", "meilleures",
+                                                    "facilement", "proposaient"])
+
+    # « ajoute » est répété dans deux articles, mais jamais après un déterminant : ce n'est pas un nom
+    bodies = [
+        "Enfin, l'hébergement en hôtel de montagne ajoute encore le plaisir du séminaire. L'hébergement ajoute "
+        "un atelier cuisine : l'atelier se tient loin de la ville, jusqu'au soir.",
+        "Un hébergement insolite ajoute un atelier bois. L'hébergement ajoute une réunion en plein air, "
+        "encore un atelier, enfin une randonnée.",
+        "La randonnée d'hiver et la randonnée nocturne : enfin un séminaire sportif, encore loin des bureaux.",
+    ]
+    catalog = ArticleCatalog(tmp_path / "articles.db")
+    for position, body in enumerate(bodies):
+        catalog.upsert(_record(f"2025-02-0{position + 1}-s.html", body))
+    TopicTagger(catalog, tmp_path / "topic_index.json").update()
+
+    for filename in ("2025-02-01-s.html", "2025-02-02-s.html"):
+        labels = [tag["label"] for tag in catalog.metadata(filename)["tags"]]
+        assert sorted(labels) == ["Atelier", "Hébergement"]
+    assert catalog.metadata("2025-02-03-s.html")["tags"] == []
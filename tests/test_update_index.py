@@ -0,0 +1,77 @@
+from scripts import update_index
+from scripts.update_index import load_index_manifest, scan_articles
+
+
+def test_scan_articles_reparses_only_changed_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(update_index.chardet, "detect", lambda data: (_ for _ in ()).throw(AssertionError("chardet")))
+    articles = tmp_path / "articles"
+    articles.mkdir()
+    page = articles / "2025-01-02-seminaire.html"
+    page.write_text('<meta name="description" content="Desc"><h1>Séminaire</h1>', encoding="utf-8")
+    (articles / "brouillon.html").write_text("<h1>Ignoré</h1>", encoding="utf-8")
+
+    manifest = load_index_manifest(tmp_path / "index_manifest.json")
+    assert scan_articles(articles, manifest) == 1
+    assert manifest["articles"][page.name]["title"] == "Séminaire"
+    assert scan_articles(articles, manifest) == 0
+
+    page.write_text('<meta name="description" content="Desc"><h1>Nouveau titre</h1>', encoding="utf-8")
+    assert scan_articles(articles, manifest) == 1
+    assert manifest["articles"][page.name]["title"] == "Nouveau titre"
+
+    page.unlink()
+    scan_articles(articles, manifest)
+    assert manifest["articles"] == {}
+
+
+def test_decode_html_uses_chardet_only_for_non_utf8():
+    assert update_index.decode_html("é".encode("utf-8")) == ("é", "utf-8")
+    text, encoding = update_index.decode_html("Séminaire à la montagne".encode("cp1252"))
+    assert encoding != "utf-8" and "montagne" in text
+
+
+def test_manifest_keeps_only_content_hashes(tmp_path):
+    import json
+    import os
+
+    from scripts.stat_cache import StatCache
+
+    articles = tmp_path / "articles"
+    articles.mkdir()
+    page = articles / "2025-01-02-seminaire.html"
+    page.write_text("<h1>Séminaire</h1>", encoding="utf-8")
+    manifest = load_index_manifest(tmp_path / "index_manifest.json")
+    stat_cache = StatCache(tmp_path / "stat_cache.json")
+    scan_articles(articles, manifest, stat_cache=stat_cache)
+    stat_cache.save()
+    before = json.dumps(manifest, sort_keys=True)
+    assert "mtime" not in before
+
+    # Checkout : nouveaux mtime, même contenu → manifeste inchangé, stat mis à jour localement
+    os.utime(page, ns=(1, 1))
+    assert scan_articles(articles, manifest, stat_cache=StatCache(tmp_path / "stat_cache.json")) == 0
+    assert json.dumps(manifest, sort_keys=True) == before
+
+
+def test_unmanaged_titles_are_plain_text_and_archived_once_escaped(tmp_path):
+    from pathlib import Path
+
+    from scripts.archive_pages import ArchiveBuilder
+    from scripts.site_fragments import SiteFragments
+
+    articles = tmp_path / "articles"
+    articles.mkdir()
+    page = articles / "2025-01-02-rd.html"
+    page.write_text('<meta name="description" content="Budget &amp; <b>agenda</b>"><h1>R&amp;D &lt;Vosges&gt;</h1>',
+                    encoding="utf-8")
+    manifest = load_index_manifest(tmp_path / "index_manifest.json")
+    scan_articles(articles, manifest)
+    entry = manifest["articles"][page.name]
+    assert (entry["title"], entry["description"]) == ("R&D <Vosges>", "Budget & agenda")
+
+    templates = Path(__file__).resolve().parent.parent / "templates"
+    fragments = SiteFragments(templates, tmp_path / "site_fragments.json", tmp_path / "assets")
+    builder = ArchiveBuilder(tmp_path / "archive", templates, fragments, assets_dir=tmp_path / "assets")
+    builder.build([dict(entry, filename=page.name)], {})
+    archive = (tmp_path / "archive" / "2025-01.html").read_text(encoding="utf-8")
+    assert "R&amp;D &lt;Vosges&gt;" in archive and "&amp;amp;" not in archive